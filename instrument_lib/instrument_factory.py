@@ -33,7 +33,7 @@ def make_scpi_instrument(connection_string: str) -> SCPIInstrument:
     temp_instrument.close()
 
     # Find the driver class that supports this model by checking all subclasses of SCPIInstrument
-    driver_class: Type[SCPIInstrument]
+    driver_class: Type[SCPIInstrument] | None = None
     for cls in SCPIInstrument.__subclasses__():
         if hasattr(cls, "ACCEPTED_MODELS") and instrument_model in cls.ACCEPTED_MODELS:
             driver_class = cls
@@ -1,10 +1,26 @@
 """Instrument class."""
 
 from abc import ABC, abstractmethod
-from typing import cast, Optional, Type, Union, Protocol, runtime_checkable
-from time import sleep
+import asyncio
+from contextlib import contextmanager
+import threading
+import weakref
+from typing import (
+    Any,
+    Callable,
+    cast,
+    ClassVar,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    Protocol,
+    runtime_checkable,
+)
+from time import monotonic, sleep
 
-from pyvisa import ResourceManager
+from pyvisa import constants, ResourceManager
 import pyvisa.errors
 from pyvisa.resources import (
     GPIBInstrument,
@@ -22,11 +38,76 @@ from instrument_lib.utils import (
     InstrumentIdentificationInfo,
 )
 
+# VISA resource strings for each LAN transport, None being the default VXI-11 connection.
+LAN_TRANSPORTS: dict[str | None, str] = {
+    None: "TCPIP::%s::inst0::INSTR",
+    "hislip": "TCPIP0::%s::hislip0::INSTR",
+    "socket": "TCPIP0::%s::5025::SOCKET",
+}
+
+# asyncio locks serializing the async I/O of each GPIB bus, per event loop. Entries go away
+# with their loop, so a new loop never gets a lock bound to an old one.
+_GPIB_BUS_LOCKS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Lock]
+] = weakref.WeakKeyDictionary()
+
+_R = TypeVar("_R")
+
+# IEEE 488.2 status byte bit set while the error/event queue is not empty.
+STB_ERROR_QUEUE: int = 0b100
+
+# How long a status query reply served by _query_cached stays valid, in seconds.
+STATUS_CACHE_TTL: float = 0.05
+
+# *IDN? replies keyed by VISA resource name, so repeated identify() calls on an open connection
+# do not repeat the query. An entry only lives as long as its connection, as another unit may
+# be put at the same address.
+_IDN_CACHE: dict[str, str] = {}
+
+# Resource managers shared by every instrument, keyed by pyvisa backend ("" for the default).
+_RESOURCE_MANAGERS: dict[str, ResourceManager] = {}
+_RESOURCE_MANAGERS_LOCK = threading.Lock()
+
+
+def _setting_key(command: str) -> tuple[str, str] | None:
+    """Returns what a setting command sets, used by batch() to coalesce writes.
+
+    :param command: SCPI command, e.g. "VOLT 1.5, (@1)".
+    :return: Upper-cased header and channel list, e.g. ("VOLT", "(@1)"). None for queries,
+             common (*) commands, compound commands and commands without a parameter
+             (events such as INIT), which are never coalesced.
+    """
+    parts: list[str] = command.split(None, 1)
+    if len(parts) < 2 or command.startswith("*") or "?" in command or ";" in command:
+        return None
+    channels_start: int = command.find("(@")
+    return parts[0].upper(), command[channels_start:] if channels_start >= 0 else ""
+
+
+def get_resource_manager(backend: str = "") -> ResourceManager:
+    """Returns the shared pyvisa ResourceManager of a backend, opening it on first use.
+
+    Sharing one manager avoids opening a new VISA session (and, through LAN/GPIB gateways,
+    a new gateway client) for every instrument that is connected.
+
+    :param backend: pyvisa backend, e.g. "@py" or "@sim". Empty for the default backend.
+    :return: ResourceManager of the backend.
+    """
+    with _RESOURCE_MANAGERS_LOCK:
+        resource_manager: ResourceManager | None = _RESOURCE_MANAGERS.get(backend)
+        if resource_manager is None:
+            resource_manager = ResourceManager(backend)
+            _RESOURCE_MANAGERS[backend] = resource_manager
+        return resource_manager
+
 
 @runtime_checkable
 class Instrument(Protocol):
     """Base class for higher level instrument classes to use."""
 
+    # Empty so that drivers declaring __slots__ actually drop their per-instance __dict__
+    __slots__ = ()
+
     identification: InstrumentIdentificationInfo
 
     def connect(self) -> None:
@@ -45,6 +126,29 @@ class Instrument(Protocol):
 class SCPIInstrument(Instrument):
     """Wrapper for higher level instrument classes to connect to."""
 
+    __slots__ = (
+        "gpib",
+        "ip_address",
+        "usb",
+        "wireless",
+        "simulate",
+        "serial_instrument_port",
+        "serial_instrument_baudrate",
+        "transport",
+        "instrument",
+        "instrument_type",
+        "connected",
+        "identification",
+        "_status_cache",
+        "_last_writes",
+        "_batch_buf",
+        "_batch_coalesce",
+        "_async_locks",
+    )
+
+    # Drivers for instruments that cannot parse ';' compound commands set this to False
+    supports_batching: ClassVar[bool] = True
+
     def __init__(
         self,
         gpib: GPIBNumber | None = None,
@@ -54,6 +158,7 @@ class SCPIInstrument(Instrument):
         simulate: bool = False,
         serial_instrument_port: str | int | None = None,
         serial_instrument_baudrate: int | None = None,
+        transport: str | None = None,
     ):
         """Initializes instrument.
 
@@ -63,6 +168,8 @@ class SCPIInstrument(Instrument):
         :param simulate: Flag to simulate in instrument.
         :param serial_instrument_port: If connecting through serial port. string on linux, int on windows.
         :param serial_instrument_baudrate: Desired baudrate if connecting through serial instrument port.
+        :param transport: LAN transport used with ip_address, "hislip" or "socket".
+                          Defaults to VXI-11 when None.
 
         :raises ConnectionError: Connection to instrument hardware failed.
         :raises ValueError: Invalid arguments suppplied.
@@ -75,7 +182,22 @@ class SCPIInstrument(Instrument):
         self.simulate = simulate
         self.serial_instrument_port = serial_instrument_port
         self.serial_instrument_baudrate = serial_instrument_baudrate
+        if transport not in LAN_TRANSPORTS:
+            raise ValueError(f"Unsupported transport: {transport}")
+        self.transport = transport
         self.instrument: GPIBInstrument | RsInstrument | SerialInstrument = None
+        # Replies of _query_cached, cleared by every write since it may change the state
+        self._status_cache: dict[str, tuple[str, float]] = {}
+        # Values last written by _write_setting, cleared by every other write
+        self._last_writes: dict[str, object] = {}
+        # Commands held back by batch(), None when writes go straight to the instrument
+        self._batch_buf: list[str] | None = None
+        # Whether the current batch() drops buffered settings superseded by a later write
+        self._batch_coalesce: bool = False
+        # Per event loop locks serializing async I/O on this instrument when not on a GPIB bus
+        self._async_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+            weakref.WeakKeyDictionary()
+        )
 
     def connect(self) -> None:  # noqa: C901
         """Connect instrument class to physical instrument."""
@@ -107,23 +229,30 @@ class SCPIInstrument(Instrument):
             raise ValueError("No valid GPIB Number or IP address supplied.")
 
         self.connected = True
+        self.clear_identification_cache()
         self.identify()  # type: ignore
 
     def _connect_rs_instrument(self) -> None:
-        open_resource_command = f"TCPIP::{self.ip_address}::INSTR"
+        open_resource_commands: list[str] = [LAN_TRANSPORTS[self.transport] % self.ip_address]
+        if self.transport is not None:
+            # Fall back to VXI-11 when the instrument has its HiSLIP server or raw SCPI port disabled
+            open_resource_commands.append(LAN_TRANSPORTS[None] % self.ip_address)
         optional_simulate_command: Optional[str] = "Simulate=True" if self.simulate else None
-        try:
-            resource = RsInstrument(
-                open_resource_command,
-                True,
-                False,
-                options=optional_simulate_command,
-            )
-        except ResourceError as e:
-            raise ConnectError from e
-        else:
-            self.instrument = resource
-            self.instrument_type: Type = RsInstrument
+        for open_resource_command in open_resource_commands:
+            try:
+                resource = RsInstrument(
+                    open_resource_command,
+                    True,
+                    False,
+                    options=optional_simulate_command,
+                )
+            except ResourceError as e:
+                error: ResourceError = e
+            else:
+                self.instrument = resource
+                self.instrument_type: Type = RsInstrument
+                return
+        raise ConnectError from error
 
     def _connect_gpib(self) -> None:
         open_resource_command = (
@@ -132,7 +261,7 @@ class SCPIInstrument(Instrument):
         # pyvsisa_backend = "@sim" if self.simulate else "@py"
         # Currently no py-visa-py backend. Using gpib with pyvisa-py backend requires additional packages.
         # TODO Add support for py-visa-py backend.
-        resource_manager = ResourceManager()
+        resource_manager = get_resource_manager()
 
         try:
             resource = cast(
@@ -154,7 +283,7 @@ class SCPIInstrument(Instrument):
         open_resource_command = f"USB0::{self.usb[0]}::{self.usb[1]}::{self.usb[2]}::INSTR"
         # No pyvisa-py backend. Using USB w/o pyvisa-py backend requires that a VISA.dll is installed.
         # TODO: Add support for installing pyusb and libusb so that pyvisa-py works.
-        resource_manager = ResourceManager()
+        resource_manager = get_resource_manager()
 
         try:
             resource = cast(USBInstrument, resource_manager.open_resource(open_resource_command))
@@ -168,9 +297,9 @@ class SCPIInstrument(Instrument):
             self.instrument_type = USBInstrument
 
     def _connect_ip(self) -> None:
-        open_resource_command = f"TCPIP::{self.ip_address}::inst0::INSTR"
+        open_resource_command = LAN_TRANSPORTS[self.transport] % self.ip_address
         pyvsisa_backend = "@sim" if self.simulate else "@py"
-        resource_manager = ResourceManager(pyvsisa_backend)
+        resource_manager = get_resource_manager(pyvsisa_backend)
 
         try:
             resource = cast(
@@ -184,13 +313,24 @@ class SCPIInstrument(Instrument):
             raise ConnectError from e
         else:
             self.instrument = resource
-            self.instrument_type = TCPIPInstrument
+            if self.transport == "socket":
+                # Raw sockets have no message framing, so terminations must be set explicitly
+                self.instrument.read_termination = "\n"
+                self.instrument.write_termination = "\n"
+                if not self.simulate:
+                    # Send short commands right away instead of waiting on Nagle's algorithm
+                    self.instrument.set_visa_attribute(
+                        constants.ResourceAttribute.tcpip_nodelay, constants.VI_TRUE
+                    )
+                self.instrument_type = TCPIPSocket
+            else:
+                self.instrument_type = TCPIPInstrument
 
     def _connect_asrl_instrument(self) -> None:
         """Handles connecting to standard serial instruments."""
         open_resource_command: str = f"ASRL{self.serial_instrument_port}::INSTR"
         pyvisa_backend: str = "@sim" if self.simulate else "@py"
-        resource_manager: ResourceManager = ResourceManager(pyvisa_backend)
+        resource_manager: ResourceManager = get_resource_manager(pyvisa_backend)
 
         try:
             resource: SerialInstrument = cast(
@@ -217,8 +357,17 @@ class SCPIInstrument(Instrument):
         return self._query("*IDN?")
 
     def identify(self) -> InstrumentIdentificationInfo:
-        """Instrument identification."""
-        instrument_id: str = self.get_name()
+        """Instrument identification.
+
+        The *IDN? reply is cached per resource name until the connection is closed or
+        reopened. clear_identification_cache forgets it earlier.
+        """
+        resource_name: str | None = getattr(self.instrument, "resource_name", None)
+        instrument_id: str | None = _IDN_CACHE.get(resource_name) if resource_name else None
+        if instrument_id is None:
+            instrument_id = self.get_name()
+            if resource_name:
+                _IDN_CACHE[resource_name] = instrument_id
         instrument_id_split = instrument_id.split(",")
         self.identification = InstrumentIdentificationInfo(
             manufacturer=instrument_id_split[0],
@@ -228,6 +377,10 @@ class SCPIInstrument(Instrument):
         )
         return self.identification
 
+    def clear_identification_cache(self) -> None:
+        """Forget the cached *IDN? reply of this instrument's resource."""
+        _IDN_CACHE.pop(getattr(self.instrument, "resource_name", None), None)
+
     def reset(self) -> None:
         """Reset instrument."""
         self._write("*RST")
@@ -245,9 +398,97 @@ class SCPIInstrument(Instrument):
 
         self.instrument.instrument_status_checking = status_check_state
 
+    @contextmanager
+    def batch(self, coalesce: bool = False) -> Iterator[None]:
+        """Combines the writes made inside the with block into a single write.
+
+        Queries made inside the block first send the writes buffered so far, so they still
+        observe every earlier setting. Nested batches join the outermost one. On drivers
+        with supports_batching set to False every write is sent on its own as usual.
+
+        :param coalesce: If True, a buffered setting command is dropped when the very next
+                         write sets the same setting for the same channels, so e.g. a setpoint
+                         sweep only sends its last value. Only consecutive writes are merged,
+                         so a selector written in between (an instrument, tab or channel
+                         selection) keeps every setting it applies to.
+        """
+        if self._batch_buf is not None or not self.supports_batching:
+            yield
+            return
+
+        self._batch_buf = []
+        self._batch_coalesce = coalesce
+        try:
+            yield
+        finally:
+            self._flush_batch()
+            self._batch_buf = None
+            self._batch_coalesce = False
+
+    def _buffer_command(self, command: str) -> None:
+        """Appends command to the batch() buffer, coalescing it if the batch asks for it.
+
+        When coalescing, command replaces the last buffered command if both set the same
+        setting for the same channels.
+
+        :param command: Command to buffer.
+        """
+        buf = cast(list, self._batch_buf)
+        if self._batch_coalesce and buf:
+            key: tuple[str, str] | None = _setting_key(command)
+            if key is not None and _setting_key(buf[-1]) == key:
+                buf[-1] = command
+                return
+        buf.append(command)
+
+    def _flush_batch(self) -> None:
+        """Sends the commands buffered by batch() as one ';' separated write.
+
+        The caches were already updated by _write when each command was buffered, so they are
+        left alone here and settings written through _write_setting stay remembered.
+        """
+        buf: list[str] | None = self._batch_buf
+        if not buf:
+            return
+
+        self._batch_buf = None
+        # Subsystem commands are re-rooted with ':', common (*) commands must not be
+        command: str = buf[0]
+        for next_command in buf[1:]:
+            if next_command.startswith("*"):
+                command += ";" + next_command
+            else:
+                command += ";:" + next_command.lstrip(":")
+        try:
+            self._send(command)
+        except BaseException:
+            # The buffered settings may not have been applied
+            self._last_writes.clear()
+            raise
+        finally:
+            self._batch_buf = []
+
     def _write(self, command: str) -> None:
         """Writes command to instrument.
 
+        Inside a batch() block the command is buffered instead of sent.
+
+        :param command: Command to send to instrument.
+        :raises InstrumentError: When there is no connected device.
+        :raises InstrumentError: When writing to GPIB instrument fails.
+        :raises InstrumentError: When writing to RsInstrument fails.
+        """
+        self._status_cache.clear()
+        self._last_writes.clear()
+        if self._batch_buf is not None:
+            self._buffer_command(command)
+            return
+
+        self._send(command)
+
+    def _send(self, command: str) -> None:
+        """Sends command to instrument, bypassing batch() and the caches _write updates.
+
         :param command: Command to send to instrument.
         :raises InstrumentError: When there is no connected device.
         :raises InstrumentError: When writing to GPIB instrument fails.
@@ -277,6 +518,42 @@ class SCPIInstrument(Instrument):
                 else:
                     should_retry = False
 
+    def _write_raw(self, command: bytes) -> None:
+        """Writes an already encoded command to instrument.
+
+        The resource's write termination is appended, as pyvisa does for str commands in _write.
+
+        :param command: Encoded command to send to instrument, without termination.
+        :raises InstrumentError: When there is no connected device.
+        :raises ValueError: When the instrument type does not support raw writes.
+        """
+        self._status_cache.clear()
+        self._last_writes.clear()
+        if self._batch_buf is not None:
+            self._buffer_command(command.decode("ascii"))
+            return
+
+        if not self.instrument:
+            raise InstrumentError("No connected device.")
+        elif isinstance(self.instrument, RsInstrument):
+            raise ValueError("Raw writes are not supported on this instrument.")
+
+        message: bytes = command + self.instrument.write_termination.encode("ascii")
+        should_retry = True
+        retry_count = 10
+        num_retries = 0
+        while should_retry and num_retries < retry_count:
+            try:
+                bytes_written: int = self.instrument.write_raw(message)
+                if bytes_written == 0:
+                    raise InstrumentError("Zero bytes were written to device.")
+            except (ConnectionResetError, pyvisa.errors.VisaIOError):
+                self.instrument.close()
+                self.connect()
+                num_retries += 1
+            else:
+                should_retry = False
+
     def _query(self, command: str) -> str:
         """Queries command to instrument and returns the response.
 
@@ -286,6 +563,7 @@ class SCPIInstrument(Instrument):
         :raises InstrumentError: When querying to RsInstrument fails.
         :return: Output of query.
         """
+        self._flush_batch()
         if not self.instrument:
             raise InstrumentError("No connected device.")
 
@@ -312,6 +590,170 @@ class SCPIInstrument(Instrument):
 
         return query_result
 
+    def _read_status_byte(self) -> int:
+        """Reads the IEEE 488.2 status byte.
+
+        GPIB instruments are serial polled, which needs no SCPI command at all. Other
+        instruments are sent *STB?.
+
+        :return: Status byte.
+        """
+        self._flush_batch()
+        if isinstance(self.instrument, GPIBInstrument):
+            return self.instrument.read_stb()
+        return int(self._query("*STB?"))
+
+    def _query_cached(self, command: str, ttl: float = STATUS_CACHE_TTL) -> str:
+        """Queries command, reusing a reply younger than ttl seconds.
+
+        Meant for status predicates polled in tight loops. Any write through _write or
+        _write_raw drops all cached replies, so state changes made from this process are
+        seen immediately.
+
+        :param command: Command to send to instrument, also used as cache key.
+        :param ttl: Maximum age in seconds of a reused reply.
+        :return: Output of query.
+        """
+        entry: tuple[str, float] | None = self._status_cache.get(command)
+        if entry is not None and monotonic() - entry[1] < ttl:
+            return entry[0]
+
+        query_result: str = self._query(command)
+        self._status_cache[command] = (query_result, monotonic())
+        return query_result
+
+    def _write_setting(self, key: str, value: object, command: str) -> None:
+        """Writes command unless value is what was last written for key.
+
+        Meant for plain setters such as frequency or level, so repeating a setting is free.
+        Any write not made through this method may change the setting too (a reset, a
+        setup sequence, a channel switch), so it drops every remembered value; queries
+        keep them.
+
+        :param key: Name of the setting.
+        :param value: Value being set, compared with the last written one.
+        :param command: Command setting value.
+        """
+        last_writes: dict[str, object] = self._last_writes
+        if key in last_writes and last_writes[key] == value:
+            return
+
+        last_writes = dict(last_writes)
+        self._write(command)
+        last_writes[key] = value
+        self._last_writes = last_writes
+
+    def _query_compound(self, command: str) -> list[str]:
+        """Sends a ';' separated compound query and splits the response per query.
+
+        :param command: Compound query, e.g. "VOLT?;:CURR?".
+        :return: Response of each query, in order.
+        """
+        return self._query(command).split(";")
+
+    def _query_float(self, command: str) -> float:
+        """Queries command and parses the response as a float.
+
+        :param command: Command to send to instrument.
+        :return: Output of query as float.
+        """
+        return float(self._query(command))
+
+    def _query_bool(self, command: str, cached: bool = False) -> bool:
+        """Queries command and parses a 0/1 response as a bool.
+
+        :param command: Command to send to instrument.
+        :param cached: If True, go through _query_cached with the default status TTL.
+        :return: Output of query as bool.
+        """
+        if cached:
+            return bool(int(self._query_cached(command)))
+        return bool(int(self._query(command)))
+
+    def _query_bytes(self, command: str) -> bytes:
+        """Queries command to instrument and returns the raw response without decoding it.
+
+        Intended for hot polling loops where the response only needs to be compared against
+        a known value, so the str decode of _query can be skipped.
+
+        :param command: Command to send to instrument.
+        :raises InstrumentError: When there is no connected device.
+        :raises ValueError: When the instrument type does not support raw reads.
+        :return: Output of query with the trailing termination characters stripped.
+        """
+        self._flush_batch()
+        if not self.instrument:
+            raise InstrumentError("No connected device.")
+        elif isinstance(self.instrument, RsInstrument):
+            raise ValueError("Raw byte queries are not supported on this instrument.")
+
+        should_retry = True
+        retry_count = 10
+        num_retries = 0
+        while should_retry and num_retries < retry_count:
+            try:
+                self.instrument.write(command)
+                query_result: bytes = self.instrument.read_raw()
+                if not query_result:
+                    raise InstrumentError(f"Query failed: {command}")
+            except (ConnectionResetError, pyvisa.errors.VisaIOError):
+                self.instrument.close()
+                self.connect()
+                num_retries += 1
+            else:
+                should_retry = False
+
+        return query_result.rstrip(b"\r\n")
+
+    def _async_lock(self) -> asyncio.Lock:
+        """Returns the lock serializing async I/O on this instrument's bus.
+
+        Every instrument on a GPIB bus shares one lock, as a GPIB bus can only carry one
+        transaction at a time. Other instruments each get their own lock.
+
+        :return: Lock of the running event loop for this instrument.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self.gpib:
+            bus_locks: dict[str, asyncio.Lock] = _GPIB_BUS_LOCKS.setdefault(loop, {})
+            return bus_locks.setdefault("gpib1" if self.wireless else "GPIB0", asyncio.Lock())
+        return self._async_locks.setdefault(loop, asyncio.Lock())
+
+    async def _query_async(self, command: str) -> str:
+        """Runs _query in a worker thread so several instruments can be queried concurrently.
+
+        Queries to the same instrument, or to any instrument on the same GPIB bus, are
+        serialized, as a GPIB bus can only carry one transaction at a time.
+
+        :param command: Command to send to instrument.
+        :return: Output of query.
+        """
+        async with self._async_lock():
+            return await asyncio.to_thread(self._query, command)
+
+    async def _write_async(self, command: str) -> None:
+        """Runs _write in a worker thread, serialized like _query_async.
+
+        :param command: Command to send to instrument.
+        """
+        async with self._async_lock():
+            await asyncio.to_thread(self._write, command)
+
+    async def run_async(self, method: Callable[..., _R], *args: Any, **kwargs: Any) -> _R:
+        """Runs a blocking driver method in a worker thread, serialized like _query_async.
+
+        Lets independent setups of several instruments overlap, e.g.
+        ``await asyncio.gather(smw.run_async(smw.load_waveform, path),
+        fsw.run_async(fsw.evm_setup_5gnr, freq, path))``.
+
+        :param method: Bound method of this instrument.
+        :param args: Positional arguments of method.
+        :param kwargs: Keyword arguments of method.
+        :return: Return value of method.
+        """
+        async with self._async_lock():
+            return await asyncio.to_thread(method, *args, **kwargs)
+
     def _read(self) -> str:
         """Reads output from instrument and returns it.
 
@@ -321,6 +763,7 @@ class SCPIInstrument(Instrument):
         :return: Output of read.
 
         """
+        self._flush_batch()
         if not self.instrument:
             raise InstrumentError("No connected device.")
         elif not (
@@ -352,6 +795,7 @@ class SCPIInstrument(Instrument):
         :raises InstrumentError: If there is no connected device.
         """
         if self.instrument:
+            self.clear_identification_cache()
             self.instrument.close()
             self.instrument = None
             self.connected = False
@@ -9,9 +9,11 @@ from instrument_lib.instruments.instrument import SCPIInstrument
 class KS_Multimeter(SCPIInstrument):
     """Class for the Keysight 34401A Multimeter."""
 
-    ACCEPTED_MODELS = [
-        "34401A",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "34401A",
+        }
+    )
 
     def __init__(
         self,
@@ -7,9 +7,11 @@ from instrument_lib.instruments.instrument import SCPIInstrument
 class N3300A(SCPIInstrument):
     """Class for the Keysight N3300A Electronic Load Tester."""
 
-    ACCEPTED_MODELS = [
-        "N3300A",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "N3300A",
+        }
+    )
 
     def __init__(
         self,
@@ -16,9 +16,11 @@ class RS_CMP200(SCPIInstrument):
     and ARB based generator functionality.
     """
 
-    ACCEPTED_MODELS = [
-        "CMP200",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "CMP200",
+        }
+    )
 
     def __init__(
         self,
@@ -9,9 +9,11 @@ from instrument_lib.instruments.instrument import SCPIInstrument
 class SRS_SR630(SCPIInstrument):  # noqa: N801
     """SRS_SR630 class."""
 
-    ACCEPTED_MODELS = [
-        "SR630",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "SR630",
+        }
+    )
 
     def __init__(
         self,
@@ -10,9 +10,11 @@ from instrument_lib.instruments.instrument import SCPIInstrument
 class KS_PNA(SCPIInstrument):
     """Class for the Keysight self."""
 
-    ACCEPTED_MODELS = [
-        "N5247B",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "N5247B",
+        }
+    )
 
     def __init__(
         self,
@@ -604,9 +606,9 @@ class KS_PNA(SCPIInstrument):
             self._write("SYST:ERR?; *OPC?")
             raw_error = self._read()
 
-            error_parts = raw_error.split(",")
-            error_code = int(error_parts[0])
-            error_message = error_parts[1].rstrip("\n")
+            code_str, _, message = raw_error.partition(",")
+            error_code = int(code_str)
+            error_message = message.rstrip()
             print(str(error_code))  # noqa: T201
             if error_code != 0:
                 print(  # noqa: T201
@@ -16,12 +16,14 @@ class RS_ZNx(SCPIInstrument):  # noqa: N801
     All operations within this class can raise InstrumentError (or a subclass).
     """
 
-    ACCEPTED_MODELS = [
-        "ZNA",
-        "ZNA50-4Port",
-        "ZNA67-4Port",
-        "ZNB8-4Port",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "ZNA",
+            "ZNA50-4Port",
+            "ZNA67-4Port",
+            "ZNB8-4Port",
+        }
+    )
 
     def __init__(
         self,
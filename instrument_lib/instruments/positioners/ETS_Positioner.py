@@ -1,8 +1,13 @@
 """Driver for ETS 2035 Maps Positioner."""
 
+import asyncio
+import functools
 from logging import Logger
+import math
+from math import acos, asin, atan2, copysign, cos, exp, hypot, inf, log10, log1p, sin, tan
+import socket
 import time
-from typing import cast, Optional, Tuple
+from typing import Callable, cast, Optional, Tuple
 
 import numpy as np
 import pyvisa
@@ -11,15 +16,86 @@ from pyvisa.resources import TCPIPSocket
 from instrument_lib.instruments.instrument import SCPIInstrument
 from instrument_lib.utils import InstrumentIdentificationInfo, PositionerError
 
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE: bool = True
+except ImportError:  # numba is optional, the kernels below then run as plain Python.
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):  # noqa
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+_DEG2RAD: float = math.pi / 180.0
+_RAD2DEG: float = 180.0 / math.pi
+_PI: float = math.pi
+_HALF_PI: float = math.pi / 2
+_LN10_OVER_10: float = math.log(10) / 10
+_LN10_OVER_20: float = math.log(10) / 20
+
+POLL_DELAY_MIN: float = 0.005
+POLL_DELAY_MAX: float = 0.2
+POSITION_TOLERANCE_DEG: float = 0.01
+RETRY_DELAY_MIN: float = 0.01
+RETRY_DELAY_MAX: float = 1.0
+# A PositionerError means a move did not finish before its deadline, which re-sending the
+# command would only repeat, so it is not retried.
+RETRY_ERRORS = (pyvisa.VisaIOError, OSError)
+
+# fastmath without the no-NaN/no-inf assumptions, the dB kernels return -inf for a zero field
+_FASTMATH_FLAGS = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+@njit(cache=True, fastmath=True)
+def _azel_to_thetaphi_nb(azimuth: float, elevation: float) -> Tuple[float, float]:
+    """Scalar azimuth-elevation to theta-phi conversion, in radians.
+
+    Moves along a single axis are common in scans, so those cases skip the trig entirely.
+    """
+    if azimuth == 0.0 and -_PI <= elevation <= _PI:
+        return abs(elevation), (0.0 if elevation == 0.0 else copysign(_HALF_PI, elevation))
+
+    if elevation == 0.0 and -_PI <= azimuth <= _PI:
+        return abs(azimuth), (0.0 if azimuth > 0.0 else copysign(_PI, elevation))
+
+    theta = acos(cos(elevation) * cos(azimuth))
+    phi = atan2(tan(elevation), sin(azimuth))
+
+    return theta, phi
+
+
+@njit(cache=True, fastmath=True)
+def _thetaphi_to_azel_nb(theta: float, phi: float) -> Tuple[float, float]:
+    """Scalar theta-phi to azimuth-elevation conversion, in radians."""
+    sin_theta = sin(theta)
+    elevation = asin(sin(phi) * sin_theta)
+    azimuth = atan2(cos(phi) * sin_theta, cos(theta))
+
+    return azimuth, elevation
+
 
 def retry_on_failure(func):  # noqa
+    """Retries func up to self.retry times on communication errors, with exponential backoff.
+
+    Only meant for the single transaction cmd_* methods, so retries never nest and a move
+    that wraps them is not re-sent as a whole. Any other exception (e.g. ValueError for an
+    invalid angle, or PositionerError for a move timing out) is raised immediately, and the
+    last communication error is re-raised once all retries are exhausted.
+    """
+
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):  # noqa
-        failures = 0
-        while failures <= self.retry:
+        for attempt in range(self.retry + 1):
             try:
                 return func(self, *args, **kwargs)
-            except Exception:
-                failures = failures + 1
+            except RETRY_ERRORS:
+                if attempt >= self.retry:
+                    raise
+                time.sleep(min(RETRY_DELAY_MIN * 2**attempt, RETRY_DELAY_MAX))
 
     return wrapper
 
@@ -27,9 +103,19 @@ def retry_on_failure(func):  # noqa
 class ETS_Positioner(SCPIInstrument):
     """ETS Positioner Driver."""
 
-    ACCEPTED_MODELS = [
-        "Precision MAPS 2305-001",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "Precision MAPS 2305-001",
+        }
+    )
+
+    _MOTOR = {"Theta": "AXIS1", "Phi": "AXIS2"}
+    _SEEK_CMD = {axis: f"{motor}:SK %.4f".encode() for axis, motor in _MOTOR.items()}
+    _SEEK_POSITIVE_CMD = {axis: f"{motor}:SKP %.4f".encode() for axis, motor in _MOTOR.items()}
+    _SEEK_NEGATIVE_CMD = {axis: f"{motor}:SKN %.4f".encode() for axis, motor in _MOTOR.items()}
+    _SET_POS_CMD = {axis: f"{motor}:CP %.4f".encode() for axis, motor in _MOTOR.items()}
+    _DIR_CMD = {axis: f"{motor}:DIR?" for axis, motor in _MOTOR.items()}
+    _POS_CMD = {axis: f"{motor}:CP?" for axis, motor in _MOTOR.items()}
 
     def __init__(
         self,
@@ -62,12 +148,16 @@ class ETS_Positioner(SCPIInstrument):
             theta_min if 0 <= theta_min <= 180 else 0
         )  # TODO: Why do this and not raise ValueError
         self.theta_max: float = (
-            theta_max if 0 <= theta_min <= 180 else 180
+            theta_max if 0 <= theta_max <= 180 else 180
         )  # TODO: Why do this and not raise ValueError
         self.phi_min: float = phi_min
         self.phi_max: float = phi_max
         self.max_travel_time: float = max_travel_time
         self.rsinstrument = False
+        # theta >= |azimuth| and theta >= |elevation| whenever that angle is within +/-90 deg,
+        # so such inputs beyond theta_max can be rejected before any trig is done.
+        self._az_el_limit: float = min(self.theta_max, 90)
+        self._last_target: dict[str, Optional[float]] = {"Theta": None, "Phi": None}
 
         super().__init__(None, None, None, False, False)
 
@@ -78,6 +168,7 @@ class ETS_Positioner(SCPIInstrument):
             self.instrument = cast(
                 TCPIPSocket, resource_manager.open_resource(self.visa_connect_string)
             )
+            self._enable_tcp_nodelay()
             self.instrument.read_termination = "\n"  # type: ignore
             self.instrument.timeout = 5000
             self.connected = True
@@ -92,35 +183,61 @@ class ETS_Positioner(SCPIInstrument):
             )
             self.connected = False
 
+    def _enable_tcp_nodelay(self) -> None:
+        """Disable Nagle's algorithm on the positioner socket.
+
+        Every SCPI command sent to the positioner is a small payload, so Nagle coalescing
+        would otherwise delay each write until the previous one is acknowledged.
+        """
+        try:
+            self.instrument.set_visa_attribute(
+                pyvisa.constants.VI_ATTR_TCPIP_NODELAY, pyvisa.constants.VI_TRUE
+            )
+            return
+        except (AttributeError, NotImplementedError, pyvisa.VisaIOError):
+            pass
+
+        # pyvisa-py fallback: reach into the session and set the option on the raw socket.
+        try:
+            sock: socket.socket = self.instrument.visalib.sessions[
+                self.instrument.session
+            ].interface
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if hasattr(socket, "TCP_QUICKACK"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except (AttributeError, KeyError, OSError):
+            if self.logger is not None:
+                self.logger.warning("Could not enable TCP_NODELAY on ETS Positioner socket.")
+
     def reset(self) -> None:
         """Overrided reset function."""
         super().reset()
+        self._clear_last_target()
         self.move_to_azimuth_elevation(0, 0)
 
     def get_motor_from_axis(self, axis: str) -> str:
         """Determines motor based on axis."""
-        return "AXIS1" if axis == "Theta" else "AXIS2"
+        return self._MOTOR[axis]
 
-    @retry_on_failure
     def move_to_degrees(self, id_: int, angle: float) -> None:
         """Moves position to angle."""
         self.seek_position(id_, angle)
 
-    @retry_on_failure
-    def move_to_azimuth_elevation(self, azimuth_deg: float, elevation_deg: float) -> tuple:
+    def move_to_azimuth_elevation(
+        self, azimuth_deg: float, elevation_deg: float, pipeline: bool = True
+    ) -> tuple:
         """Move the positioner to a specified angle defined in Azimuth-Elevation coordinate system.
 
         :param azimuth_deg: Angle in degrees azimuth to reposition.
         :param elevation_deg: Angle in degrees elevation to reposition.
+        :param pipeline: Send both axis seeks in one compound write and poll them together.
         """
-        theta_rad: float = 0
-        phi_rad: float = 0
-        theta_rad, phi_rad = self.azel_to_thetaphi(
-            azimuth_deg * np.pi / 180, elevation_deg * np.pi / 180
-        )
+        if (self._az_el_limit < abs(azimuth_deg) <= 90) or (
+            self._az_el_limit < abs(elevation_deg) <= 90
+        ):
+            raise ValueError(f"Theta must be between {self.theta_max} and {self.theta_min}")
 
-        theta_deg: float = theta_rad * 180 / np.pi
-        phi_deg: float = phi_rad * 180 / np.pi
+        theta_deg, phi_deg = self.azel_to_thetaphi_deg(azimuth_deg, elevation_deg)
 
         if not (self.theta_min <= theta_deg <= self.theta_max):
             raise ValueError(f"Theta must be between {self.theta_max} and {self.theta_min}")
@@ -128,16 +245,19 @@ class ETS_Positioner(SCPIInstrument):
         if not (self.phi_min <= phi_deg <= self.phi_max):
             raise ValueError(f"Phi must be between {self.phi_max} and {self.phi_min}")
 
-        self.seek_position("Theta", theta_deg)
-        self.seek_position("Phi", phi_deg)
+        if pipeline:
+            self.seek_position_pair(theta_deg, phi_deg)
+        else:
+            self.seek_position("Theta", theta_deg)
+            self.seek_position("Phi", phi_deg)
         return azimuth_deg, elevation_deg
 
-    @retry_on_failure
-    def move_to_theta_phi(self, theta_deg: float, phi_deg: float) -> tuple:
+    def move_to_theta_phi(self, theta_deg: float, phi_deg: float, pipeline: bool = True) -> tuple:
         """Move the positioner to a certain angle defined in Theta-Phi coordinate system.
 
         :param theta_deg: Angle in degrees azimuth to reposition.
         :param phi_deg: Angle in degrees elevation to reposition.
+        :param pipeline: Send both axis seeks in one compound write and poll them together.
         """
         if (theta_deg < self.theta_min) or (theta_deg > self.theta_max):
             raise ValueError(f"Theta must be between {self.theta_max} and {self.theta_min}")
@@ -145,10 +265,32 @@ class ETS_Positioner(SCPIInstrument):
         if (phi_deg < self.phi_min) or (phi_deg > self.phi_max):
             raise ValueError(f"Phi must be between {self.phi_max} and {self.phi_min}")
 
-        self.seek_position("Theta", theta_deg)
-        self.seek_position("Phi", phi_deg)
+        if pipeline:
+            self.seek_position_pair(theta_deg, phi_deg)
+        else:
+            self.seek_position("Theta", theta_deg)
+            self.seek_position("Phi", phi_deg)
         return theta_deg, phi_deg
 
+    async def move_to_azimuth_elevation_async(
+        self, azimuth_deg: float, elevation_deg: float, pipeline: bool = True
+    ) -> tuple:
+        """Awaitable move_to_azimuth_elevation.
+
+        The blocking move runs in a worker thread so that other instruments can be driven
+        from the event loop while the positioner travels, e.g.
+        await asyncio.gather(positioner.move_to_azimuth_elevation_async(az, el), ...).
+        """
+        return await asyncio.to_thread(
+            self.move_to_azimuth_elevation, azimuth_deg, elevation_deg, pipeline
+        )
+
+    async def move_to_theta_phi_async(
+        self, theta_deg: float, phi_deg: float, pipeline: bool = True
+    ) -> tuple:
+        """Awaitable move_to_theta_phi, see move_to_azimuth_elevation_async."""
+        return await asyncio.to_thread(self.move_to_theta_phi, theta_deg, phi_deg, pipeline)
+
     def which_axis(self, axis: str) -> str:
         """Calls get motor from axis."""
         return self.get_motor_from_axis(axis)
@@ -175,16 +317,8 @@ class ETS_Positioner(SCPIInstrument):
 
     def get_current_position_azimuth_elevation(self) -> Tuple[float, float]:
         """Return the current position in Azimuth-Elevation coordinate system."""
-        theta_deg: float = 0
-        phi_deg: float = 0
         theta_deg, phi_deg = self.get_current_position_theta_phi()
-
-        azimuth_rad: float = 0
-        elevation_rad: float = 0
-        azimuth_rad, elevation_rad = self.thetaphi_to_azel(
-            theta_deg * np.pi / 180, phi_deg * np.pi / 180
-        )
-        return azimuth_rad * 180 / np.pi, elevation_rad * 180 / np.pi
+        return self.thetaphi_to_azel_deg(theta_deg, phi_deg)
 
     def get_current_position_theta(self) -> float:
         """Return the current Theta position (ie Elevation positione)."""
@@ -194,7 +328,6 @@ class ETS_Positioner(SCPIInstrument):
         """Return the current Phi position (ie Azimuth positioner)."""
         return self.cmd_get_axis_position("Phi")
 
-    @retry_on_failure
     def get_positioner_id(self) -> str:
         """Queries the ID of the device. Returns string identifying the device.
 
@@ -202,7 +335,6 @@ class ETS_Positioner(SCPIInstrument):
         """
         return self.cmd_get_device_id()
 
-    @retry_on_failure
     def get_positioner_ip(self) -> str:
         """Queries the ID of the device. Returns string identifying the device.
 
@@ -210,23 +342,17 @@ class ETS_Positioner(SCPIInstrument):
         """
         return self.cmd_get_device_ip_address()
 
-    @retry_on_failure
     def move_to_home(self) -> None:
         """Every time the positioner is turned on, a home procedure must be performed.
 
         so the current position is known by the firmware.
         """
-        t0 = time.time()
-        self.cmd_home()
-        done = False
-        while not done:
-            if (time.time() - t0) > self.max_travel_time:
-                raise PositionerError
-        complete: bool = self.cmd_get_operation_complete()
-        if complete:
-            return
-        else:
-            pass
+        self._clear_last_target()
+        deadline_ns: int = self._deadline_ns(self.max_travel_time)
+        self.cmd_home("Theta")
+        self.cmd_home("Phi")
+        get_operation_complete = self._cmd_get_operation_complete_raw
+        self._poll_until(lambda: get_operation_complete() == "1", deadline_ns)
 
     def check_angle_within_limits(self, axis: str, angle: float) -> bool:
         """Checks that the angle is within the limits set.
@@ -240,7 +366,6 @@ class ETS_Positioner(SCPIInstrument):
         else:
             raise ValueError("Invalid axis provided.")
 
-    @retry_on_failure
     def seek_position(self, axis: str, angle: float) -> None:
         """Instructs the device to begin seeking for a specified target position.
 
@@ -252,26 +377,95 @@ class ETS_Positioner(SCPIInstrument):
         until a limit is hit.
         """
         if self.check_angle_within_limits(axis, angle):
-            t0: float = time.time()
-            self.cmd_seek_position(axis, angle)
+            if self._is_at_target(axis, angle):
+                return
 
-            done: bool = False
-            while not done:
-                if (time.time() - t0) > self.max_travel_time:
-                    raise PositionerError
+            self._last_target[axis] = None
+            deadline_ns: int = self._deadline_ns(self.max_travel_time)
+            self.cmd_seek_position(axis, angle)
+            self._wait_for_axis_stop(axis, deadline_ns)
+            self._last_target[axis] = angle
+        else:
+            raise ValueError
 
-                response = self.cmd_get_motion_direction(axis)
-                while (response != "0") and (time.time() - t0) < self.max_travel_time:
-                    response = self.cmd_get_motion_direction(axis)
+    def seek_position_pair(self, theta_deg: float, phi_deg: float) -> None:
+        """Seeks both axes at once and waits until both motors have stopped.
 
-                if response == "0":
-                    return
-                else:
-                    pass
-        else:
+        The two seek commands are sent as one compound SCPI line, and both motion
+        directions are polled with a single compound query per iteration.
+        """
+        if not (
+            self.check_angle_within_limits("Theta", theta_deg)
+            and self.check_angle_within_limits("Phi", phi_deg)
+        ):
             raise ValueError
 
-    @retry_on_failure
+        self._clear_last_target()
+        deadline_ns: int = self._deadline_ns(self.max_travel_time)
+        self.cmd_seek_position_pair(theta_deg, phi_deg)
+        get_motion_direction_pair = self._cmd_get_motion_direction_pair_raw
+        self._poll_until(lambda: get_motion_direction_pair() == ("0", "0"), deadline_ns)
+        self._last_target.update(Theta=theta_deg, Phi=phi_deg)
+
+    def _is_at_target(self, axis: str, angle: float) -> bool:
+        """Whether axis was last sought to angle and is not moving, so seeking again is a no-op.
+
+        Every cmd_* method that can move or re-reference an axis forgets its target first, so
+        a stale target never makes seek_position skip a move.
+        """
+        last_target: Optional[float] = self._last_target[axis]
+        return (
+            last_target is not None
+            and abs(angle - last_target) < POSITION_TOLERANCE_DEG
+            and self._query_bytes(self._DIR_CMD[axis]) == b"0"
+        )
+
+    def _clear_last_target(self) -> None:
+        """Forgets the last sought targets, e.g. after homing or stopping."""
+        self._last_target = {"Theta": None, "Phi": None}
+
+    @staticmethod
+    def _deadline_ns(timeout_s: float) -> int:
+        """Returns the time.monotonic_ns() value timeout_s seconds from now."""
+        return time.monotonic_ns() + int(timeout_s * 1_000_000_000)
+
+    def _wait_for_axis_stop(self, axis: str, deadline_ns: int) -> None:
+        """Polls the motion direction of an axis until it stops.
+
+        :param axis: 'Theta' or 'Phi'.
+        :param deadline_ns: time.monotonic_ns() value by which the axis must have stopped.
+        :raises PositionerError: The axis did not stop before the deadline.
+        """
+        query_bytes = self._query_bytes
+        dir_cmd: str = self._DIR_CMD[axis]
+        self._poll_until(lambda: query_bytes(dir_cmd) == b"0", deadline_ns)
+
+    @staticmethod
+    def _poll_until(is_done: Callable[[], bool], deadline_ns: int) -> None:
+        """Calls is_done until it returns True, sleeping between calls.
+
+        The positioner only answers queries and never reports completion on its own, so
+        completion has to be polled. The delay between polls starts at POLL_DELAY_MIN and
+        doubles up to POLL_DELAY_MAX, so short moves are detected quickly without flooding
+        the positioner on long ones. The last sleep is clamped so is_done is checked once
+        more right at the deadline.
+
+        :param is_done: Callable that queries the positioner and returns whether it is done.
+        :param deadline_ns: time.monotonic_ns() value by which is_done must return True.
+        :raises PositionerError: is_done did not return True before the deadline.
+        """
+        # Bound locally so the loop does not repeat the module/attribute lookups
+        monotonic_ns = time.monotonic_ns
+        sleep = time.sleep
+        delay_max: float = POLL_DELAY_MAX
+        delay: float = POLL_DELAY_MIN
+        while not is_done():
+            remaining_s: float = (deadline_ns - monotonic_ns()) / 1_000_000_000
+            if remaining_s <= 0:
+                raise PositionerError
+            sleep(min(delay, remaining_s))
+            delay = min(delay * 2, delay_max)
+
     def seek_negative_position(self, axis: str, angle: float) -> None:
         """Instructs the device to begin seeking the specified.
 
@@ -285,26 +479,13 @@ class ETS_Positioner(SCPIInstrument):
         The target must be located between the current clockwise and counterclockwise limits.
         """
         if self.check_angle_within_limits(axis, angle):
-            t0: float = time.time()
+            self._last_target[axis] = None
+            deadline_ns: int = self._deadline_ns(self.max_travel_time)
             self.cmd_seek_negative_position(axis, angle)
-
-            done: bool = False
-            while not done:
-                if (time.time() - t0) > self.max_travel_time:
-                    raise PositionerError
-
-                response = self.cmd_get_motion_direction(axis)
-                while (response != "0") and (time.time() - t0) < self.max_travel_time:
-                    response = self.cmd_get_motion_direction(axis)
-
-                if response == "0":
-                    return
-                else:
-                    pass
+            self._wait_for_axis_stop(axis, deadline_ns)
         else:
             raise ValueError
 
-    @retry_on_failure
     def seek_positive_position(self, axis: str, angle: float) -> None:
         """Instructs the device to begin seeking the specified target value in the.
 
@@ -317,64 +498,57 @@ class ETS_Positioner(SCPIInstrument):
         The target must be located between the current clockwise and counterclockwise limits.
         """
         if self.check_angle_within_limits(axis, angle):
-            t0: float = time.time()
+            self._last_target[axis] = None
+            deadline_ns: int = self._deadline_ns(self.max_travel_time)
             self.cmd_seek_positive_position(axis, angle)
-
-            done: bool = False
-            while not done:
-                if (time.time() - t0) > self.max_travel_time:
-                    raise PositionerError
-
-                response = self.cmd_get_motion_direction(axis)
-                while (response != "0") and (time.time() - t0) < self.max_travel_time:
-                    response = self.cmd_get_motion_direction(axis)
-
-                if response == "0":
-                    return
-                else:
-                    pass
+            self._wait_for_axis_stop(axis, deadline_ns)
         else:
             raise ValueError
 
-    @retry_on_failure
     def stop(self) -> None:
         """Stops the positioner."""
-        t0: float = time.time()
-        done: bool = False
+        self._clear_last_target()
+        deadline_ns: int = self._deadline_ns(2)
         self.cmd_stop()
-        while not done:
-            if (time.time() - t0) > 2:
-                raise PositionerError
-            response = self.cmd_get_operation_complete()
-            if response == "1":
-                return
+        get_operation_complete = self._cmd_get_operation_complete_raw
+        self._poll_until(lambda: get_operation_complete() == "1", deadline_ns)
 
     @retry_on_failure
     def cmd_seek_position(self, axis: str, angle: float) -> None:
         """Move the positioner motor "axis" to position "angle"."""
-        motor: str = self.get_motor_from_axis(axis)
-        self._write(f"{motor}:SK  {angle}")
+        self._last_target[axis] = None
+        self._write_raw(self._SEEK_CMD[axis] % angle)
+
+    @retry_on_failure
+    def cmd_seek_position_pair(self, theta_deg: float, phi_deg: float) -> None:
+        """Move both positioner motors with one compound SCPI write."""
+        self._clear_last_target()
+        theta_motor: str = self.get_motor_from_axis("Theta")
+        phi_motor: str = self.get_motor_from_axis("Phi")
+        self._write(f"{theta_motor}:SK {theta_deg};:{phi_motor}:SK {phi_deg}")
 
     @retry_on_failure
     def cmd_seek_positive_position(self, axis: str, angle: float) -> None:
         """Move the positioner motor "axis" to position "angle"."""
-        motor: str = self.get_motor_from_axis(axis)
-        self._write(f"{motor}:SKP {angle}")
+        self._last_target[axis] = None
+        self._write_raw(self._SEEK_POSITIVE_CMD[axis] % angle)
 
     @retry_on_failure
     def cmd_seek_negative_position(self, axis: str, angle: float) -> None:
         """Move the positioner motor "axis" to position "angle"."""
-        motor: str = self.get_motor_from_axis(axis)
-        self._write(f"{motor}:SKN {angle}")
+        self._last_target[axis] = None
+        self._write_raw(self._SEEK_NEGATIVE_CMD[axis] % angle)
 
     @retry_on_failure
     def cmd_stop(self) -> None:
         """Stops the positioner."""
+        self._clear_last_target()
         self._write("ST")
 
     @retry_on_failure
     def cmd_home(self, axis: str) -> None:
         """Send the positioner home."""
+        self._last_target[axis] = None
         motor: str = self.get_motor_from_axis(axis)
         self._write(f"{motor}:HOME")
 
@@ -393,6 +567,7 @@ class ETS_Positioner(SCPIInstrument):
     @retry_on_failure
     def cmd_reset_axis(self, axis: str) -> None:
         """Reset the axis."""
+        self._last_target[axis] = None
         motor: str = self.get_motor_from_axis(axis)
         self._write(f"{motor}:RESET")
 
@@ -453,6 +628,10 @@ class ETS_Positioner(SCPIInstrument):
     @retry_on_failure
     def cmd_get_operation_complete(self) -> str:
         """Queries if the last operation is complete."""
+        return self._cmd_get_operation_complete_raw()
+
+    def _cmd_get_operation_complete_raw(self) -> str:
+        """cmd_get_operation_complete without retries, for use inside polling loops."""
         return self._query("*OPC?")
 
     @retry_on_failure
@@ -479,12 +658,14 @@ class ETS_Positioner(SCPIInstrument):
 
         Stops at counterclockwise limit.
         """
+        self._last_target[axis] = None
         motor: str = self.get_motor_from_axis(axis)
         self._write(f"{motor}:CC")
 
     @retry_on_failure
     def cmd_move_clockwise(self, axis: str) -> None:
         """Instructs the turntable to move in the clockwise direction. Stops at clockwise limit."""
+        self._last_target[axis] = None
         motor: str = self.get_motor_from_axis(axis)
         self._write(f"{motor}:CW")
 
@@ -523,14 +704,13 @@ class ETS_Positioner(SCPIInstrument):
     @retry_on_failure
     def cmd_set_current_position(self, axis: str, angle: float) -> None:
         """Sets the current position to the specified value in degrees."""
-        motor: str = self.get_motor_from_axis(axis)
-        self._write(f"{motor}:CP {angle}")
+        self._last_target[axis] = None
+        self._write_raw(self._SET_POS_CMD[axis] % angle)
 
     @retry_on_failure
     def cmd_get_axis_position(self, axis: str) -> float:
         """Returns the current position of the turntable in degrees."""
-        motor: str = self.get_motor_from_axis(axis)
-        return float(self._query(f"{motor}:CP?"))
+        return float(self._query(self._POS_CMD[axis]))
 
     @retry_on_failure
     def cmd_set_continuous_rotation_mode(self, axis: str) -> None:
@@ -570,8 +750,22 @@ class ETS_Positioner(SCPIInstrument):
          0 = Device is stopped
         -1 = Device is moving counterclockwise
         """
-        motor: str = self.get_motor_from_axis(axis)
-        return self._query(f"{motor}:DIR?")
+        return self._cmd_get_motion_direction_raw(axis)
+
+    def _cmd_get_motion_direction_raw(self, axis: str) -> str:
+        """cmd_get_motion_direction without retries, for use inside polling loops."""
+        return self._query(self._DIR_CMD[axis])
+
+    @retry_on_failure
+    def cmd_get_motion_direction_pair(self) -> Tuple[str, str]:
+        """Returns the (Theta, Phi) motion directions from one compound query."""
+        return self._cmd_get_motion_direction_pair_raw()
+
+    def _cmd_get_motion_direction_pair_raw(self) -> Tuple[str, str]:
+        """cmd_get_motion_direction_pair without retries, for use inside polling loops."""
+        response: str = self._query(f"{self._DIR_CMD['Theta']};:{self._DIR_CMD['Phi']}")
+        theta_dir, phi_dir = response.split(";")
+        return theta_dir.strip(), phi_dir.strip()
 
     @retry_on_failure
     def cmd_get_error_code(self) -> str:
@@ -588,6 +782,9 @@ class ETS_Positioner(SCPIInstrument):
         :param elevation: elevation angle, in radians
         :returns: Tuple of (theta, phi) angles in radians
         """
+        if np.ndim(azimuth) == 0 and np.ndim(elevation) == 0:
+            return _azel_to_thetaphi_nb(float(azimuth), float(elevation))
+
         cos_theta: float = np.cos(elevation) * np.cos(azimuth)
         theta: float = np.arccos(cos_theta)
 
@@ -604,12 +801,35 @@ class ETS_Positioner(SCPIInstrument):
         :param phi: phi angle, in radians
         :returns: Tuple of (azimuth, elevation) angles in radians
         """
-        sin_elevation: float = np.sin(phi) * np.sin(theta)
-        elevation: float = np.arcsin(sin_elevation)
-        azimuth: float = np.arctan2(np.cos(phi) * np.sin(theta), np.cos(theta))
+        if np.ndim(theta) == 0 and np.ndim(phi) == 0:
+            return _thetaphi_to_azel_nb(float(theta), float(phi))
+
+        sin_theta = np.sin(theta)
+        elevation: float = np.arcsin(np.sin(phi) * sin_theta)
+        azimuth: float = np.arctan2(np.cos(phi) * sin_theta, np.cos(theta))
 
         return azimuth, elevation
 
+    def azel_to_thetaphi_deg(self, azimuth: float, elevation: float) -> Tuple[float, float]:
+        """Azimuth-elevation to theta-phi conversion, in degrees.
+
+        :param azimuth: azimuth angle, in degrees
+        :param elevation: elevation angle, in degrees
+        :returns: Tuple of (theta, phi) angles in degrees
+        """
+        theta, phi = self.azel_to_thetaphi(azimuth * _DEG2RAD, elevation * _DEG2RAD)
+        return theta * _RAD2DEG, phi * _RAD2DEG
+
+    def thetaphi_to_azel_deg(self, theta: float, phi: float) -> Tuple[float, float]:
+        """Theta-phi to azimuth-elevation conversion, in degrees.
+
+        :param theta: theta angle, in degrees
+        :param phi: phi angle, in degrees
+        :returns: Tuple of (azimuth, elevation) angles in degrees
+        """
+        azimuth, elevation = self.thetaphi_to_azel(theta * _DEG2RAD, phi * _DEG2RAD)
+        return azimuth * _RAD2DEG, elevation * _RAD2DEG
+
     @retry_on_failure
     def cmd_get_axis_trigger_enable(self, axis: str) -> str:
         """CONT:ELEV:TRIG:STAT.
@@ -667,18 +887,35 @@ class ETS_Positioner(SCPIInstrument):
         motor = self.get_motor_from_axis(axis)
         self._write("CONT:%s:TRIG:STEP %f" % (motor, step_size))
 
+    @retry_on_failure
+    def cmd_setup_axis_trigger(self, axis: str, flag: bool, step_size: float) -> None:
+        """CONT:ELEV:TRIG:STAT <status>;:CONT:ELEV:TRIG:STEP <step>.
+
+        Enables or disables the hardware trigger of an axis and sets its step size in a
+        single compound write, instead of calling cmd_set_axis_trigger_enable and
+        cmd_set_axis_trigger separately. Both are set commands with no reply, so they can
+        safely share one SCPI line.
+        """
+        flag_val: int = 1 if flag else 0
+        motor = self.get_motor_from_axis(axis)
+        self._write(
+            "CONT:%s:TRIG:STAT %d;:CONT:%s:TRIG:STEP %f" % (motor, flag_val, motor, step_size)
+        )
+
 
 def transform_ptheta_pphi_to_px_py(
-    phi_pos_deg: float,
-    ptheta_mag_db: float,
-    ptheta_pha_deg: float,
-    pphi_mag_db: float,
-    pphi_pha_deg: float,
+    phi_pos_deg: float | np.ndarray,
+    ptheta_mag_db: float | np.ndarray,
+    ptheta_pha_deg: float | np.ndarray,
+    pphi_mag_db: float | np.ndarray,
+    pphi_pha_deg: float | np.ndarray,
     omt: bool,
-) -> Tuple[float, float, float, float]:
+) -> Tuple[float | np.ndarray, float | np.ndarray, float | np.ndarray, float | np.ndarray]:
     """Conversion between the axis of the fixed horn and the X- and Y- axis of the AUT.
 
     This implements the Ludwig III cross-pol definition.
+    Scalars or equally shaped arrays are accepted; arrays are processed in a single
+    vectorized evaluation so that a whole sweep can be converted in one call.
     :param phi_pos_deg: Angle of Phi positioner in degrees
     :param ptheta_mag_dB: Magnitude of the power (or S21 parameter)
                         received in the horizontal port of the horn, in dB (or dBm)
@@ -702,53 +939,143 @@ def transform_ptheta_pphi_to_px_py(
         py_pha_deg - Phase of the power (or S21 parameter)
                     of the vertically-polarized signal (vertical wrt AUT), in degrees
     """
-    phi: float = phi_pos_deg * np.pi / 180
+    if all(
+        np.ndim(value) == 0
+        for value in (phi_pos_deg, ptheta_mag_db, ptheta_pha_deg, pphi_mag_db, pphi_pha_deg)
+    ):
+        return _transform_ptheta_pphi_to_px_py_scalar(
+            phi_pos_deg, ptheta_mag_db, ptheta_pha_deg, pphi_mag_db, pphi_pha_deg, omt
+        )
+
+    if NUMBA_AVAILABLE:
+        inputs = np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=np.float64)
+                for value in (phi_pos_deg, ptheta_mag_db, ptheta_pha_deg, pphi_mag_db, pphi_pha_deg)
+            )
+        )
+        shape = inputs[0].shape
+        outputs = _transform_ptheta_pphi_to_px_py_batch(
+            *(np.ascontiguousarray(value).ravel() for value in inputs), omt
+        )
+        return tuple(output.reshape(shape) for output in outputs)  # type: ignore
+
+    phi = np.deg2rad(phi_pos_deg)
+    ephi_pha_deg = np.add(pphi_pha_deg, 90) if omt else np.asarray(pphi_pha_deg)
+
+    # Complex field received in each horn port: magnitude * (cos(pha) + 1j*sin(pha))
+    # 10 ** (x / 20) == exp(x * ln(10) / 20)
+    etheta = np.exp(np.asarray(ptheta_mag_db) * _LN10_OVER_20 + 1j * np.deg2rad(ptheta_pha_deg))
+    ephi = np.exp(np.asarray(pphi_mag_db) * _LN10_OVER_20 + 1j * np.deg2rad(ephi_pha_deg))
+
+    cos_phi = np.cos(phi)
+    sin_phi = np.sin(phi)
+    ex = cos_phi * etheta - sin_phi * ephi
+    ey = sin_phi * etheta + cos_phi * ephi
+
+    return (
+        20 * np.log10(np.abs(ex)),
+        np.rad2deg(np.angle(ex)),
+        20 * np.log10(np.abs(ey)),
+        np.rad2deg(np.angle(ey)),
+    )
+
 
-    etheta_mag = 10 ** (ptheta_mag_db / 20)
-    etheta_pha = ptheta_pha_deg * np.pi / 180
-    ephi_mag = 10 ** (pphi_mag_db / 20)
+@njit(cache=True, fastmath=_FASTMATH_FLAGS)
+def _transform_ptheta_pphi_to_px_py_scalar(
+    phi_pos_deg: float,
+    ptheta_mag_db: float,
+    ptheta_pha_deg: float,
+    pphi_mag_db: float,
+    pphi_pha_deg: float,
+    omt: bool,
+) -> Tuple[float, float, float, float]:
+    """Scalar version of transform_ptheta_pphi_to_px_py using math instead of numpy ufuncs."""
+    phi: float = phi_pos_deg * _DEG2RAD
+
+    etheta_mag = exp(ptheta_mag_db * _LN10_OVER_20)
+    etheta_pha = ptheta_pha_deg * _DEG2RAD
+    ephi_mag = exp(pphi_mag_db * _LN10_OVER_20)
     if omt:
         # OMT introduces an additional 90deg shift between both received polarizations
-        ephi_pha = (pphi_pha_deg + 90) * np.pi / 180
+        ephi_pha = (pphi_pha_deg + 90) * _DEG2RAD
     else:
-        ephi_pha = (pphi_pha_deg) * np.pi / 180
+        ephi_pha = (pphi_pha_deg) * _DEG2RAD
 
-    re_ex: float = np.cos(phi) * etheta_mag * np.cos(etheta_pha) - np.sin(phi) * ephi_mag * np.cos(
-        ephi_pha
-    )
-    im_ex: float = np.cos(phi) * etheta_mag * np.sin(etheta_pha) - np.sin(phi) * ephi_mag * np.sin(
-        ephi_pha
-    )
+    cos_phi: float = cos(phi)
+    sin_phi: float = sin(phi)
 
-    re_ey: float = np.sin(phi) * etheta_mag * np.cos(etheta_pha) + np.cos(phi) * ephi_mag * np.cos(
-        ephi_pha
-    )
-    im_ey: float = np.sin(phi) * etheta_mag * np.sin(etheta_pha) + np.cos(phi) * ephi_mag * np.sin(
-        ephi_pha
-    )
+    # Real and imaginary parts of the field received in each horn port
+    re_etheta: float = etheta_mag * cos(etheta_pha)
+    im_etheta: float = etheta_mag * sin(etheta_pha)
+    re_ephi: float = ephi_mag * cos(ephi_pha)
+    im_ephi: float = ephi_mag * sin(ephi_pha)
+
+    re_ex: float = cos_phi * re_etheta - sin_phi * re_ephi
+    im_ex: float = cos_phi * im_etheta - sin_phi * im_ephi
+
+    re_ey: float = sin_phi * re_etheta + cos_phi * re_ephi
+    im_ey: float = sin_phi * im_etheta + cos_phi * im_ephi
+
+    # 10 * log10(re**2 + im**2) == 20 * log10(hypot(re, im)), without squaring into
+    # overflow/underflow
+    px_mag: float = hypot(re_ex, im_ex)
+    py_mag: float = hypot(re_ey, im_ey)
+
+    # np.log10 returned -inf for a zero magnitude, math.log10 raises instead
+    px_mag_db: float = 20 * log10(px_mag) if px_mag > 0.0 else -inf
+    py_mag_db: float = 20 * log10(py_mag) if py_mag > 0.0 else -inf
+
+    px_pha: float = atan2(im_ex, re_ex)
+    py_pha: float = atan2(im_ey, re_ey)
 
-    px_mag: float = re_ex**2 + im_ex**2
-    py_mag: float = re_ey**2 + im_ey**2
+    px_pha_deg: float = px_pha * _RAD2DEG
+    py_pha_deg: float = py_pha * _RAD2DEG
 
-    px_mag_db: float = 10 * np.log10(px_mag)
-    py_mag_db: float = 10 * np.log10(py_mag)
+    return px_mag_db, px_pha_deg, py_mag_db, py_pha_deg
 
-    px_pha: float = np.arctan2(im_ex, re_ex)
-    py_pha: float = np.arctan2(im_ey, re_ey)
 
-    px_pha_deg: float = px_pha * 180 / np.pi
-    py_pha_deg: float = py_pha * 180 / np.pi
+@njit(cache=True, parallel=True)
+def _transform_ptheta_pphi_to_px_py_batch(
+    phi_pos_deg: np.ndarray,
+    ptheta_mag_db: np.ndarray,
+    ptheta_pha_deg: np.ndarray,
+    pphi_mag_db: np.ndarray,
+    pphi_pha_deg: np.ndarray,
+    omt: bool,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Multithreaded loop of the scalar kernel over 1-D float64 arrays, only used with numba."""
+    n = phi_pos_deg.shape[0]
+    px_mag_db = np.empty(n)
+    px_pha_deg = np.empty(n)
+    py_mag_db = np.empty(n)
+    py_pha_deg = np.empty(n)
+
+    for i in prange(n):
+        px_mag_db[i], px_pha_deg[i], py_mag_db[i], py_pha_deg[i] = (
+            _transform_ptheta_pphi_to_px_py_scalar(
+                phi_pos_deg[i],
+                ptheta_mag_db[i],
+                ptheta_pha_deg[i],
+                pphi_mag_db[i],
+                pphi_pha_deg[i],
+                omt,
+            )
+        )
 
     return px_mag_db, px_pha_deg, py_mag_db, py_pha_deg
 
 
 def transform_ptheta_pphi_to_px_py_no_phase(
-    phi_pos_deg: float, ptheta_mag_db: float, pphi_mag_db: float
-) -> Tuple[float, float]:
+    phi_pos_deg: float | np.ndarray,
+    ptheta_mag_db: float | np.ndarray,
+    pphi_mag_db: float | np.ndarray,
+) -> Tuple[float | np.ndarray, float | np.ndarray]:
     """Conversion between the axis of the fixed horn and the.
 
     X- and Y- axis of the AUT without using the received Phase.
     This implements the Ludwig III cross-pol definition.
+    Scalars or equally shaped arrays are accepted, as in transform_ptheta_pphi_to_px_py.
     :param phi_pos_deg: Angle of Phi positioner in degrees
     :param ptheta_mag_db: Magnitude of the power (or S21 parameter)
                         received in the horizontal port of the horn, in dB (or dBm)
@@ -762,28 +1089,117 @@ def transform_ptheta_pphi_to_px_py_no_phase(
         py_mag_db - Magnitude of the power (or S21 parameter)
                     of the vertically-polarized signal (vertical wrt AUT)  in dBm (or dB)
     """
-    phi: float = phi_pos_deg * np.pi / 180
+    if np.ndim(phi_pos_deg) == 0 and np.ndim(ptheta_mag_db) == 0 and np.ndim(pphi_mag_db) == 0:
+        return _transform_ptheta_pphi_to_px_py_no_phase_scalar(
+            phi_pos_deg, ptheta_mag_db, pphi_mag_db
+        )
 
-    etheta_mag: float = 10 ** (ptheta_mag_db / 20)
-    ephi_mag: float = 10 ** (pphi_mag_db / 20)
+    phi_pos_deg = np.asarray(phi_pos_deg)
+    phi = phi_pos_deg * _DEG2RAD
 
-    if ((phi_pos_deg > 0) * (phi_pos_deg <= 90)) + ((phi_pos_deg > -180) * (phi_pos_deg <= -90)):
-        re_ex = np.cos(phi) * etheta_mag + np.sin(phi) * ephi_mag
-        re_ey = np.sin(phi) * etheta_mag - np.cos(phi) * ephi_mag
-    else:
-        re_ex = np.cos(phi) * etheta_mag - np.sin(phi) * ephi_mag
-        re_ey = np.sin(phi) * etheta_mag + np.cos(phi) * ephi_mag
+    etheta_mag = np.exp(np.asarray(ptheta_mag_db) * _LN10_OVER_20)
+    ephi_mag = np.exp(np.asarray(pphi_mag_db) * _LN10_OVER_20)
+
+    cos_phi = np.cos(phi)
+    sin_phi = np.sin(phi)
+
+    mask = ((phi_pos_deg > 0) & (phi_pos_deg <= 90)) | (
+        (phi_pos_deg > -180) & (phi_pos_deg <= -90)
+    )
+    # The quadrant only flips the sign of the Ephi contribution
+    ephi_signed = np.where(mask, -ephi_mag, ephi_mag)
+    re_ex = cos_phi * etheta_mag - sin_phi * ephi_signed
+    re_ey = sin_phi * etheta_mag + cos_phi * ephi_signed
 
-    px_mag = re_ex**2
-    py_mag = re_ey**2
+    # 10 * log10(x**2) == 20 * log10(|x|)
+    return 20 * np.log10(np.abs(re_ex)), 20 * np.log10(np.abs(re_ey))
 
-    px_mag_db: float = 10 * np.log10(px_mag)
-    py_mag_db: float = 10 * np.log10(py_mag)
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS)
+def _transform_ptheta_pphi_to_px_py_no_phase_scalar(
+    phi_pos_deg: float, ptheta_mag_db: float, pphi_mag_db: float
+) -> Tuple[float, float]:
+    """Scalar version of transform_ptheta_pphi_to_px_py_no_phase using math."""
+    phi: float = phi_pos_deg * _DEG2RAD
+
+    etheta_mag: float = exp(ptheta_mag_db * _LN10_OVER_20)
+    ephi_mag: float = exp(pphi_mag_db * _LN10_OVER_20)
+
+    cos_phi: float = cos(phi)
+    sin_phi: float = sin(phi)
+
+    # The quadrant only flips the sign of the Ephi contribution
+    if (0 < phi_pos_deg <= 90) or (-180 < phi_pos_deg <= -90):
+        ephi_mag = -ephi_mag
+
+    re_ex: float = cos_phi * etheta_mag - sin_phi * ephi_mag
+    re_ey: float = sin_phi * etheta_mag + cos_phi * ephi_mag
+
+    # 10 * log10(x**2) == 20 * log10(|x|); a zero field maps to -inf as np.log10 did
+    px_mag_db: float = 20 * log10(abs(re_ex)) if re_ex != 0.0 else -inf
+    py_mag_db: float = 20 * log10(abs(re_ey)) if re_ey != 0.0 else -inf
 
     return px_mag_db, py_mag_db
 
 
-def total_power(ptheta_mag_db: float, pphi_mag_db: float) -> float:
+def polarization_decompose_sweep(
+    phi_grid_deg: np.ndarray, ptheta_db: np.ndarray, pphi_db: np.ndarray
+) -> np.ndarray:
+    """Phase-less Ludwig III decomposition of a whole phi sweep at once.
+
+    Array counterpart of transform_ptheta_pphi_to_px_py_no_phase: every step runs as a
+    single ufunc call over the sweep, writing into preallocated buffers.
+    :param phi_grid_deg: Angles of the Phi positioner in degrees
+    :param ptheta_db: Magnitudes received in the horizontal port of the horn, in dB (or dBm)
+    :param pphi_db: Magnitudes received in the vertical port of the horn, in dB (or dBm)
+    :returns: Array of shape (2, N) whose rows are px_mag_db and py_mag_db
+    """
+    phi_grid_deg = np.asarray(phi_grid_deg, dtype=np.float64)
+    ptheta_db = np.asarray(ptheta_db, dtype=np.float64)
+    pphi_db = np.asarray(pphi_db, dtype=np.float64)
+    if not phi_grid_deg.shape == ptheta_db.shape == pphi_db.shape:
+        raise ValueError("phi_grid_deg, ptheta_db and pphi_db must have the same shape")
+
+    out = np.empty((2,) + phi_grid_deg.shape)
+    px_db, py_db = out
+    tmp = np.empty_like(phi_grid_deg)
+
+    phi = np.multiply(phi_grid_deg, _DEG2RAD)
+    cos_phi = np.cos(phi)
+    sin_phi = np.sin(phi, out=phi)
+
+    etheta = np.multiply(ptheta_db, _LN10_OVER_20)
+    np.exp(etheta, out=etheta)
+    ephi = np.multiply(pphi_db, _LN10_OVER_20)
+    np.exp(ephi, out=ephi)
+
+    # The quadrant only flips the sign of the Ephi contribution
+    mask = ((phi_grid_deg > 0) & (phi_grid_deg <= 90)) | (
+        (phi_grid_deg > -180) & (phi_grid_deg <= -90)
+    )
+    np.negative(ephi, out=ephi, where=mask)
+
+    # px = cos(phi) * Etheta - sin(phi) * Ephi
+    np.multiply(cos_phi, etheta, out=px_db)
+    np.multiply(sin_phi, ephi, out=tmp)
+    np.subtract(px_db, tmp, out=px_db)
+
+    # py = sin(phi) * Etheta + cos(phi) * Ephi
+    np.multiply(sin_phi, etheta, out=py_db)
+    np.multiply(cos_phi, ephi, out=tmp)
+    np.add(py_db, tmp, out=py_db)
+
+    # 10 * log10(x**2) == 20 * log10(|x|)
+    np.abs(out, out=out)
+    np.log10(out, out=out)
+    np.multiply(out, 20.0, out=out)
+
+    return out
+
+
+def total_power(
+    ptheta_mag_db: float | np.ndarray, pphi_mag_db: float | np.ndarray
+) -> float | np.ndarray:
     """Computes the total power received by the horn (including co-pol and cross-pol).
 
     :param ptheta_mag_dB (float): Magnitude of the power (or S21 parameter)
@@ -794,4 +1210,24 @@ def total_power(ptheta_mag_db: float, pphi_mag_db: float) -> float:
                                 [Phi-vector = Horn vertical direction]
     :returns: total power received by the horn (including co-pol and cross-pol) in dBm
     """
-    return 10 * np.log10(10 ** (ptheta_mag_db / 10) + 10 ** (pphi_mag_db / 10))
+    # 10*log10(10**(a/10) + 10**(b/10)) is a log-sum-exp in base 10. Evaluating it as
+    # max + log1p(exp(min - max)) avoids both pow() calls and cannot overflow.
+    if np.ndim(ptheta_mag_db) == 0 and np.ndim(pphi_mag_db) == 0:
+        return _total_power_scalar(float(ptheta_mag_db), float(pphi_mag_db))
+
+    return (
+        np.logaddexp(
+            np.asarray(ptheta_mag_db) * _LN10_OVER_10, np.asarray(pphi_mag_db) * _LN10_OVER_10
+        )
+        / _LN10_OVER_10
+    )
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS)
+def _total_power_scalar(ptheta_mag_db: float, pphi_mag_db: float) -> float:
+    """Scalar version of total_power."""
+    high: float = max(ptheta_mag_db, pphi_mag_db)
+    if high == -inf:
+        return -inf
+    low: float = min(ptheta_mag_db, pphi_mag_db)
+    return high + log1p(exp((low - high) * _LN10_OVER_10)) / _LN10_OVER_10
@@ -1,6 +1,8 @@
 """Driver for Rhode & Schwarz ATS1800C Positioner."""
 
 from logging import Logger
+import math
+import select
 import socket
 import time
 from typing import Optional, Tuple
@@ -12,6 +14,36 @@ from instrument_lib.utils import InstrumentError, InstrumentIdentificationInfo,
 
 BUFFER_SIZE: int = 1024
 TERM_CHAR: str = "\x00"
+_TERM: bytes = TERM_CHAR.encode("ascii")
+POLL_DELAY_MIN: float = 0.05
+POLL_DELAY_MAX: float = 0.25
+POSITION_POLL_DELAY: float = 0.02
+# How long to wait for each further reply to a compound line once the first one has arrived.
+REPLY_TIMEOUT: float = 0.2
+
+_AXIS_TO_MOTOR: dict[str, str] = {"Theta": "ELEV", "Phi": "AZIM"}
+_AXIS_IDX: dict[str, int] = {"Theta": 0, "Phi": 1}
+# The ATS1800C phi axis turns the opposite way to the ETS one.
+_AXIS_SIGN: dict[str, float] = {"Theta": 1.0, "Phi": -1.0}
+# Per-axis SCPI commands, formatted with the motor name once in __init__. Setter entries
+# are prefixes that the value is appended to.
+_AXIS_CMD_TEMPLATES: dict[str, str] = {
+    "spe_get": "CONT:%s:SPE?",
+    "spe_set": "CONT:%s:SPE ",
+    "acc_get": "CONT:%s:ACC?",
+    "acc_set": "CONT:%s:ACC ",
+    "star": "CONT:%s:STAR",
+    "stop": "CONT:%s:STOP",
+    "pos_get": "SENS:%s:POS?",
+    "busy_get": "SENS:%s:BUSY?",
+    "trig_stat_get": "CONT:%s:TRIG:STAT?",
+    "trig_stat_set": "CONT:%s:TRIG:STAT ",
+    "trig_step_get": "CONT:%s:TRIG:STEP",
+    "trig_step_set": "CONT:%s:TRIG:STEP ",
+    "offs_get": "CONT:%s:OFFS",
+    "offs_set": "CONT:%s:OFFS:",
+    "targ_set": "CONT:%s:POS:TARG ",
+}
 
 
 class RS_Positioner(Instrument):  # noqa: N801
@@ -20,9 +52,11 @@ class RS_Positioner(Instrument):  # noqa: N801
     This instrument controls the position of the DUT.
     """
 
-    ACCEPTED_MODELS = [
-        "ATS1800C",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "ATS1800C",
+        }
+    )
 
     def __init__(
         self,
@@ -62,10 +96,19 @@ class RS_Positioner(Instrument):  # noqa: N801
         self.position_accuracy_deg: float = position_accuracy_deg
         self.max_travel_time: float = max_travel_time
         self.rsinstrument = True
+        self._cmd: dict[str, dict[str, str]] = {
+            name: {axis: template % motor for axis, motor in _AXIS_TO_MOTOR.items()}
+            for name, template in _AXIS_CMD_TEMPLATES.items()
+        }
+        # Cleared when the controller does not answer the compound position query with two values
+        self._position_pair_query: bool = True
 
     def connect(self) -> None:
         """Connect to instrument."""
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # SCPI commands are tiny; don't let Nagle hold them back waiting for an ACK.
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._rx_buf = bytearray(BUFFER_SIZE)
         try:
             self.sock.connect((self.ip_address, self.port))
             self.identify()
@@ -98,9 +141,49 @@ class RS_Positioner(Instrument):  # noqa: N801
 
         :param command: string of command to send.
         """
-        self.sock.sendall(f"{command}{TERM_CHAR}".encode())
-        data: bytes = self.sock.recv(BUFFER_SIZE)
-        return data.decode("utf-8").strip(TERM_CHAR)
+        self.sock.sendall(command.encode("ascii") + _TERM)
+        rx_buf: bytearray = self._rx_buf
+        n: int = self.sock.recv_into(rx_buf, BUFFER_SIZE)
+        end: int = rx_buf.find(_TERM, 0, n)
+        return rx_buf[: end if end >= 0 else n].decode("ascii")
+
+    def send_commands(self, commands: list[str]) -> list[str]:
+        """Send several commands as one compound SCPI line.
+
+        The commands are joined with ';:' so every header is parsed from the root. Up to one
+        reply per command is read, so acknowledgements do not linger in the socket and get
+        returned by the next query.
+
+        :param commands: commands to send.
+        :return: replies received, in order.
+        """
+        self.sock.sendall(";:".join(commands).encode("ascii") + _TERM)
+        return self._read_replies(len(commands))
+
+    def _read_replies(self, count: int) -> list[str]:
+        """Read up to count TERM_CHAR terminated replies.
+
+        Blocks for the first reply like send_command does, then waits at most REPLY_TIMEOUT
+        for each further one, in case the controller answers a compound line only once.
+        """
+        rx_buf: bytearray = self._rx_buf
+        data: bytearray = bytearray()
+        received: int = 0
+        while received < count:
+            if received and not select.select([self.sock], [], [], REPLY_TIMEOUT)[0]:
+                break
+            n: int = self.sock.recv_into(rx_buf, BUFFER_SIZE)
+            if n == 0:
+                raise InstrumentError("Positioner closed the connection.")
+            data += rx_buf[:n]
+            received = data.count(_TERM)
+        return [reply.decode("ascii") for reply in data.split(_TERM)[: min(received, count)]]
+
+    def _drain_replies(self) -> None:
+        """Discard replies still arriving, until none has come for REPLY_TIMEOUT."""
+        while select.select([self.sock], [], [], REPLY_TIMEOUT)[0]:
+            if self.sock.recv_into(self._rx_buf, BUFFER_SIZE) == 0:
+                raise InstrumentError("Positioner closed the connection.")
 
     def check_angel_within_limits(self, axis: str, angle: float) -> bool:
         """Checks that the angle is within the limits set.
@@ -119,10 +202,7 @@ class RS_Positioner(Instrument):  # noqa: N801
         In the ATS chamber case, the "top" of the antenna (closest to the "sky" in the ETS)
         corresponds to the position of the snowflake closest to the horn
         """
-        if axis == "Phi":
-            angle: float = -angle_ets
-        else:
-            angle = angle_ets
+        angle: float = angle_ets * _AXIS_SIGN[axis]
 
         if abs(angle) < 1e-6:
             angle = 1e-6
@@ -136,16 +216,11 @@ class RS_Positioner(Instrument):  # noqa: N801
         In the ATS chamber case, the "top" of the antenna (closest to the "sky" in the ETS)
         corresponds to the position of the snowflake closest to the horn
         """
-        if axis == "Phi":
-            angle: float = -angle_ats
-        else:
-            angle = angle_ats
-
-        return angle
+        return angle_ats * _AXIS_SIGN[axis]
 
     def get_motor_from_axis(self, axis: str) -> str:
         """Gets motor from the axis."""
-        return "ELEV" if axis == "Theta" else "AZIM"
+        return _AXIS_TO_MOTOR[axis]
 
     def get_positioner_ip(self) -> str | None:
         """Return positioner IP."""
@@ -165,7 +240,7 @@ class RS_Positioner(Instrument):  # noqa: N801
 
     def get_current_position_theta_phi(self) -> Tuple[float, float]:
         """Return the current position in Theta-Phi coordinate system."""
-        return self.get_current_position_theta(), self.get_current_position_phi()
+        return self.cmd_get_axis_position_pair()
 
     def get_current_position(self) -> Tuple[float, float]:
         """Return the current position in Theta-Phi coordinate system."""
@@ -173,35 +248,39 @@ class RS_Positioner(Instrument):  # noqa: N801
 
     def get_current_position_az_el(self) -> Tuple[float, float]:
         """Return the current position in Azimuth-Elevation coordinate system."""
-        theta: float = 0
-        phi: float = 0
         theta, phi = self.get_current_position()
-
-        azimuth: float = 0
-        elevation: float = 0
-        azimuth, elevation = self.thetaphi_to_azel(theta * np.pi / 180, phi * np.pi / 180)
+        azimuth, elevation = self.thetaphi_to_azel(math.radians(theta), math.radians(phi))
 
         return azimuth, elevation
 
-    def move_to_theta_phi(self, theta: float, phi: float) -> None:
-        """Move the positioner to a certain angle defined in Theta-Phi coordinate system."""
+    def move_to_theta_phi(self, theta: float, phi: float, pipeline: bool = True) -> None:
+        """Move the positioner to a certain angle defined in Theta-Phi coordinate system.
+
+        :param pipeline: Command both axes in one compound line and poll them together.
+        """
         if (theta < self.theta_min) or (theta > self.theta_max):
             raise ValueError(f"Theta must be between {self.theta_max} and {self.theta_min}")
 
         if (phi < self.phi_min) or (phi > self.phi_max):
             raise ValueError(f"Phi must be between {self.phi_max} and {self.phi_min}")
 
-        self.seek_position("Theta", theta)
-        self.seek_position("Phi", phi)
+        if pipeline:
+            self.seek_position_pair(theta, phi)
+        else:
+            self.seek_position("Theta", theta)
+            self.seek_position("Phi", phi)
+
+    def move_to_azimuth_elevation(
+        self, azimuth: float, elevation: float, pipeline: bool = True
+    ) -> None:
+        """Move the positioner to a certain angle defined in Azimuth-Elevation coordinate system.
 
-    def move_to_azimuth_elevation(self, azimuth: float, elevation: float) -> None:
-        """Move the positioner to a certain angle defined in Azimuth-Elevation coordinate system."""
-        theta_rad: float = 0
-        phi_rad: float = 0
-        theta_rad, phi_rad = self.azel_to_thetaphi(azimuth * np.pi / 180, elevation * np.pi / 180)
+        :param pipeline: Command both axes in one compound line and poll them together.
+        """
+        theta_rad, phi_rad = self.azel_to_thetaphi(math.radians(azimuth), math.radians(elevation))
 
-        theta_deg: float = theta_rad * 180 / np.pi
-        phi_deg: float = phi_rad * 180 / np.pi
+        theta_deg: float = math.degrees(theta_rad)
+        phi_deg: float = math.degrees(phi_rad)
 
         if (theta_deg < self.theta_min) or (theta_deg > self.theta_max):
             raise ValueError(f"Theta must be between {self.theta_max} and {self.theta_min}")
@@ -209,8 +288,11 @@ class RS_Positioner(Instrument):  # noqa: N801
         if (phi_deg < self.phi_min) or (phi_deg > self.phi_max):
             raise ValueError(f"Phi must be between {self.phi_max} and {self.phi_min}")
 
-        self.seek_position("Theta", theta_deg)
-        self.seek_position("Phi", phi_deg)
+        if pipeline:
+            self.seek_position_pair(theta_deg, phi_deg)
+        else:
+            self.seek_position("Theta", theta_deg)
+            self.seek_position("Phi", phi_deg)
 
     def move_to_degrees(self, id_: int, angle: float) -> None:
         """For compatibility with the other positioner."""
@@ -231,8 +313,7 @@ class RS_Positioner(Instrument):  # noqa: N801
         lower speeds for heavy DUTs.
         Range: 1 to 150
         """
-        motor: str = self.get_motor_from_axis(axis)
-        return float(self.send_command(f"CONT:{motor}:SPE?"))
+        return float(self.send_command(self._cmd["spe_get"][axis]))
 
     def cmd_set_axis_speed(self, axis: str, speed: float) -> None:
         """Sets the speed of the azimuth/elevation axis.
@@ -248,8 +329,7 @@ class RS_Positioner(Instrument):  # noqa: N801
         lower speeds for heavy DUTs.
         Range: 1 to 150
         """
-        motor: str = self.get_motor_from_axis(axis)
-        self.send_command(f"CONT:{motor}:SPE {speed}")
+        self.send_command(self._cmd["spe_set"][axis] + str(speed))
 
     def cmd_get_axis_accceleration(self, axis: str) -> float:
         """Queries the acceleration of the azimuth/elevation axis.
@@ -263,8 +343,7 @@ class RS_Positioner(Instrument):  # noqa: N801
         We recommend a maximum azimuth acceleration of 2000 deg/s2.
         Range: 1 to 15000
         """
-        motor: str = self.get_motor_from_axis(axis)
-        return float(self.send_command(f"CONT:{motor}:ACC?"))
+        return float(self.send_command(self._cmd["acc_get"][axis]))
 
     def cmd_set_axis_acceleration(self, axis: str, accleration: float) -> None:
         """Sets or queries the acceleration of the azimuth/elevation axis.
@@ -278,18 +357,15 @@ class RS_Positioner(Instrument):  # noqa: N801
         We recommend a maximum azimuth acceleration of 2000 deg/s2.
         Range: 1 to 15000
         """
-        motor: str = self.get_motor_from_axis(axis)
-        self.send_command(f"CONT:{motor}:ACC {accleration}")
+        self.send_command(self._cmd["acc_set"][axis] + str(accleration))
 
     def cmd_axis_start(self, axis: str) -> None:
         """Starts the movement of the positioner axis to the target position."""
-        motor: str = self.get_motor_from_axis(axis)
-        self.send_command(f"CONT:{motor}:STAR")
+        self.send_command(self._cmd["star"][axis])
 
     def cmd_axis_stop(self, axis: str) -> None:
         """Stops the movement of the azimuth/elevation axis."""
-        motor: str = self.get_motor_from_axis(axis)
-        self.send_command(f"CONT:{motor}:STOP")
+        self.send_command(self._cmd["stop"][axis])
 
     def cmd_get_axis_position(self, axis: str) -> float:
         """Queries the current position of the azimuth axis.
@@ -298,19 +374,43 @@ class RS_Positioner(Instrument):  # noqa: N801
         The reply is a string that codes the current position in degrees with a resolution of 3
         digits after the period.
         """
-        motor: str = self.get_motor_from_axis(axis)
-        angle: float = float(self.send_command(f"SENS:{motor}:POS?"))
+        angle: float = float(self.send_command(self._cmd["pos_get"][axis]))
 
         return self.translate_angle_to_ets_coordinates(axis, angle)
 
+    def cmd_get_axis_position_pair(self) -> Tuple[float, float]:
+        """Queries the current position of the elevation (theta) and azimuth (phi) axes.
+
+        Both position queries are sent as a single compound SCPI line, and the reply holds
+        both positions separated by ';'. If the controller answers anything else, the axes
+        are queried one at a time from then on.
+        """
+        if self._position_pair_query:
+            fields: list[str] = self.send_command(
+                self._cmd["pos_get"]["Theta"] + ";:" + self._cmd["pos_get"]["Phi"]
+            ).split(";")
+            if len(fields) == 2:
+                return (
+                    self.translate_angle_to_ets_coordinates("Theta", float(fields[0])),
+                    self.translate_angle_to_ets_coordinates("Phi", float(fields[1])),
+                )
+            if self.logger is not None:
+                self.logger.warning(
+                    f"Unexpected reply to compound position query: {fields}. "
+                    "Querying axes one at a time."
+                )
+            self._position_pair_query = False
+            self._drain_replies()
+
+        return self.cmd_get_axis_position("Theta"), self.cmd_get_axis_position("Phi")
+
     def cmd_get_axis_busy(self, axis: str) -> bool:
         """Queries the current activity state of the azimuth axis.
 
         * If the azimuth axis is busy, the reply is True.
         * If the axis is not busy, the reply is False.
         """
-        motor: str = self.get_motor_from_axis(axis)
-        return bool(int(self.send_command(f"SENS:{motor}:BUSY?")))
+        return self.send_command(self._cmd["busy_get"][axis]) == "1"
 
     def cmd_get_axis_trigger_enable(self, axis: str) -> str:
         """Queries the generation of a hardware trigger event at every given number.
@@ -322,8 +422,7 @@ class RS_Positioner(Instrument):  # noqa: N801
         The query command checks, if the trigger is enabled.
         Activating the elevation trigger deactivates the azimuth trigger.
         """
-        motor: str = self.get_motor_from_axis(axis)
-        return self.send_command(f"CONT:{motor}:TRIG:STAT?")
+        return self.send_command(self._cmd["trig_stat_get"][axis])
 
     def cmd_set_axis_trigger_enable(self, axis: str, flag: bool) -> None:
         """Enables or disables the generation of a hardware trigger event at every given number.
@@ -334,9 +433,7 @@ class RS_Positioner(Instrument):  # noqa: N801
         The query command checks, if the trigger is enabled.
         Activating the elevation trigger deactivates the azimuth trigger.
         """
-        motor: str = self.get_motor_from_axis(axis)
-        flag_val: int = 1 if flag else 0
-        self.send_command(f"CONT:{motor}:TRIG:STAT {flag_val}")
+        self.send_command(self._cmd["trig_stat_set"][axis] + ("1" if flag else "0"))
 
     def cmd_get_axis_trigger(self, axis: str) -> float:
         """Configures the elevation axis to generate a trigger event every given number of.
@@ -347,8 +444,7 @@ class RS_Positioner(Instrument):  # noqa: N801
         20 deg/s azimuth speed and 5deg for 50 deg/s azimuth speed.
         The query command returns the step size.
         """
-        motor: str = self.get_motor_from_axis(axis)
-        return float(self.send_command(f"CONT:{motor}:TRIG:STEP"))
+        return float(self.send_command(self._cmd["trig_step_get"][axis]))
 
     def cmd_set_axis_trigger(self, axis: str, step_size: float) -> None:
         """Configures the elevation axis to generate a trigger event every given number of.
@@ -359,8 +455,7 @@ class RS_Positioner(Instrument):  # noqa: N801
         20 deg/s azimuth speed and 5 deg for 50 deg/s azimuth speed.
         The query command returns the step size.
         """
-        motor: str = self.get_motor_from_axis(axis)
-        self.send_command(f"CONT:{motor}:TRIG:STEP {step_size}")
+        self.send_command(self._cmd["trig_step_set"][axis] + str(step_size))
 
     def cmd_get_axis_offset(self, axis: str) -> float:
         """Configures an offset for the azimuth axis, or queries the offset.
@@ -369,8 +464,7 @@ class RS_Positioner(Instrument):  # noqa: N801
         <offset> Specifies the offset in degrees.
         Range: -180 to 180
         """
-        motor: str = self.get_motor_from_axis(axis)
-        angle_ats: float = float(self.send_command(f"CONT:{motor}:OFFS"))
+        angle_ats: float = float(self.send_command(self._cmd["offs_get"][axis]))
         return self.translate_angle_to_ets_coordinates(axis, angle_ats)
 
     def cmd_set_axis_offset(self, axis: str, offset: float) -> None:
@@ -381,8 +475,7 @@ class RS_Positioner(Instrument):  # noqa: N801
         Range: -180 to 180
         """
         offset_ats: float = self.translate_angle_to_ats1800c_coordinates(axis, offset)
-        motor: str = self.get_motor_from_axis(axis)
-        self.send_command(f"CONT:{motor}:OFFS:{offset_ats}")
+        self.send_command(self._cmd["offs_set"][axis] + str(offset_ats))
 
     def cmd_positioner_id(self) -> str:
         """Return positioner ID."""
@@ -526,8 +619,24 @@ class RS_Positioner(Instrument):  # noqa: N801
         resolution.
         """
         angle_ats: float = self.translate_angle_to_ats1800c_coordinates(axis, angle)
-        motor: str = self.get_motor_from_axis(axis)
-        self.send_command(f"CONT:{motor}:POS:TARG {angle_ats}")
+        self.send_command(self._cmd["targ_set"][axis] + str(angle_ats))
+
+    def cmd_set_position_targets_and_start(self, theta: float, phi: float) -> None:
+        """Sets the target position of both axes and starts both movements.
+
+        The target and start commands for the elevation (theta) and azimuth (phi) axes are
+        sent as a single compound SCPI line, so the whole move costs one round-trip.
+        """
+        theta_ats: float = self.translate_angle_to_ats1800c_coordinates("Theta", theta)
+        phi_ats: float = self.translate_angle_to_ats1800c_coordinates("Phi", phi)
+        self.send_commands(
+            [
+                self._cmd["targ_set"]["Theta"] + str(theta_ats),
+                self._cmd["targ_set"]["Phi"] + str(phi_ats),
+                self._cmd["star"]["Theta"],
+                self._cmd["star"]["Phi"],
+            ]
+        )
 
     # TODO: Verify that this algo works.
     def seek_position(self, axis: str, angle: float) -> None:
@@ -537,7 +646,7 @@ class RS_Positioner(Instrument):  # noqa: N801
 
         angle in degrees
         """
-        axis_index: int = 0 if axis == "Theta" else 1
+        axis_index: int = _AXIS_IDX[axis]
 
         if not self.check_angel_within_limits(axis, angle):
             raise ValueError("Invalid angle supplied.")
@@ -549,26 +658,107 @@ class RS_Positioner(Instrument):  # noqa: N801
             if self.logger is not None:
                 self.logger.info(f"Seeking: {axis}, Position: {angle} deg.")
 
+            # Bind everything the polling loops touch to locals
+            now = time.time
+            sleep = time.sleep
+            is_busy = self.cmd_get_axis_busy
+            get_position = self.get_current_position
+            accuracy: float = self.position_accuracy_deg
+            deadline: float = t0 + self.max_travel_time
+
+            poll_delay: float = POLL_DELAY_MIN
             done: bool = False
             while not done:
-                if (time.time() - t0) > self.max_travel_time:
+                remaining: float = deadline - now()
+                if remaining < 0:
                     if self.logger is not None:
                         self.logger.error("Positioner is stuck.")
-                        raise PositionerError
+                    raise PositionerError
 
-                response: bool = self.cmd_get_axis_busy(axis)
+                response: bool = is_busy(axis)
 
                 if response:
-                    pass
+                    sleep(min(poll_delay, remaining))
+                    poll_delay = min(poll_delay * 2, POLL_DELAY_MAX)
                 else:
-                    position: Tuple[float, float] = self.get_current_position()
-                    while (abs(position[axis_index] - angle) > self.position_accuracy_deg) and (
-                        (time.time() - t0) < self.max_travel_time
-                    ):
-                        position = self.get_current_position()
+                    position: Tuple[float, float] = get_position()
+                    while (abs(position[axis_index] - angle) > accuracy) and (now() < deadline):
+                        sleep(POSITION_POLL_DELAY)
+                        position = get_position()
 
                     return
 
+    def seek_position_pair(self, theta: float, phi: float) -> None:
+        """Moves both axes concurrently to the specified theta/phi position.
+
+        Both axes are commanded with one SCPI line. Each polling iteration issues a single
+        SYST:STAT? query, which reports the position and busy state of both axes at once.
+
+        theta, phi in degrees
+        """
+        if not (
+            self.check_angel_within_limits("Theta", theta)
+            and self.check_angel_within_limits("Phi", phi)
+        ):
+            raise ValueError("Invalid angle supplied.")
+
+        t0 = time.time()
+        self.cmd_set_position_targets_and_start(theta, phi)
+
+        if self.logger is not None:
+            self.logger.info(f"Seeking: Theta, Position: {theta} deg; Phi, Position: {phi} deg.")
+
+        now = time.time
+        sleep = time.sleep
+        query_status = self.cmd_system_status
+        parse_status = self.parse_system_status
+        accuracy: float = self.position_accuracy_deg
+        deadline: float = t0 + self.max_travel_time
+        theta_sign: float = _AXIS_SIGN["Theta"]
+        phi_sign: float = _AXIS_SIGN["Phi"]
+
+        poll_delay: float = POLL_DELAY_MIN
+        while True:
+            remaining: float = deadline - now()
+            if remaining < 0:
+                if self.logger is not None:
+                    self.logger.error("Positioner is stuck.")
+                raise PositionerError
+
+            axis_status: dict[str, Tuple[float, str]] = parse_status(query_status())
+            try:
+                theta_ats, theta_state = axis_status["ELE"]
+                phi_ats, phi_state = axis_status["AZI"]
+            except KeyError as e:
+                raise PositionerError(f"Axis {e} missing from system status") from e
+
+            if theta_state == "-1" or phi_state == "-1":
+                raise PositionerError(f"Positioner axis error: {axis_status}")
+
+            if theta_state == "0" and phi_state == "0":
+                if (
+                    abs(theta_ats * theta_sign - theta) <= accuracy
+                    and abs(phi_ats * phi_sign - phi) <= accuracy
+                ):
+                    return
+                # Both axes idle but not yet settled on target
+                sleep(min(POSITION_POLL_DELAY, remaining))
+            else:
+                sleep(min(poll_delay, remaining))
+                poll_delay = min(poll_delay * 2, POLL_DELAY_MAX)
+
+    @staticmethod
+    def parse_system_status(response: str) -> dict[str, Tuple[float, str]]:
+        """Maps each axis identifier in a SYST:STAT? reply to its (position, status) tokens.
+
+        The reply is made of <identifier>,<position>,<status> triplets, see cmd_system_status.
+        Positions are in the chamber's own (ATS1800C) coordinates.
+        """
+        tokens: list[str] = [token.strip() for token in response.split(",")]
+        return {
+            tokens[i]: (float(tokens[i + 1]), tokens[i + 2]) for i in range(0, len(tokens) - 2, 3)
+        }
+
     def azel_to_thetaphi(self, azimuth: float, elevation: float) -> Tuple[float, float]:
         """Az-El to Theta-Phi conversion.
 
@@ -578,13 +768,56 @@ class RS_Positioner(Instrument):  # noqa: N801
                     theta in range [0,pi]
                     phi in range [0,2*pi]
         """
-        cos_theta: float = np.cos(elevation) * np.cos(azimuth)
-        theta: float = np.arccos(cos_theta)
+        if isinstance(azimuth, np.ndarray) or isinstance(elevation, np.ndarray):
+            return self.azel_to_thetaphi_vec(azimuth, elevation)
+
+        # Rotations about a single axis need no trig.
+        if azimuth == 0.0:
+            phi_axis: float = 0.0 if elevation == 0.0 else math.copysign(math.pi / 2, elevation)
+            if -math.pi <= elevation <= math.pi:
+                return abs(elevation), phi_axis
+            return math.acos(math.cos(elevation)), phi_axis
+
+        if elevation == 0.0 and -math.pi <= azimuth <= math.pi:
+            return abs(azimuth), (0.0 if azimuth > 0.0 else math.copysign(math.pi, elevation))
 
-        # TODO: Refactor this abomination.
-        phi: float = np.arctan2(np.tan(elevation), (np.sin((azimuth + 1 * (azimuth == 0))))) * (
-            azimuth != 0
-        ) + np.pi / 2 * (azimuth == 0) * np.sign(elevation)
+        cos_theta: float = math.cos(elevation) * math.cos(azimuth)
+        theta: float = math.acos(cos_theta)
+        phi: float = math.atan2(math.tan(elevation), math.sin(azimuth))
+
+        return theta, phi
+
+    def azel_to_thetaphi_vec(
+        self, azimuth: np.ndarray, elevation: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Az-El to Theta-Phi conversion for arrays of angles.
+
+        Agrees with azel_to_thetaphi, including on the azimuth = 0 and elevation = 0 axes:
+
+        >>> positioner = RS_Positioner()
+        >>> azimuth = np.array([0.0, -0.0, 0.0, 0.0, 1.0, -1.0])
+        >>> elevation = np.array([2.0, 0.0, -2.0, 4.0, 0.0, 0.0])
+        >>> theta, phi = positioner.azel_to_thetaphi_vec(azimuth, elevation)
+        >>> all(
+        ...     np.allclose((theta[i], phi[i]), positioner.azel_to_thetaphi(az, el))
+        ...     for i, (az, el) in enumerate(zip(azimuth.tolist(), elevation.tolist()))
+        ... )
+        True
+
+        :param azimuth: Azimuth angles, in radians
+        :param elevation: Elevation angles, in radians
+        :returns: Tuple of corresponding (theta, phi) arrays, in radians
+        """
+        azimuth = np.asarray(azimuth)
+        elevation = np.asarray(elevation)
+        cos_theta: np.ndarray = np.cos(elevation) * np.cos(azimuth)
+        theta: np.ndarray = np.arccos(cos_theta)
+        # Straight up or down when there is no azimuth, as in azel_to_thetaphi
+        phi: np.ndarray = np.where(
+            azimuth == 0,
+            np.pi / 2 * np.sign(elevation),
+            np.arctan2(np.tan(elevation), np.sin(azimuth)),
+        )
 
         return theta, phi
 
@@ -597,8 +830,33 @@ class RS_Positioner(Instrument):  # noqa: N801
                     theta in range [0,pi]
                     phi in range [0,2*pi]
         """
-        sin_elevation: float = np.sin(phi) * np.sin(theta)
-        elevation: float = np.arcsin(sin_elevation)
-        azimuth: float = np.arctan2(np.cos(phi) * np.sin(theta), np.cos(theta))
+        if isinstance(theta, np.ndarray) or isinstance(phi, np.ndarray):
+            return self.thetaphi_to_azel_vec(theta, phi)
+
+        # At boresight, or with no phi rotation, the result is known without trig.
+        if theta == 0.0:
+            return 0.0, 0.0
+
+        if phi == 0.0 and -math.pi <= theta <= math.pi:
+            return theta, 0.0
+
+        sin_theta: float = math.sin(theta)
+        elevation: float = math.asin(math.sin(phi) * sin_theta)
+        azimuth: float = math.atan2(math.cos(phi) * sin_theta, math.cos(theta))
+
+        return azimuth, elevation
+
+    def thetaphi_to_azel_vec(
+        self, theta: np.ndarray, phi: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Theta-Phi to Az-El conversion for arrays of angles.
+
+        :param theta: theta angles, in radians
+        :param phi: phi angles, in radians
+        :returns: Tuple of corresponding (azimuth, elevation) arrays, in radians
+        """
+        sin_theta: np.ndarray = np.sin(theta)
+        elevation: np.ndarray = np.arcsin(np.sin(phi) * sin_theta)
+        azimuth: np.ndarray = np.arctan2(np.cos(phi) * sin_theta, np.cos(theta))
 
         return azimuth, elevation
@@ -1,16 +1,26 @@
 """Instrument driver for DC310S Power Supply."""
 
+import time
 from typing import Optional
 from instrument_lib.instruments.instrument import SCPIInstrument
 from instrument_lib.utils.gpib_number import GPIBNumber
 
+# Parameterless commands, encoded once
+_CMD_ON = b"OUTPut 1"
+_CMD_OFF = b"OUTPut 0"
+_CMD_RST = b"*RST"
+
 
 class DC310S_PS(SCPIInstrument):  # noqa: N801
     """DC310S_PS class."""
 
-    ACCEPTED_MODELS = [
-        "DC310S",
-    ]
+    __slots__ = ("_measurement_cache", "_cache")
+
+    ACCEPTED_MODELS = frozenset(
+        {
+            "DC310S",
+        }
+    )
 
     def __init__(
         self,
@@ -21,6 +31,7 @@ class DC310S_PS(SCPIInstrument):  # noqa: N801
         simulate: bool = False,
         serial_instrument_port: str | int | None = None,
         serial_instrument_baudrate: int = 115200,
+        transport: str | None = None,
     ):
         """Constructor."""
         super().__init__(
@@ -31,87 +42,158 @@ class DC310S_PS(SCPIInstrument):  # noqa: N801
             simulate,
             serial_instrument_port,
             serial_instrument_baudrate,
+            transport,
         )
+        self._measurement_cache: tuple[float, tuple[float, float, float]] | None = None
+        # Setpoints only change through the set_* methods below, so they are cached on write
+        # and on first read. Use invalidate_cache after changing them from the front panel.
+        self._cache: dict[str, float] = {}
+
+    def invalidate_cache(self) -> None:
+        """Forget cached setpoints so the next get_* call queries the instrument again."""
+        self._cache.clear()
+
+    def reset(self) -> None:
+        """Reset instrument and forget cached setpoints."""
+        self._write_raw(_CMD_RST)
+        self.invalidate_cache()
+
+    def _query_setting(self, command: str) -> float:
+        """Queries a setpoint, returning the cached value if it is known.
+
+        :param command: Query command of the setpoint, also used as cache key.
+        :return: Setpoint value.
+        """
+        try:
+            return self._cache[command]
+        except KeyError:
+            value: float = self._query_float(command)
+            self._cache[command] = value
+            return value
 
     def on(self) -> None:
         """Turns power supply output on."""
-        self._write("OUTPut 1")
+        self._write_raw(_CMD_ON)
 
     def off(self) -> None:
         """Turns power supply output off."""
-        self._write("OUTPut 0")
+        self._write_raw(_CMD_OFF)
 
     def is_outputting_power(self) -> bool:
         """Checks if power supply is currently outputting power.
 
         :return: Output status of power supply, If power supply is active, returns 1.
         """
-        ps_status: str = self._query("OUTPUt?")
-        ps_status_bool: bool = bool(ps_status)
-        return ps_status_bool
+        return self._query_bool("OUTPUt?", cached=True)
+
+    def measure_all(self) -> tuple[float, float, float]:
+        """Queries voltage, current and power measured on the output terminal in one query.
+
+        The result is also kept as a snapshot that measure_voltage, measure_current and
+        measure_power can reuse through their max_age argument.
+
+        :return: Tuple of (voltage, current, power) measured on output terminal.
+        """
+        voltage, current, power = (
+            float(value)
+            for value in self._query_compound("MEASure:VOLTage?;:MEASure:CURRent?;:MEASure:POWer?")
+        )
+        self._measurement_cache = (time.monotonic(), (voltage, current, power))
+        return voltage, current, power
+
+    def _measure_cached(self, index: int, max_age: float) -> float:
+        """Returns one value of a measure_all snapshot no older than max_age seconds.
+
+        :param index: Index into the (voltage, current, power) tuple.
+        :param max_age: Maximum age of the snapshot in seconds, a new one is taken if older.
+        :return: Requested measured value.
+        """
+        cache = self._measurement_cache
+        if cache is not None and time.monotonic() - cache[0] <= max_age:
+            return cache[1][index]
+        return self.measure_all()[index]
 
-    def measure_voltage(self) -> float:
+    def measure_voltage(self, max_age: float = 0.0) -> float:
         """Queries the voltage measured on the output terminal of the channel.
 
+        :param max_age: If positive, reuse a measure_all snapshot up to this many seconds old.
         :return: Voltage measured on output terminal.
         """
-        voltage: str = self._query("MEASure:VOLTage?")
-        voltage_float: float = float(voltage)
-        return voltage_float
+        if max_age > 0:
+            return self._measure_cached(0, max_age)
 
-    def measure_current(self) -> float:
+        return self._query_float("MEASure:VOLTage?")
+
+    def measure_current(self, max_age: float = 0.0) -> float:
         """Query the current measured on the output terminal of the channel.
 
+        :param max_age: If positive, reuse a measure_all snapshot up to this many seconds old.
         :return: Current measured on output terminal.
         """
-        current: str = self._query("MEASure:CURRent?")
-        current_float: float = float(current)
-        return current_float
+        if max_age > 0:
+            return self._measure_cached(1, max_age)
+
+        return self._query_float("MEASure:CURRent?")
 
-    def measure_power(self) -> float:
+    def measure_power(self, max_age: float = 0.0) -> float:
         """Queries the power measured on the output terminal of the channel.
 
+        :param max_age: If positive, reuse a measure_all snapshot up to this many seconds old.
+        :return: Power measured on output terminal.
+        """
+        if max_age > 0:
+            return self._measure_cached(2, max_age)
+
+        return self._query_float("MEASure:POWer?")
+
+    async def measure_voltage_async(self) -> float:
+        """Async version of measure_voltage, for measuring several supplies concurrently.
+
+        :return: Voltage measured on output terminal.
+        """
+        return float(await self._query_async("MEASure:VOLTage?"))
+
+    async def measure_current_async(self) -> float:
+        """Async version of measure_current, for measuring several supplies concurrently.
+
+        :return: Current measured on output terminal.
+        """
+        return float(await self._query_async("MEASure:CURRent?"))
+
+    async def measure_power_async(self) -> float:
+        """Async version of measure_power, for measuring several supplies concurrently.
+
         :return: Power measured on output terminal.
         """
-        power: str = self._query("MEASure:POWer?")
-        power_float: float = float(power)
-        return power_float
+        return float(await self._query_async("MEASure:POWer?"))
 
     def get_voltage(self) -> float:
         """Queries voltage setting value of the channel.
 
         :return: Voltage setting value of channel.
         """
-        voltage: str = self._query("VOLTage?")
-        voltage_float: float = float(voltage)
-        return voltage_float
+        return self._query_setting("VOLTage?")
 
     def get_current(self) -> float:
         """Queries current setting value of the channel.
 
         :return: Current setting value of channel.
         """
-        current: str = self._query("CURRent?")
-        current_float: float = float(current)
-        return current_float
+        return self._query_setting("CURRent?")
 
     def get_voltage_limit(self) -> float:
         """Queries current voltage limit of the channel.
 
         :return: Current voltage limit of channel.
         """
-        voltage_limit: str = self._query("VOLTage:LIMit?")
-        voltange_limit_float: float = float(voltage_limit)
-        return voltange_limit_float
+        return self._query_setting("VOLTage:LIMit?")
 
     def get_current_limit(self) -> float:
         """Queries current current limit of channel.
 
         :return: Current current limit of channel.
         """
-        current_limit: str = self._query("CURRent:LIMit?")
-        current_limit_float: float = float(current_limit)
-        return current_limit_float
+        return self._query_setting("CURRent:LIMit?")
 
     def set_voltage(self, voltage: float) -> None:
         """Set voltage of channel.
@@ -119,6 +201,7 @@ class DC310S_PS(SCPIInstrument):  # noqa: N801
         :param voltage: The voltage value being set.
         """
         self._write(f"VOLTage {voltage}")
+        self._cache["VOLTage?"] = float(voltage)
 
     def set_current(self, current: float) -> None:
         """Set current of channel.
@@ -126,6 +209,7 @@ class DC310S_PS(SCPIInstrument):  # noqa: N801
         :param current: The current value being set.
         """
         self._write(f"CURRent {current}")
+        self._cache["CURRent?"] = float(current)
 
     def set_voltage_limit(self, voltage: float) -> None:
         """Set voltage limit of channel.
@@ -133,6 +217,7 @@ class DC310S_PS(SCPIInstrument):  # noqa: N801
         :param voltage: Voltage limit value being set.
         """
         self._write(f"VOLTage:LIMit {voltage}")
+        self._cache["VOLTage:LIMit?"] = float(voltage)
 
     def set_current_limit(self, current: float) -> None:
         """Set current limit of channel.
@@ -140,3 +225,4 @@ class DC310S_PS(SCPIInstrument):  # noqa: N801
         :param current: Current limit value being set.
         """
         self._write(f"CURRent:LIMit {current}")
+        self._cache["CURRent:LIMit?"] = float(current)
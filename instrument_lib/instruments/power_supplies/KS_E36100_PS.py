@@ -1,17 +1,44 @@
 """Instrument driver for E36102B_PS."""
 
-from typing import Optional
+import logging
+import re
+from typing import ClassVar, Optional
 from instrument_lib.utils import GPIBNumber
-from instrument_lib.instruments.instrument import SCPIInstrument
+from instrument_lib.instruments.instrument import SCPIInstrument, STB_ERROR_QUEUE
+
+logger = logging.getLogger(__name__)
+
+_ERROR_PATTERN = re.compile(r'([+-]?\d+),"([^"]*)"')
+
+# Parameterless commands, encoded once
+_CMD_ON = b"OUTPUT:STATE 1"
+_CMD_OFF = b"OUTPUT:STATE 0"
+_CMD_RWLOCK = b"SYSTem:RWLock"
+_CMD_LOCAL = b"SYSTem:LOCal"
+_CMD_OVP_ON = b"VOLTage:PROTection:STATe ON"
+_CMD_OVP_OFF = b"VOLTage:PROTection:STATe OFF"
+_CMD_OVP_CLEAR = b"VOLTage:PROTection:CLEar"
+_CMD_OCP_ON = b"CURRent:PROTection:STATe ON"
+_CMD_OCP_OFF = b"Current:PROTection:STATe OFF"
+_CMD_OCP_CLEAR = b"CURRent:PROTection:CLEar"
+_CMD_RST = b"*RST"
+_CMD_CLS = b"*CLS"
 
 
 class KS_E36100_PS(SCPIInstrument):  # noqa: N801
     """KS_E36100_PS class."""
 
-    ACCEPTED_MODELS = [
-        "E36102B",
-        "E36103B",
-    ]
+    __slots__ = ("rsinstrument",)
+
+    is_multichannel: ClassVar[bool] = False
+    supports_delay: ClassVar[bool] = False
+
+    ACCEPTED_MODELS = frozenset(
+        {
+            "E36102B",
+            "E36103B",
+        }
+    )
 
     def __init__(
         self,
@@ -19,20 +46,19 @@ class KS_E36100_PS(SCPIInstrument):  # noqa: N801
         ip_address: str | None = None,
         usb: tuple[str, str, str] | None = None,
         wireless: bool = False,
+        transport: str | None = None,
     ):
         """Constructor."""
         self.rsinstrument = False
-        super().__init__(gpib, ip_address, usb, wireless, False)
-        self.is_multichannel = False
-        self.supports_delay = False
+        super().__init__(gpib, ip_address, usb, wireless, False, transport=transport)
 
     def on(self, channel: str = "ALL") -> None:
         """Turn on."""
-        self._write("OUTPUT:STATE 1")
+        self._write_raw(_CMD_ON)
 
     def off(self, channel: str = "ALL") -> None:
         """Turn off."""
-        self._write("OUTPUT:STATE 0")
+        self._write_raw(_CMD_OFF)
 
     def set_voltage(self, voltage: float = 1.0, channel: int = 1) -> None:
         """Set voltage."""
@@ -51,31 +77,27 @@ class KS_E36100_PS(SCPIInstrument):  # noqa: N801
         Returns:
             Current draw in Amps.
         """
-        current: str = self._query("meas:curr?")
-        current_: float = float(current)
-        return current_
+        return self._query_float("meas:curr?")
 
     def get_voltage(self, channel: Optional[int]) -> float:
         """Get voltage."""
-        voltage: str = self._query("meas:volt?")
-        voltage_: float = float(voltage)
-        return voltage_
+        return self._query_float("meas:volt?")
 
     def lock_front_panel(self) -> None:
         """Locks front panel to prevent changing the device settings."""
-        self._write("SYSTem:RWLock")
+        self._write_raw(_CMD_RWLOCK)
 
     def unlock_front_panel(self) -> None:
         """Unlocks front panel to allow changing the device settings."""
-        self._write("SYSTem:LOCal")
+        self._write_raw(_CMD_LOCAL)
 
     def enable_ovp(self) -> None:
         """Enables OVP for the specified channel."""
-        self._write("VOLTage:PROTection:STATe ON")
+        self._write_raw(_CMD_OVP_ON)
 
     def disable_ovp(self) -> None:
         """Disables OVP for the specified channel."""
-        self._write("VOLTage:PROTection:STATe OFF")
+        self._write_raw(_CMD_OVP_OFF)
 
     def set_ovp(self, voltage: float) -> None:
         """Sets Over Voltage Protection on PS.
@@ -86,26 +108,26 @@ class KS_E36100_PS(SCPIInstrument):  # noqa: N801
 
     def clear_ovp(self) -> None:
         """Clears Over Voltage Protection."""
-        self._write("VOLTage:PROTection:CLEar")
+        self._write_raw(_CMD_OVP_CLEAR)
 
     def is_ovp_tripped(self) -> bool:
         """Determines if Over Voltage Protection is tripped.
 
         :return: True if OVP is tripped, False if not
         """
-        return bool(int(self._query("VOLTage:PROTection:TRIPped?")))
+        return self._query_bool("VOLTage:PROTection:TRIPped?", cached=True)
 
     def enable_ocp(self) -> None:
         """Enables Over Current Protection."""
-        self._write("CURRent:PROTection:STATe ON")
+        self._write_raw(_CMD_OCP_ON)
 
     def disable_ocp(self) -> None:
         """Disables Over Current Protection for the specified channel."""
-        self._write("Current:PROTection:STATe OFF")
+        self._write_raw(_CMD_OCP_OFF)
 
     def clear_ocp(self) -> None:
         """Clears Over Current Protection."""
-        self._write("CURRent:PROTection:CLEar")
+        self._write_raw(_CMD_OCP_CLEAR)
 
     def set_ocp_time(self, time: float | None) -> None:
         """Sets Over Current Protection time.
@@ -119,7 +141,7 @@ class KS_E36100_PS(SCPIInstrument):  # noqa: N801
 
         :return: True if OCP is tripped, False if not
         """
-        return bool(int(self._query("CURRent:PROTection:TRIPped?")))
+        return self._query_bool("CURRent:PROTection:TRIPped?", cached=True)
 
     def enable_voltage_sense(self, external: bool) -> None:
         """Enables voltage sense to internal if True else external.
@@ -130,31 +152,36 @@ class KS_E36100_PS(SCPIInstrument):  # noqa: N801
 
     def reset(self) -> None:
         """Reset the voltage of the power supply."""
-        self._write("*RST")
+        self._write_raw(_CMD_RST)
 
     def clear_error(self) -> None:
         """Clear errors."""
-        self._write("*CLS")
+        self._write_raw(_CMD_CLS)
 
     def is_error(self) -> float:
-        """Check the instrument to see if it has any errors in its queue."""
-        raw_error = ""
-        error_code: float = -1
-
-        while error_code != 0:
-            self._write("SYSTem:ERRor?; *OPC?")
-            raw_error = self._read()
-
-            error_parts = raw_error.split(",")
-            error_code = int(error_parts[0])
-            error_message = error_parts[1].rstrip("\n")
-            print(str(error_code))  # noqa: T201
-            if error_code != 0:
-                print(  # noqa: T201
-                    "INSTRUMENT ERROR - Error code: %d, error message: %s"
-                    % (error_code, error_message)
-                )
+        """Check the instrument to see if it has any errors in its queue.
+
+        The status byte is checked first, and only if it flags a non-empty queue is the
+        whole queue drained with a single SYSTem:ERRor:ALL? query.
+
+        :return: Code of the oldest queued error, 0 if the queue was empty.
+        """
+        if not self._read_status_byte() & STB_ERROR_QUEUE:
+            return 0
+
+        raw_errors: str = self._query("SYSTem:ERRor:ALL?")
+        error_code: float = 0
+        log_errors: bool = logger.isEnabledFor(logging.ERROR)
+
+        # The reply is a comma separated list of <code>,"<message>" pairs
+        for code, error_message in _ERROR_PATTERN.findall(raw_errors):
+            code_int: int = int(code)
+            if code_int != 0:
+                if log_errors:
+                    logger.error("INSTRUMENT ERROR - code %d: %s", code_int, error_message)
+                if error_code == 0:
+                    error_code = code_int
 
         # Clear the event status registers and empty the error queue
-        self._write("*CLS")
+        self._write_raw(_CMD_CLS)
         return error_code
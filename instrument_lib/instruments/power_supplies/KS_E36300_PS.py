@@ -1,17 +1,60 @@
 """Instrument driver for KS_E36300_PS."""
 
-from typing import Optional
-from instrument_lib.utils import GPIBNumber
-from instrument_lib.instruments.instrument import SCPIInstrument
+import logging
+import re
+from typing import ClassVar, Optional, Sequence
+
+import numpy as np
+
+from instrument_lib.utils import GPIBNumber, InstrumentError
+from instrument_lib.instruments.instrument import SCPIInstrument, STB_ERROR_QUEUE
+
+logger = logging.getLogger(__name__)
+
+_ERROR_PATTERN = re.compile(r'([+-]?\d+),"([^"]*)"')
+
+# Parameterless commands, encoded once
+_CMD_RWLOCK = b"SYSTem:RWLock"
+_CMD_LOCAL = b"SYSTem:LOCal"
+_CMD_RST = b"*RST"
+_CMD_CLS = b"*CLS"
+
+
+def _parse_values(response: str, count: int) -> np.ndarray:
+    """Parses the ',' separated response of a multi-channel query.
+
+    :param response: Query response.
+    :param count: Number of channels queried.
+    :raises InstrumentError: When the response does not hold one number per channel.
+    :return: Value of each channel.
+    """
+    try:
+        values: np.ndarray = np.array(response.split(","), dtype=float)
+    except ValueError as e:
+        raise InstrumentError(f"Unexpected measurement response: {response!r}") from e
+    if len(values) != count:
+        raise InstrumentError(f"Unexpected measurement response: {response!r}")
+
+    return values
 
 
 class KS_E36300_PS(SCPIInstrument):  # noqa: N801
     """KS_E36300_PS class."""
 
-    ACCEPTED_MODELS = [
-        "E36312A",
-        "E36231A",
-    ]
+    __slots__ = ("rsinstrument",)
+
+    is_multichannel: ClassVar[bool] = True
+    supports_delay: ClassVar[bool] = True
+
+    ACCEPTED_MODELS = frozenset(
+        {
+            "E36312A",
+            "E36231A",
+        }
+    )
+
+    # Channel-list suffixes of the supported channels, formatted once
+    _CH: dict[int | str, str] = {1: "(@1)", 2: "(@2)", 3: "(@3)", "ALL": "(@1:3)"}
 
     def __init__(
         self,
@@ -19,48 +62,45 @@ class KS_E36300_PS(SCPIInstrument):  # noqa: N801
         ip_address: str | None = None,
         usb: tuple[str, str, str] | None = None,
         wireless: bool = False,
+        transport: str | None = None,
     ):
         """Constructor."""
         self.rsinstrument = False
-        super().__init__(gpib, ip_address, usb, wireless, False)
-        self.is_multichannel = True
-        self.supports_delay = True
+        super().__init__(gpib, ip_address, usb, wireless, False, transport=transport)
+
+    def _ch(self, channel: int | str) -> str:
+        """Returns the SCPI channel list selecting channel.
+
+        :param channel: Channel number, or "ALL" for channels 1 to 3.
+        """
+        return self._CH.get(channel) or f"(@{channel})"
 
     def on(self, channel: str = "ALL") -> None:
         """Turn on."""
-        if channel == "ALL":
-            self._write("OUTPUT:STATE 1, (@1:3)")
-        elif channel == 1:
-            self._write("OUTPUT:STATE 1, (@1)")
-        elif channel == 2:
-            self._write("OUTPUT:STATE 1, (@2)")
-        elif channel == 3:
-            self._write("OUTPUT:STATE 1, (@3)")
-        else:
-            self._write("OUTPUT:STATE 1, (@%s)" % channel)
+        self._write(f"OUTPUT:STATE 1, {self._ch(channel)}")
 
     def off(self, channel: str = "ALL") -> None:
         """Turn off."""
-        if channel == "ALL":
-            self._write("OUTPUT:STATE 0, (@1:3)")
-        elif channel == 1:
-            self._write("OUTPUT:STATE 0, (@1)")
-        elif channel == 2:
-            self._write("OUTPUT:STATE 0, (@2)")
-        elif channel == 3:
-            self._write("OUTPUT:STATE 0, (@3)")
-        else:
-            self._write("OUTPUT:STATE 0, (@%s)" % channel)
+        self._write(f"OUTPUT:STATE 0, {self._ch(channel)}")
 
     def set_voltage(self, voltage: float = 1.0, channel: int = 1) -> None:
         """Set voltage."""
-        self._write("VOLT %f,(@%s)" % (voltage, channel))
+        self._write(f"VOLT {voltage:f},{self._ch(channel)}")
 
     def get_voltage(self, channel: int) -> float:
         """Get power supply voltage."""
-        current: str = self._query(f"meas:voltage? (@{channel})")
-        current_: float = float(current)
-        return current_
+        return self._query_float(f"meas:voltage? {self._ch(channel)}")
+
+    def set_voltages(self, voltages: dict[int, float]) -> None:
+        """Set the voltage of several channels with a single write.
+
+        :param voltages: Voltage to set, keyed by channel.
+        """
+        self._write(
+            ";:".join(
+                f"VOLT {voltage:f},{self._ch(channel)}" for channel, voltage in voltages.items()
+            )
+        )
 
     def set_current(
         self,
@@ -68,7 +108,7 @@ class KS_E36300_PS(SCPIInstrument):  # noqa: N801
         current: float = 0.5,
     ) -> None:
         """Set current."""
-        self._write("CURR %f,(@%s)" % (current, channel))
+        self._write(f"CURR {current:f},{self._ch(channel)}")
 
     def get_current(self, channel: int) -> float:
         """Read current draw from PS.
@@ -80,31 +120,52 @@ class KS_E36300_PS(SCPIInstrument):  # noqa: N801
             Current draw in Amps.
         """
         # Read Back the current from the power supply either in 6V mode or 25 V mode
-        current: str = self._query(f"meas:curr? (@{channel})")
-        current_: float = float(current)
-        return current_
+        return self._query_float(f"meas:curr? {self._ch(channel)}")
+
+    def get_currents(self, channels: Sequence[int] = (1, 2, 3)) -> list[float]:
+        """Read current draw of several channels with a single query.
+
+        :param channels: Channels to read from.
+        :return: Current draw in Amps, in the order of channels.
+        """
+        channel_list: str = ",".join(str(channel) for channel in channels)
+        return _parse_values(self._query(f"meas:curr? (@{channel_list})"), len(channels)).tolist()
+
+    def measure_all_currents(self) -> np.ndarray:
+        """Read current draw of all three channels with a single query.
+
+        :return: Current draw of channels 1 to 3 in Amps.
+        """
+        return _parse_values(self._query("meas:curr? (@1:3)"), 3)
+
+    def measure_all_voltages(self) -> np.ndarray:
+        """Read voltage of all three channels with a single query.
+
+        :return: Voltage of channels 1 to 3 in Volts.
+        """
+        return _parse_values(self._query("meas:voltage? (@1:3)"), 3)
 
     def lock_front_panel(self) -> None:
         """Locks front panel to prevent changing the device settings."""
-        self._write("SYSTem:RWLock")
+        self._write_raw(_CMD_RWLOCK)
 
     def unlock_front_panel(self) -> None:
         """Unlocks front panel to allow changing the device settings."""
-        self._write("SYSTem:LOCal")
+        self._write_raw(_CMD_LOCAL)
 
     def enable_ovp(self, channel: int = 1) -> None:
         """Enables OVP for the specified channel.
 
         :param channel: Channel to enable OVP for
         """
-        self._write(f"VOLTage:PROTection ON, (@{channel})")
+        self._write(f"VOLTage:PROTection ON, {self._ch(channel)}")
 
     def disable_ovp(self, channel: int = 1) -> None:
         """Disables OVP for the specified channel.
 
         :param channel: Channel to disable OVP for
         """
-        self._write(f"VOLTage:PROTection OFF, (@{channel})")
+        self._write(f"VOLTage:PROTection OFF, {self._ch(channel)}")
 
     def set_ovp(self, voltage: float, channel: int = 1) -> None:
         """Sets Over Voltage Protection on PS for the specified channel.
@@ -112,42 +173,42 @@ class KS_E36300_PS(SCPIInstrument):  # noqa: N801
         :param voltage: Voltage to set OVP to trigger at
         :param channel: Channel to set OVP for
         """
-        self._write(f"VOLTage:PROTection {voltage}, (@{channel})")
+        self._write(f"VOLTage:PROTection {voltage}, {self._ch(channel)}")
 
     def clear_ovp(self, channel: int = 1) -> None:
         """Clears Over Voltage Protection for specified channel.
 
         :param channel: Channel to clear OVP for
         """
-        self._write(f"VOLTage:PROTection:CLEar, (@{channel})")
+        self._write(f"VOLTage:PROTection:CLEar, {self._ch(channel)}")
 
     def is_ovp_tripped(self) -> bool:
         """Determines if Over Voltage Protection is tripped.
 
         :return: True if OVP is tripped, False if not
         """
-        return bool(int(self._query("VOLTage:PROTection:TRIPped?")))
+        return self._query_bool("VOLTage:PROTection:TRIPped?", cached=True)
 
     def enable_ocp(self, channel: int) -> None:
         """Enables Over Current Protection for the specified channel.
 
         :param channel: Channel to enable OCP for
         """
-        self._write(f"CURRent:PROTection:STATe ON, (@{channel})")
+        self._write(f"CURRent:PROTection:STATe ON, {self._ch(channel)}")
 
     def disable_ocp(self, channel: int) -> None:
         """Disables Over Current Protection for the specified channel.
 
         :param channel: Channel to disable OCP for
         """
-        self._write(f"Current:PROTection:STATe OFF, (@{channel})")
+        self._write(f"Current:PROTection:STATe OFF, {self._ch(channel)}")
 
     def clear_ocp(self, channel: int) -> None:
         """Clears Over Current Protection for the specified channel.
 
         :param channel: Channel to clear OCP for
         """
-        self._write(f"CURRent:PROTection:CLEar, (@{channel})")
+        self._write(f"CURRent:PROTection:CLEar, {self._ch(channel)}")
 
     def set_ocp_time(self, channel: int, time: float | None) -> None:
         """Sets Over Current Protection time for the specified channel.
@@ -155,16 +216,15 @@ class KS_E36300_PS(SCPIInstrument):  # noqa: N801
         :param channel: Channel to set OCP time for
         :param time: Time until triggering OCP, sets to Min if time is None
         """
-        self._write(
-            f"CURRent:PROTection:DELay {time if time is not None else 'MINimum'}, (@{channel})"
-        )
+        delay: float | str = time if time is not None else "MINimum"
+        self._write(f"CURRent:PROTection:DELay {delay}, {self._ch(channel)}")
 
     def is_ocp_tripped(self) -> bool:
         """Determines if Over Current Protection is tripped.
 
         :return: True if OCP is tripped, False if not
         """
-        return bool(int(self._query("CURRent:PROTection:TRIPped?")))
+        return self._query_bool("CURRent:PROTection:TRIPped?", cached=True)
 
     def enable_voltage_sense(self, channel: int, external: bool) -> None:
         """Enables voltage sense to internal if True else external.
@@ -172,7 +232,7 @@ class KS_E36300_PS(SCPIInstrument):  # noqa: N801
         :param channel: Channel to enable voltage sense for
         :param external: Flag for sense, external if True, internal if False
         """
-        self._write(f"VOLTage:SENSe {'EXTernal' if external else 'INTernal'}, (@{channel})")
+        self._write(f"VOLTage:SENSe {'EXTernal' if external else 'INTernal'}, {self._ch(channel)}")
 
     def set_turn_on_delay(self, channel: int, delay: float) -> None:
         """Sets turn on delay for the specified channel.
@@ -180,7 +240,7 @@ class KS_E36300_PS(SCPIInstrument):  # noqa: N801
         :param channel: Channel to set ramp up for
         :param delay: Time to delay turning on the specified channel
         """
-        self._write(f"OUTP:DEL:RISE {delay}, (@{channel})")
+        self._write(f"OUTP:DEL:RISE {delay}, {self._ch(channel)}")
 
     def set_turn_off_delay(self, channel: int, delay: float) -> None:
         """Sets turn off delay for the specified channel.
@@ -188,35 +248,40 @@ class KS_E36300_PS(SCPIInstrument):  # noqa: N801
         :param channel: Channel to set ramp downfor
         :param delay: Time to delay turning off the specified channel.
         """
-        self._write(f"OUTPUT:DEL:FALL {delay}, (@{channel})")
+        self._write(f"OUTPUT:DEL:FALL {delay}, {self._ch(channel)}")
 
     def reset(self) -> None:
         """Reset the voltage of the power supply."""
-        self._write("*RST")
+        self._write_raw(_CMD_RST)
 
     def clear_error(self) -> None:
         """Clear errors."""
-        self._write("*CLS")
+        self._write_raw(_CMD_CLS)
 
     def is_error(self) -> float:
-        """Check the instrument to see if it has any errors in its queue."""
-        raw_error = ""
-        error_code: float = -1
-
-        while error_code != 0:
-            self._write("SYSTem:ERRor?; *OPC?")
-            raw_error = self._read()
-
-            error_parts = raw_error.split(",")
-            error_code = int(error_parts[0])
-            error_message = error_parts[1].rstrip("\n")
-            print(str(error_code))  # noqa: T201
-            if error_code != 0:
-                print(  # noqa: T201
-                    "INSTRUMENT ERROR - Error code: %d, error message: %s"
-                    % (error_code, error_message)
-                )
+        """Check the instrument to see if it has any errors in its queue.
+
+        The status byte is checked first, and only if it flags a non-empty queue is the
+        whole queue drained with a single SYSTem:ERRor:ALL? query.
+
+        :return: Code of the oldest queued error, 0 if the queue was empty.
+        """
+        if not self._read_status_byte() & STB_ERROR_QUEUE:
+            return 0
+
+        raw_errors: str = self._query("SYSTem:ERRor:ALL?")
+        error_code: float = 0
+        log_errors: bool = logger.isEnabledFor(logging.ERROR)
+
+        # The reply is a comma separated list of <code>,"<message>" pairs
+        for code, error_message in _ERROR_PATTERN.findall(raw_errors):
+            code_int: int = int(code)
+            if code_int != 0:
+                if log_errors:
+                    logger.error("INSTRUMENT ERROR - code %d: %s", code_int, error_message)
+                if error_code == 0:
+                    error_code = code_int
 
         # Clear the event status registers and empty the error queue
-        self._write("*CLS")
+        self._write_raw(_CMD_CLS)
         return error_code
@@ -1,7 +1,9 @@
 """Instrument Driver for RS_PS_NGP800."""
 
-from typing import Dict, List, Optional, Union
-from instrument_lib.utils import GPIBNumber
+import functools
+import time
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, TypeVar, Union
+from instrument_lib.utils import GPIBNumber, InstrumentError
 from instrument_lib.instruments.instrument import SCPIInstrument
 
 
@@ -19,7 +21,7 @@ class SenseState:
 
     """
 
-    POSSIBLE_STATES: List[str] = ["AUTO", "EXT"]
+    POSSIBLE_STATES: FrozenSet[str] = frozenset({"AUTO", "EXT"})
 
     def __init__(self, state: str):
         """Constructor.
@@ -27,7 +29,7 @@ class SenseState:
         :param state: String for sensor state. Should be in ['AUTO', 'EXT']
         """
         if state not in self.POSSIBLE_STATES:
-            raise ValueError(f"Invalid state supplied. Must be in {self.POSSIBLE_STATES}")
+            raise ValueError(f"Invalid state supplied. Must be in {sorted(self.POSSIBLE_STATES)}")
 
         self.state: str = state
 
@@ -39,7 +41,7 @@ class SenseState:
 class Channel:
     """Utility class to represent channel state."""
 
-    POSSIBLE_CHANNELS = [1, 2, 3, 4]
+    POSSIBLE_CHANNELS: FrozenSet[int] = frozenset({1, 2, 3, 4})
 
     def __init__(self, channel: int):
         """Constructor.
@@ -47,7 +49,9 @@ class Channel:
         :param channel: int for channel state. Should be in [1, 2, 3, 4]
         """
         if channel not in self.POSSIBLE_CHANNELS:
-            raise ValueError(f"Invalid channel supplied. Must be in: {self.POSSIBLE_CHANNELS}")
+            raise ValueError(
+                f"Invalid channel supplied. Must be in: {sorted(self.POSSIBLE_CHANNELS)}"
+            )
 
         self.value: int = channel
 
@@ -63,33 +67,160 @@ class Channel:
 class VoltageSwitch:
     """Utility class to represent voltage switch."""
 
-    POSSIBLE_VOLTAGES: List[int] = [0, 1]
+    POSSIBLE_VOLTAGES: FrozenSet[int] = frozenset({0, 1})
 
     def __init__(self, voltage_switch: float):
         """Constructor.
 
         :param state: int for voltage switch state. Should be 0 or 1.
         """
-        if int(voltage_switch) not in self.POSSIBLE_VOLTAGES:
-            raise ValueError(f"Invalid channel supploed. Must be in: {self.POSSIBLE_VOLTAGES}")
+        state = int(voltage_switch)
+        if state not in self.POSSIBLE_VOLTAGES:
+            raise ValueError(
+                f"Invalid channel supploed. Must be in: {sorted(self.POSSIBLE_VOLTAGES)}"
+            )
 
-        self.state: int = int(voltage_switch)
+        self.state: int = state
 
     def __str__(self) -> str:
         """String representation."""
         return str(self.state)
 
 
+# The value classes above are never modified after construction, so one shared instance per
+# value is enough and saves re-running their validation on every use
+_channel: Callable[[int], Channel] = functools.lru_cache(maxsize=None)(Channel)
+_voltage_switch: Callable[[float], VoltageSwitch] = functools.lru_cache(maxsize=None)(
+    VoltageSwitch
+)
+_sense_state: Callable[[str], SenseState] = functools.lru_cache(maxsize=None)(SenseState)
+
+_T = TypeVar("_T")
+
+# Longest compound command sent in one write, kept well below typical SCPI input buffers
+MAX_COMMAND_LENGTH = 1024
+
+# Maximum age in seconds of a setting cached by its setter, after which it is queried again
+SETTINGS_CACHE_TTL = 1.0
+
+
+def _switch_state(value: str) -> int:
+    """Parses a 0/1 switch query response, validating it through VoltageSwitch."""
+    return _voltage_switch(int(value)).state
+
+
+def _nonnegative_current(value: Union[float, str]) -> float:
+    """Converts a current setting, rejecting negative values like set_current does."""
+    current = float(value)
+    if current < 0:
+        raise ValueError("Invalid current. Current must be nonnegative.")
+    return current
+
+
+def _channel_list(channels: List[int]) -> str:
+    """Formats channel numbers as a SCPI channel list body, using a range when contiguous.
+
+    :param channels: Ascending channel numbers.
+    :return: Channel list without the surrounding '(@' and ')'.
+    """
+    if len(channels) > 1 and channels[-1] - channels[0] == len(channels) - 1:
+        return f"{channels[0]}:{channels[-1]}"
+    return ",".join(str(channel) for channel in channels)
+
+
+# Settings key, command template and value converter of every setting written by
+# setup_machine, in the order the setters were called per channel
+_SETUP_COMMANDS: tuple[tuple[str, str, Callable[[Union[float, str]], object]], ...] = (
+    ("voltage", "VOLT {}, (@{})", float),
+    ("current", "CURR {}, (@{})", _nonnegative_current),
+    ("remote_sense", "VOLT:SENS:SOUR {} (@{})", lambda value: _sense_state(str(value))),
+    ("OVP_state", "VOLT:PROT {}, (@{})", lambda value: _voltage_switch(float(value))),
+    ("OVP_value", "VOLT:PROT:LEV {}, (@{})", float),
+    ("OCP_state", "FUSE {}, (@{})", lambda value: _voltage_switch(float(value))),
+    ("OCP_fuse_delay", "FUSE:DEL {}, (@{})", float),
+    ("OPP_state", "POW:PROT {}, (@{})", lambda value: _voltage_switch(float(value))),
+    ("OPP_value", "POW:PROT:LEV {}, (@{})", float),
+    ("upp_volt_limit", "VOLT:ALIM:UPP {}, (@{})", float),
+    ("upp_curr_limit", "CURR:ALIM:UPP {}, (@{})", float),
+    ("limit_state", "ALIM {}, (@{})", lambda value: _voltage_switch(float(value))),
+    ("out_del_state", "OUTP:DEL {}, (@{})", lambda value: _voltage_switch(float(value))),
+    ("delay_multiplier", "OUTP:DEL:DUR {},(@{})", float),
+)
+
+# Settings key, query header and response parser of every setting read by get_settings
+_SETTINGS_QUERIES: tuple[tuple[str, str, Callable[[str], Union[float, str]]], ...] = (
+    ("voltage", "VOLT?", float),
+    ("current", "CURR?", float),
+    ("remote_sense", "VOLT:SENS?", str.strip),
+    ("OVP_state", "VOLT:PROT?", _switch_state),
+    ("OVP_value", "VOLT:PROT:LEV?", float),
+    ("OCP_state", "FUSE?", _switch_state),
+    ("OCP_fuse_delay", "FUSE:DEL?", float),
+    ("OPP_state", "POW:PROT?", _switch_state),
+    ("OPP_value", "POW:PROT:LEV?", float),
+    ("upp_volt_limit", "VOLT:ALIM:UPP?", float),
+    ("upp_curr_limit", "CURR:ALIM:UPP?", float),
+    ("limit_state", "ALIM?", _switch_state),
+    ("out_del_state", "OUTP:DEL?", _switch_state),
+    ("delay_multiplier", "OUTP:DEL:DUR?", float),
+)
+
+
+def compile_setup(data_dict: Dict[int, Dict[str, Union[float, str]]]) -> tuple[str, ...]:
+    """Builds the commands applying the settings in data_dict, see RS_NGPx.setup_machine.
+
+    Channels sharing the same value for a setting are grouped into one channel list command.
+
+    :param data_dict: Dictionary of settings keyed by channel number.
+    :return: Commands in the order they have to be sent.
+    """
+    commands: List[str] = []
+    for key, template, convert in _SETUP_COMMANDS:
+        groups: Dict[str, List[int]] = {}
+        for i in sorted(Channel.POSSIBLE_CHANNELS):
+            groups.setdefault(str(convert(data_dict[i][key])), []).append(i)
+
+        for value, channels in groups.items():
+            commands.append(template.format(value, _channel_list(channels)))
+
+    return tuple(commands)
+
+
+def _settings_query(channel: Channel) -> str:
+    """Builds the compound query reading every setting of a channel, see _SETTINGS_QUERIES.
+
+    :param channel: Channel to read.
+    :return: Compound query.
+    """
+    return ";:".join(f"{query} (@{channel})" for _, query, _ in _SETTINGS_QUERIES)
+
+
+def _parse_settings(response: str) -> Dict[str, Union[float, str]]:
+    """Parses the response to a _settings_query.
+
+    :param response: ';' separated query response.
+    :raises InstrumentError: When the response does not hold one value per setting.
+    :return: Dictionary of settings of the channel.
+    """
+    values: List[str] = response.split(";")
+    if len(values) != len(_SETTINGS_QUERIES):
+        raise InstrumentError(f"Unexpected settings response: {response!r}")
+
+    return {key: parse(value) for (key, _, parse), value in zip(_SETTINGS_QUERIES, values)}
+
+
 class RS_NGPx(SCPIInstrument):  # noqa
     """Power Supply class for RS_PS_NGP800.
 
     All operations within this class can raise InstrumentError (or a subclass).
     """
 
-    ACCEPTED_MODELS = [
-        "NGP814",
-        "NGP804",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "NGP814",
+            "NGP804",
+        }
+    )
 
     DEFUALT_SENSE_STATE = SenseState("EXT")
 
@@ -114,92 +245,126 @@ class RS_NGPx(SCPIInstrument):  # noqa
         self.machine_id: int = machine_num
         self.retry = 100
         self.rsinstrument = True
+        self._cache: Dict[str, tuple[float, Any]] = {}
 
     def on(self, channel: Union[str, int] = "ALL") -> None:
         """Turn on power supply."""
-        if channel == "ALL":
-            self._write("OUTPUT:STATE 1, (@1:4)")
-        elif channel == 1:
-            self._write("OUTPUT:STATE 1, (@1)")
-        elif channel == 2:
-            self._write("OUTPUT:STATE 1, (@2)")
-        elif channel == 3:
-            self._write("OUTPUT:STATE 1, (@3)")
-        elif channel == 4:
-            self._write("OUTPUT:STATE 1, (@4)")
-        else:
-            self._write("OUTPUT:STATE 1, (@%s)" % channel)
+        channels: str = "1:4" if channel == "ALL" else str(channel)
+        self._write(f"OUTPUT:STATE 1, (@{channels})")
 
     def off(self, channel: Union[str, int] = "ALL") -> None:
         """Turn off power supply."""
-        if channel == "ALL":
-            self._write("OUTPUT:STATE 0, (@1:4)")
-        elif channel == 1:
-            self._write("OUTPUT:STATE 0, (@1)")
-        elif channel == 2:
-            self._write("OUTPUT:STATE 0, (@2)")
-        elif channel == 3:
-            self._write("OUTPUT:STATE 0, (@3)")
-        elif channel == 4:
-            self._write("OUTPUT:STATE 0, (@4)")
-        else:
-            self._write("OUTPUT:STATE 0, (@%s)" % channel)
+        channels: str = "1:4" if channel == "ALL" else str(channel)
+        self._write(f"OUTPUT:STATE 0, (@{channels})")
+        self.invalidate_cache()
 
     def reset(self) -> None:
         """Reset instrument."""
         self._write("*RST")
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """Forgets the cached settings, so the next get_* call queries the instrument.
+
+        Call this after changing settings from outside this driver, e.g. on the front panel.
+        """
+        self._cache.clear()
+
+    def _query_setting(self, query: str, parse: Callable[[str], _T]) -> _T:
+        """Queries a setting, returning the value cached by its setter if it is recent.
+
+        :param query: Query command of the setting, also used as cache key.
+        :param parse: Parser of the query response.
+        :return: Setting value.
+        """
+        entry = self._cache.get(query)
+        if entry is not None and time.monotonic() - entry[0] < SETTINGS_CACHE_TTL:
+            return entry[1]
 
-    def setup_machine(self, data_dict: Dict[int, Dict[str, Union[float, str]]]) -> None:
+        value = parse(self._query(query))
+        self._cache[query] = (time.monotonic(), value)
+        return value
+
+    def _store_setting(self, query: str, value: Union[float, int, str]) -> None:
+        """Caches a value just written, for _query_setting.
+
+        :param query: Query command of the setting.
+        :param value: Value of the setting, as the matching getter parses it.
+        """
+        self._cache[query] = (time.monotonic(), value)
+
+    def setup_machine(
+        self, data_dict: Dict[int, Dict[str, Union[float, str]]], sync: bool = False
+    ) -> None:
         """Helper function to setup machine according to settings in data_dict.
 
+        Channels sharing the same value for a setting are set with one channel list
+        command, and all commands are sent as a single compound write.
+
         :param data_dict: Dictionary of settings used to setup the machine.
+        :param sync: If True, block until the instrument has applied all settings.
         """
-        for i in range(1, 5):
-            self.set_voltage(channel=int(Channel(i)), voltage=float(data_dict[i]["voltage"]))
-            self.set_current(int(Channel(i)), float(data_dict[i]["current"]))
-            self.set_remote_sense(Channel(i), SenseState(str(data_dict[i]["remote_sense"])))
-            self.toggle_ovp_state(Channel(i), VoltageSwitch(float(data_dict[i]["OVP_state"])))
-            self.set_ovp_value(Channel(i), float(data_dict[i]["OVP_value"]))
-            self.toggle_ocp_state(Channel(i), VoltageSwitch(float(data_dict[i]["OCP_state"])))
-            self.set_ocp_delay(Channel(i), float(data_dict[i]["OCP_fuse_delay"]))
-            self.toggle_opp_state(Channel(i), VoltageSwitch(float(data_dict[i]["OPP_state"])))
-            self.set_opp_level(Channel(i), float(data_dict[i]["OPP_value"]))
-            self.set_upper_voltage_limit(Channel(i), float(data_dict[i]["upp_volt_limit"]))
-            self.set_upper_current_limit(Channel(i), float(data_dict[i]["upp_curr_limit"]))
-            self.set_limit_state(Channel(i), VoltageSwitch(float(data_dict[i]["limit_state"])))
-            self.toggle_output_delay_state(
-                Channel(i), VoltageSwitch(float(data_dict[i]["out_del_state"]))
-            )
-            self.toggle_output_delay_duration(Channel(i), float(data_dict[i]["delay_multiplier"]))
+        self.apply_setup_commands(compile_setup(data_dict), sync)
+
+    def apply_setup_commands(self, commands: Sequence[str], sync: bool = False) -> None:
+        """Sends commands built by compile_setup as a single compound write.
+
+        Use this with the precompiled POWER_PRESET_*_COMMANDS to skip building the commands.
+
+        :param commands: Commands returned by compile_setup.
+        :param sync: If True, block until the instrument has applied all settings, using a
+                     single *OPC? query after the write.
+        """
+        chunk_length = 0
+        with self.batch():
+            for command in commands:
+                # Start a new write before the compound command outgrows the input buffer
+                if chunk_length and chunk_length + len(command) + 2 > MAX_COMMAND_LENGTH:
+                    self._flush_batch()
+                    chunk_length = 0
+                self._write(command)
+                chunk_length += len(command) + 2
+        self.invalidate_cache()
+        if sync:
+            self._query("*OPC?")
+
+    def apply_preset(self, name: str, sync: bool = True) -> None:
+        """Applies one of the precompiled power presets.
+
+        :param name: Preset name, one of "preset1", "preset2" and "preset3".
+        :param sync: If True, block until the instrument has applied all settings.
+        :raises ValueError: When the preset name is unknown.
+        """
+        try:
+            commands: tuple[str, ...] = _PRESETS[name]
+        except KeyError:
+            raise ValueError(f"Unknown preset: {name}. Must be in: {sorted(_PRESETS)}") from None
+
+        self.apply_setup_commands(commands, sync)
 
     def get_settings(self) -> Dict[int, Dict[str, Union[float, str]]]:
         """Gets the settings currently used on the machine.
 
+        The settings of each channel are read with a single compound query.
+
         :return: Dictionary of settings.
         """
-        data_dict: Dict[int, Dict[str, Union[float, str]]] = {
-            1: {},
-            2: {},
-            3: {},
-            4: {},
+        return {
+            i: _parse_settings(self._query(_settings_query(_channel(i)))) for i in self.channels
+        }
+
+    async def get_settings_async(self) -> Dict[int, Dict[str, Union[float, str]]]:
+        """Async version of get_settings, for reading several supplies concurrently.
+
+        The channels of one supply are still read one after the other, as its queries are
+        serialized by _query_async.
+
+        :return: Dictionary of settings.
+        """
+        return {
+            i: _parse_settings(await self._query_async(_settings_query(_channel(i))))
+            for i in self.channels
         }
-        for i in range(1, 5):
-            data_dict[i]["voltage"] = self.get_voltage(int(Channel(i)))
-            data_dict[i]["current"] = self.get_current(int(Channel(i)))
-            data_dict[i]["remote_sense"] = self.get_remote_sense(Channel(i))
-            data_dict[i]["OVP_state"] = self.get_ovp_state(Channel(i)).state
-            data_dict[i]["OVP_value"] = self.get_ovp_value(Channel(i))
-            data_dict[i]["OCP_state"] = self.get_ocp_state(Channel(i)).state
-            data_dict[i]["OCP_fuse_delay"] = self.get_ocp_delay(Channel(i))
-            data_dict[i]["OPP_state"] = self.get_opp_state(Channel(i)).state
-            data_dict[i]["OPP_value"] = self.get_opp_level(Channel(i))
-            data_dict[i]["upp_volt_limit"] = self.get_upper_voltage_limit(Channel(i))
-            data_dict[i]["upp_curr_limit"] = self.get_upper_current_limit(Channel(i))
-            data_dict[i]["limit_state"] = self.get_limit_state(Channel(i)).state
-            data_dict[i]["out_del_state"] = self.get_output_delay_state(Channel(i)).state
-            data_dict[i]["delay_multiplier"] = self.get_output_delay_duration(Channel(i))
-
-        return data_dict
 
     def read_voltage(self, channel: Channel) -> float:
         """Queries the currently measured voltage of the selected channel.
@@ -211,6 +376,14 @@ class RS_NGPx(SCPIInstrument):  # noqa
         voltage: str = self._query(f"MEAS:VOLT? (@{channel})")
         return float(voltage)
 
+    def read_all_voltages(self) -> List[float]:
+        """Queries the currently measured voltage of every channel with a single query.
+
+        :return: The currently measured voltages, ordered by channel.
+        """
+        voltages: str = self._query(f"MEAS:VOLT? (@{_channel_list(self.channels)})")
+        return [float(value) for value in voltages.split(",")]
+
     def get_voltage(self, channel: int) -> float:
         """Queries the voltage value set for the selected channel.
 
@@ -218,8 +391,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: The set voltage value.
         """
-        voltage: str = self._query(f"VOLT? (@{channel})")
-        return float(voltage)
+        return self._query_setting(f"VOLT? (@{channel})", float)
 
     def set_voltage(self, voltage: float, channel: int) -> None:
         """Sets the voltage value of the selected channel.
@@ -229,6 +401,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         :param voltage: Numeric value to set voltage to.
         """
         self._write(f"VOLT {voltage}, (@{channel})")
+        self._store_setting(f"VOLT? (@{channel})", float(voltage))
 
     def read_current(self, channel: Channel) -> float:
         """Queries the currently measured current of the selected channel.
@@ -240,6 +413,14 @@ class RS_NGPx(SCPIInstrument):  # noqa
         current: str = self._query(f"MEAS:CURR? (@{channel})")
         return float(current)
 
+    def read_all_currents(self) -> List[float]:
+        """Queries the currently measured current of every channel with a single query.
+
+        :return: The currently measured currents, ordered by channel.
+        """
+        currents: str = self._query(f"MEAS:CURR? (@{_channel_list(self.channels)})")
+        return [float(value) for value in currents.split(",")]
+
     def get_current(self, channel: int) -> float:
         """Queries the Current value of the selected channel.
 
@@ -247,8 +428,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: The set current value.
         """
-        current: str = self._query(f"CURR? (@{channel})")
-        return float(current)
+        return self._query_setting(f"CURR? (@{channel})", float)
 
     def set_current(self, channel: int, current: float) -> None:
         """Sets the current value of the selected channel.
@@ -261,6 +441,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
             raise ValueError("Invalid current. Current must be nonnegative.")
 
         self._write(f"CURR {current}, (@{channel})")
+        self._store_setting(f"CURR? (@{channel})", float(current))
 
     def get_remote_sense(self, channel: Channel) -> str:
         """Queries the remote sense detection of the selected channel.
@@ -269,8 +450,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: 'AUTO' or 'EXT'
         """
-        sensor: str = self._query(f"VOLT:SENS? (@{channel})")
-        return sensor[:-1]
+        return self._query_setting(f"VOLT:SENS? (@{channel})", str.strip)
 
     def set_remote_sense(
         self, channel: Channel, sense_state: SenseState = DEFUALT_SENSE_STATE
@@ -282,6 +462,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         :param sense_state: Defaults to EXT.
         """
         self._write(f"VOLT:SENS:SOUR {sense_state} (@{channel})")
+        self._store_setting(f"VOLT:SENS? (@{channel})", str(sense_state))
 
     def toggle_ovp_state(self, channel: Channel, switch: VoltageSwitch) -> None:
         """Sets the OCP (Over Voltage Protection) of the selected channel.
@@ -292,6 +473,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
 
         """
         self._write(f"VOLT:PROT {switch}, (@{channel})")
+        self._store_setting(f"VOLT:PROT? (@{channel})", switch.state)
 
     def get_ovp_state(self, channel: Channel) -> VoltageSwitch:
         """Queries the OVP (Over Voltage Protection) of the selected channel.
@@ -300,8 +482,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: 1 is activated OVP, 0 is deactivated OVP
         """
-        ovp_state = self._query(f"VOLT:PROT? (@{channel})")
-        return VoltageSwitch(int(ovp_state))
+        return _voltage_switch(self._query_setting(f"VOLT:PROT? (@{channel})", int))
 
     def set_ovp_value(self, channel: Channel, voltage_protection_num: float) -> None:
         """Sets the OVP value of the selected channel.
@@ -311,6 +492,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         :param voltage_protection_num: The numeric value of the OVP will get set to.
         """
         self._write(f"VOLT:PROT:LEV {voltage_protection_num}, (@{channel})")
+        self._store_setting(f"VOLT:PROT:LEV? (@{channel})", float(voltage_protection_num))
 
     def get_ovp_value(self, channel: Channel) -> float:
         """Queries the OVP value of the selected channel.
@@ -319,8 +501,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: Numeric value of the OVP value in Volts.
         """
-        ovp_value: str = self._query(f"VOLT:PROT:LEV? (@{channel})")
-        return float(ovp_value)
+        return self._query_setting(f"VOLT:PROT:LEV? (@{channel})", float)
 
     def toggle_ocp_state(self, channel: Channel, switch: VoltageSwitch) -> None:
         """Sets the OCP (Over Current Protection) state of the selected channel.
@@ -330,6 +511,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         :param switch: Value of 1 will activate OCP, value of 0 will deactivate it.
         """
         self._write(f"FUSE {switch}, (@{channel})")
+        self._store_setting(f"FUSE? (@{channel})", switch.state)
 
     def get_ocp_state(self, channel: Channel) -> VoltageSwitch:
         """Queries the OCP state of the selected channel.
@@ -338,8 +520,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: 1 is activated OCP, 0 is deactivated OCP.
         """
-        ocp_state = self._query(f"FUSE? (@{channel})")
-        return VoltageSwitch(int(ocp_state))
+        return _voltage_switch(self._query_setting(f"FUSE? (@{channel})", int))
 
     def set_ocp_delay(self, channel: Channel, delay_time: float) -> None:
         """Sets the OCP delay time of the selected channel.
@@ -349,6 +530,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         :param delay_time: The numeric fuse delay time value.
         """
         self._write(f"FUSE:DEL {delay_time}, (@{channel})")
+        self._store_setting(f"FUSE:DEL? (@{channel})", float(delay_time))
 
     def get_ocp_delay(self, channel: Channel) -> float:
         """Queries the fuse deflay time at the selected channel.
@@ -357,8 +539,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: Numeric value for the set fuse delay time.
         """
-        ocp_delay: str = self._query(f"FUSE:DEL? (@{channel})")
-        return float(ocp_delay)
+        return self._query_setting(f"FUSE:DEL? (@{channel})", float)
 
     def toggle_opp_state(self, channel: Channel, switch: VoltageSwitch) -> None:
         """Sets the OPP (Over Power Protection) state of the selected channel.
@@ -368,6 +549,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         :param switch: 1 will activate OPP, 0 will deactivate OPP
         """
         self._write(f"POW:PROT {switch}, (@{channel})")
+        self._store_setting(f"POW:PROT? (@{channel})", switch.state)
 
     def get_opp_state(self, channel: Channel) -> VoltageSwitch:
         """Queries the OPP state of the selected channel.
@@ -376,8 +558,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: 1 is activated OPP, 0 is deactivated OPP
         """
-        opp_state: str = self._query(f"POW:PROT? (@{channel})")
-        return VoltageSwitch(int(opp_state))
+        return _voltage_switch(self._query_setting(f"POW:PROT? (@{channel})", int))
 
     def set_opp_level(self, channel: Channel, power_protection_num: float) -> None:
         """Sets the OPP value of the selected channel.
@@ -388,6 +569,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         """
         # TODO: Should we check for valid power_protection_num?
         self._write(f"POW:PROT:LEV {power_protection_num}, (@{channel})")
+        self._store_setting(f"POW:PROT:LEV? (@{channel})", float(power_protection_num))
 
     def get_opp_level(self, channel: Channel) -> float:
         """Queries the OPP value of the selected channel.
@@ -396,8 +578,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: Numeric value of the power protection level in Watts.
         """
-        opp_power_level: str = self._query(f"POW:PROT:LEV? (@{channel})")
-        return float(opp_power_level)
+        return self._query_setting(f"POW:PROT:LEV? (@{channel})", float)
 
     def set_upper_voltage_limit(self, channel: Channel, voltage: float) -> None:
         """Sets the upper safety limit for voltage of the selected channel.
@@ -408,6 +589,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         """
         # TODO: Should we check for valid voltage_num?
         self._write(f"VOLT:ALIM:UPP {voltage}, (@{channel})")
+        self._store_setting(f"VOLT:ALIM:UPP? (@{channel})", float(voltage))
 
     def get_upper_voltage_limit(self, channel: Channel) -> float:
         """Queries the upper safety limit for voltage of the selected channel.
@@ -416,8 +598,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: Numeric value for upper safety voltage limit in Volts.
         """
-        voltage_limit: str = self._query(f"VOLT:ALIM:UPP? (@{channel})")
-        return float(voltage_limit)
+        return self._query_setting(f"VOLT:ALIM:UPP? (@{channel})", float)
 
     def set_limit_state(self, channel: Channel, switch: VoltageSwitch) -> None:
         """Sets the safety limit state.
@@ -427,6 +608,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         :param switch: 1 will activate the safety limit, 0 deactivates the safety limit.
         """
         self._write(f"ALIM {switch}, (@{channel})")
+        self._store_setting(f"ALIM? (@{channel})", switch.state)
 
     def get_limit_state(self, channel: Channel) -> VoltageSwitch:
         """Gets the safety limit state.
@@ -435,8 +617,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :param switch: 1 is active safety limit, 0 is deactivate safety limit.
         """
-        state_val: str = self._query(f"ALIM? (@{channel})")
-        return VoltageSwitch(int(state_val))
+        return _voltage_switch(self._query_setting(f"ALIM? (@{channel})", int))
 
     def set_upper_current_limit(self, channel: Channel, current: float) -> None:
         """Sets the upper safety limit for current of the selected channel.
@@ -447,6 +628,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         """
         # TODO: Should we validate current?
         self._write(f"CURR:ALIM:UPP {current}, (@{channel})")
+        self._store_setting(f"CURR:ALIM:UPP? (@{channel})", float(current))
 
     def get_upper_current_limit(self, channel: Channel) -> float:
         """Gets the value of the upper safety limit for current of the selected channel.
@@ -455,8 +637,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: Numeric current value for upper safety limit.
         """
-        current_limit: str = self._query(f"CURR:ALIM:UPP? (@{channel})")
-        return float(current_limit)
+        return self._query_setting(f"CURR:ALIM:UPP? (@{channel})", float)
 
     def toggle_channel_output_state(self, channel: Channel, switch: VoltageSwitch) -> None:
         """Sets the output state of the selected channel.
@@ -475,7 +656,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         :return: 1 is active output for selected channel, 0 is deactivated output for channel.
         """
         output: str = self._query(f"OUTP:SEL? (@{channel})")
-        return VoltageSwitch(int(output))
+        return _voltage_switch(int(output))
 
     def toggle_output_delay_state(self, channel: Channel, switch: VoltageSwitch) -> None:
         """Sets the output delay state of the selected channel.
@@ -485,6 +666,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         :param switch: 1 will activate output delay, 0 will deactivate output delay.
         """
         self._write(f"OUTP:DEL {switch}, (@{channel})")
+        self._store_setting(f"OUTP:DEL? (@{channel})", switch.state)
 
     def get_output_delay_state(self, channel: Channel) -> VoltageSwitch:
         """Queries the output delay state of the selected channel.
@@ -493,8 +675,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: 1 is active output delay, 0 is deactivated output delay.
         """
-        output: str = self._query(f"OUTP:DEL? (@{channel})")
-        return VoltageSwitch(int(output))
+        return _voltage_switch(self._query_setting(f"OUTP:DEL? (@{channel})", int))
 
     def toggle_output_delay_duration(self, channel: Channel, time_delay: float) -> None:
         """Sets the duration for output delay of the selected channel.
@@ -504,6 +685,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
         :param time_delay: Numeric value of the duration in seconds.
         """
         self._write(f"OUTP:DEL:DUR {time_delay},(@{channel})")
+        self._store_setting(f"OUTP:DEL:DUR? (@{channel})", float(time_delay))
 
     def get_output_delay_duration(self, channel: Channel) -> float:
         """Queries the duration for output delay of the selected channel.
@@ -512,8 +694,7 @@ class RS_NGPx(SCPIInstrument):  # noqa
                                 currently measured voltage gets queried from.
         :return: Numeric value of the duration in seconds.
         """
-        output: str = self._query(f"OUTP:DEL:DUR? (@{channel})")
-        return float(output)
+        return self._query_setting(f"OUTP:DEL:DUR? (@{channel})", float)
 
     def toggle_master_output_state(self, switch: VoltageSwitch) -> None:
         """Sets the master output state (output button on machine).
@@ -529,11 +710,11 @@ class RS_NGPx(SCPIInstrument):  # noqa
         :return: 1 will activate the master switch, 0 will deactivate it.
         """
         output: str = self._query("OUTP:GEN?")
-        return VoltageSwitch(int(output))
+        return _voltage_switch(int(output))
 
 
-POWER_PRESET_1: Dict[str, Dict[str, Union[float, str]]] = {
-    "1": {
+POWER_PRESET_1: Dict[int, Dict[str, Union[float, str]]] = {
+    1: {
         "voltage": 1,
         "current": 20,
         "limit_state": 1,
@@ -549,7 +730,7 @@ POWER_PRESET_1: Dict[str, Dict[str, Union[float, str]]] = {
         "out_del_state": 1,
         "delay_multiplier": 0.1,
     },
-    "2": {
+    2: {
         "voltage": 1.7,
         "current": 5,
         "limit_state": 1,
@@ -565,7 +746,7 @@ POWER_PRESET_1: Dict[str, Dict[str, Union[float, str]]] = {
         "out_del_state": 1,
         "delay_multiplier": 0.1,
     },
-    "3": {
+    3: {
         "voltage": 3.3,
         "current": 3,
         "limit_state": 1,
@@ -581,7 +762,7 @@ POWER_PRESET_1: Dict[str, Dict[str, Union[float, str]]] = {
         "out_del_state": 1,
         "delay_multiplier": 0.1,
     },
-    "4": {
+    4: {
         "voltage": 24,
         "current": 4,
         "limit_state": 1,
@@ -599,8 +780,8 @@ POWER_PRESET_1: Dict[str, Dict[str, Union[float, str]]] = {
     },
 }
 
-POWER_PRESET_2: Dict[str, Dict[str, Union[float, str]]] = {
-    "1": {
+POWER_PRESET_2: Dict[int, Dict[str, Union[float, str]]] = {
+    1: {
         "voltage": 1,
         "current": 20,
         "limit_state": 1,
@@ -616,7 +797,7 @@ POWER_PRESET_2: Dict[str, Dict[str, Union[float, str]]] = {
         "out_del_state": 1,
         "delay_multiplier": 0.1,
     },
-    "2": {
+    2: {
         "voltage": 1.7,
         "current": 5,
         "limit_state": 1,
@@ -632,7 +813,7 @@ POWER_PRESET_2: Dict[str, Dict[str, Union[float, str]]] = {
         "out_del_state": 1,
         "delay_multiplier": 0.1,
     },
-    "3": {
+    3: {
         "voltage": 3.3,
         "current": 3,
         "limit_state": 1,
@@ -648,7 +829,7 @@ POWER_PRESET_2: Dict[str, Dict[str, Union[float, str]]] = {
         "out_del_state": 1,
         "delay_multiplier": 0.1,
     },
-    "4": {
+    4: {
         "voltage": 14,
         "current": 2,
         "limit_state": 1,
@@ -666,8 +847,8 @@ POWER_PRESET_2: Dict[str, Dict[str, Union[float, str]]] = {
     },
 }
 
-POWER_PRESET_3: Dict[str, Dict[str, Union[float, str]]] = {
-    "1": {
+POWER_PRESET_3: Dict[int, Dict[str, Union[float, str]]] = {
+    1: {
         "voltage": 1,
         "current": 15,
         "limit_state": 1,
@@ -683,7 +864,7 @@ POWER_PRESET_3: Dict[str, Dict[str, Union[float, str]]] = {
         "out_del_state": 1,
         "delay_multiplier": 0.1,
     },
-    "2": {
+    2: {
         "voltage": 1,
         "current": 15,
         "limit_state": 1,
@@ -699,7 +880,7 @@ POWER_PRESET_3: Dict[str, Dict[str, Union[float, str]]] = {
         "out_del_state": 1,
         "delay_multiplier": 0.1,
     },
-    "3": {
+    3: {
         "voltage": 1.7,
         "current": 5,
         "limit_state": 1,
@@ -715,7 +896,7 @@ POWER_PRESET_3: Dict[str, Dict[str, Union[float, str]]] = {
         "out_del_state": 1,
         "delay_multiplier": 0.1,
     },
-    "4": {
+    4: {
         "voltage": 3.3,
         "current": 2,
         "limit_state": 1,
@@ -732,3 +913,14 @@ POWER_PRESET_3: Dict[str, Dict[str, Union[float, str]]] = {
         "delay_multiplier": 0.1,
     },
 }
+
+# Presets compiled once at import, for RS_NGPx.apply_setup_commands
+POWER_PRESET_1_COMMANDS: tuple[str, ...] = compile_setup(POWER_PRESET_1)
+POWER_PRESET_2_COMMANDS: tuple[str, ...] = compile_setup(POWER_PRESET_2)
+POWER_PRESET_3_COMMANDS: tuple[str, ...] = compile_setup(POWER_PRESET_3)
+
+_PRESETS: Dict[str, tuple[str, ...]] = {
+    "preset1": POWER_PRESET_1_COMMANDS,
+    "preset2": POWER_PRESET_2_COMMANDS,
+    "preset3": POWER_PRESET_3_COMMANDS,
+}
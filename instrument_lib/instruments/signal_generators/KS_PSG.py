@@ -13,11 +13,13 @@ class KS_PSG(SCPIInstrument):
     All operations within this class can raise InstrumentError (or a subclass).
     """
 
-    ACCEPTED_MODELS = [
-        "E8257D",
-        "E8267D",
-        "E8663D",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "E8257D",
+            "E8267D",
+            "E8663D",
+        }
+    )
 
     DEFAULT_SELECTION_STATE = SelectionState(False)
 
@@ -54,7 +56,7 @@ class KS_PSG(SCPIInstrument):
         :param freq: Signal frequency in Hz. Defaults to 30e9.
         :param source: Input source number. Defaults to 1.
         """
-        self._write(f":FREQ:CW {freq} HZ")
+        self._write_setting("freq", freq, f":FREQ:CW {freq} HZ")
         self.freq = freq
 
     def get_freq(self) -> float:
@@ -71,7 +73,7 @@ class KS_PSG(SCPIInstrument):
 
         :param amplitude: Amplitude (power level.) Defaults to -20.
         """
-        self._write(f":POW:AMPL {amplitude} dBm")
+        self._write_setting("amplitude", amplitude, f":POW:AMPL {amplitude} dBm")
         self.power = amplitude
 
     def get_amplitude(self) -> float:
@@ -13,9 +13,11 @@ class RS_SMx(SCPIInstrument):  # noqa
     All operations within this class can raise InstrumentError (or a subclass).
     """
 
-    ACCEPTED_MODELS = [
-        "SMW200A",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "SMW200A",
+        }
+    )
 
     DEFAULT_SELECTION_STATE = SelectionState(False)
 
@@ -26,6 +28,7 @@ class RS_SMx(SCPIInstrument):  # noqa
         usb: tuple[str, str, str] | None = None,
         wireless: bool = False,
         simulate: bool = False,
+        transport: str | None = None,
     ):
         """Constructor.
 
@@ -33,8 +36,10 @@ class RS_SMx(SCPIInstrument):  # noqa
         :param ip_address: IP Address as string.
         :param wireless: Flag for wireless instrument.
         :param simulate: Flag to simulate in instrument.
+        :param transport: LAN transport, "hislip" or "socket" (raw SCPI on port 5025).
+                          Defaults to VXI-11 when None.
         """
-        super().__init__(gpib, ip_address, usb, wireless, simulate)
+        super().__init__(gpib, ip_address, usb, wireless, simulate, transport=transport)
         self.freq: float = 0
         self.power: float = 0
         self.rsinstrument = True
@@ -45,10 +50,11 @@ class RS_SMx(SCPIInstrument):  # noqa
 
     def reset(self) -> None:
         """Reset signal generator."""
-        self._write("*CLS")
-        self._write(":SYST:DISP:UPD ON")
-        self._write("*RST")
-        self._write(":INIT:CONT OFF")
+        with self.batch():
+            self._write("*CLS")
+            self._write(":SYST:DISP:UPD ON")
+            self._write("*RST")
+            self._write(":INIT:CONT OFF")
 
     def load_waveform(self, waveform: str, source: int = 1) -> None:
         """Load ARB Waveform (Arbitrary).
@@ -56,9 +62,9 @@ class RS_SMx(SCPIInstrument):  # noqa
         :param waveform: Path to waveform file.
         :param source: Input source number. Defaults to 1.
         """
-        self._write(f'SOURce{source}:BB::ARBitrary:WAVeform:SELect "{waveform}"')
-        self._write(f"SOURce{source}:BB:ARBitrary:STATe 1")
-        self._write(f"SOURce{source}:BB:ARBitrary:STATe 1")
+        with self.batch():
+            self._write(f'SOURce{source}:BB::ARBitrary:WAVeform:SELect "{waveform}"')
+            self._write(f"SOURce{source}:BB:ARBitrary:STATe 1")
 
     def load_5gnr_model(self, waveform: str, source: int = 1) -> None:
         """Load 5G NR Test model.
@@ -67,9 +73,10 @@ class RS_SMx(SCPIInstrument):  # noqa
             waveform: Test model filename.
             source: Source input number. Defaults to 1.
         """
-        self._write(f'SOURce{source}:BB:NR5G:SETTing:TMODel:DL "{waveform}"')
-        self._write(f"SOURce{source}:BB:NR5G:STATe 0")
-        self._write(f"SOURce{source}:BB:NR5G:STATe 1")
+        with self.batch():
+            self._write(f'SOURce{source}:BB:NR5G:SETTing:TMODel:DL "{waveform}"')
+            self._write(f"SOURce{source}:BB:NR5G:STATe 0")
+            self._write(f"SOURce{source}:BB:NR5G:STATe 1")
 
     def set_phase_compensation(self, phase_compensation_frequency: float, source: int = 1) -> None:
         """Set Phase compensation frequency for reference.
@@ -78,8 +85,9 @@ class RS_SMx(SCPIInstrument):  # noqa
             phase_compensation_frequency: Frequency in Hertz (Hz)
             source: Source input number. Defaults to 1.
         """
-        self._write(f"SOURce{source}:BB:NR5G:NODE:RFPHase:MODE MAN")
-        self._write(f"SOURce{source}:BB:NR5G:NODE:CELL0:PCFReq {phase_compensation_frequency}")
+        with self.batch():
+            self._write(f"SOURce{source}:BB:NR5G:NODE:RFPHase:MODE MAN")
+            self._write(f"SOURce{source}:BB:NR5G:NODE:CELL0:PCFReq {phase_compensation_frequency}")
 
     def set_freq(self, freq: float = 3e9, source: int = 1) -> None:
         """Sets the center frequency.
@@ -87,7 +95,7 @@ class RS_SMx(SCPIInstrument):  # noqa
         :param freq: Signal frequency in Hz. Defaults to 3e9.
         :param source: Input source number. Defaults to 1.
         """
-        self._write(f":SOURce{source}:FREQuency {freq} HZ")
+        self._write_setting(f"freq{source}", freq, f":SOURce{source}:FREQuency {freq} HZ")
         self.freq = freq
 
     def get_freq(self) -> float:
@@ -133,7 +141,9 @@ class RS_SMx(SCPIInstrument):  # noqa
         :param power: Power level in dbm. Defaults to -30.
         :param source: Input source number. Defaults to 1.
         """
-        self._write(f":SOURce{source}:POWer:Immediate:AMPLitude {power}")
+        self._write_setting(
+            f"power{source}", power, f":SOURce{source}:POWer:Immediate:AMPLitude {power}"
+        )
         self.power = power
 
     def set_reference_power_level(self, reference_level: float = 0) -> None:
@@ -170,9 +180,9 @@ class RS_SMx(SCPIInstrument):  # noqa
         :param witdh: [description]. Defaults to 1.
         :param source: Input source number. Defaults to 1.
         """
-        self._write(f"OUTPut{source}USER6:SIGNal HIGH")
+        self.set_trigger_high(source)
         sleep(width)  # TODO: Find alternative to sleep.
-        self._write(f"OUTPut{source}:USER6:SIGNal LOW")
+        self.set_trigger_low(source)
 
     def set_trigger_high(self, source: int = 1) -> None:
         """Sets trigger high.
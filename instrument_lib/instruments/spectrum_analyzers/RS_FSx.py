@@ -1,16 +1,63 @@
 """Instrument Driver for RS_FSx."""
 
+import functools
 import logging
 from time import sleep
-from typing import Any, Optional, Tuple, Union, Callable
+from typing import Optional, Tuple, Callable
 
-from instrument_lib.utils import InputSelection, SelectionState
+import pyvisa
+from RsInstrument import TimeoutException
+
+from instrument_lib.utils import InputSelection, InstrumentError, SelectionState
 from instrument_lib.utils import GPIBNumber
 from instrument_lib.instruments.instrument import SCPIInstrument
 
 
 logger = logging.getLogger(__name__)
 
+# Integration ranges of the LO phase noise tab: number, evaluated trace (None keeps the
+# default), start and stop offset in Hz.
+LO_PNO_EVAL_RANGES: tuple[tuple[int, Optional[str], int, int], ...] = (
+    (1, None, 12000, 20000000),
+    (2, "TRACE1", 12000, 200000000),
+    (3, "TRACE1", 12000, 400000000),
+)
+# Offsets in Hz of the spot noise markers 1 to 6 of the LO phase noise tab.
+LO_PNO_SPOT_OFFSETS: tuple[int, ...] = (12000, 100000, 1000000, 10000000, 100000000, 200000000)
+
+# How long get_freq_fswp and get_power_fswp reuse a reply, so live plots polling them at
+# tens of Hz do not query the instrument every time. Any write drops the cached replies.
+POLL_CACHE_TTL: float = 0.025
+
+# I/O timeout in ms while get_exact_peak waits on *OPC? for a zoom step's single sweep. The
+# narrow spans need long sweeps, which would outlast a typical session timeout.
+EXACT_PEAK_SWEEP_TIMEOUT: float = 30000
+
+RETRY_DELAY_MIN: float = 0.05
+RETRY_DELAY_MAX: float = 1.0
+RETRY_ERRORS = (pyvisa.VisaIOError, TimeoutException, InstrumentError)
+
+
+def retry_on_failure(function: Callable) -> Callable:
+    """Retries function up to self.retry times on communication errors, with exponential backoff.
+
+    Any other exception is raised immediately, and the last communication error is re-raised
+    once all retries are exhausted.
+    """
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):  # noqa
+        for attempt in range(self.retry + 1):
+            try:
+                return function(self, *args, **kwargs)
+            except RETRY_ERRORS as e:
+                if attempt >= self.retry:
+                    raise
+                logger.debug(f"{function.__name__} failed ({e!r}), retrying.")
+                sleep(min(RETRY_DELAY_MIN * 2**attempt, RETRY_DELAY_MAX))
+
+    return wrapper
+
 
 class RS_FSx(SCPIInstrument):  # noqa
     """Spectrum Analyzer class for RS_FSx.
@@ -18,12 +65,14 @@ class RS_FSx(SCPIInstrument):  # noqa
     All operations within this class can raise InstrumentError (or a subclass).
     """
 
-    ACCEPTED_MODELS = [
-        "FSW-85",
-        "FSW-67",
-        "FSWP-26",
-        "FSVA3050",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "FSW-85",
+            "FSW-67",
+            "FSWP-26",
+            "FSVA3050",
+        }
+    )
 
     DEFAULT_SELECTION_STATE = SelectionState(False)
     INPUT_1 = InputSelection(1)
@@ -37,6 +86,7 @@ class RS_FSx(SCPIInstrument):  # noqa
         wireless: bool = False,
         simulate: bool = False,
         retry: int = 10,
+        transport: str | None = None,
     ):
         """Constructor.
 
@@ -45,28 +95,31 @@ class RS_FSx(SCPIInstrument):  # noqa
         :param wireless: Flag for wireless instrument.
         :param simulate: Flag to simulate in instrument.
         :param retry: Number of times to retry certain commands.
+        :param transport: LAN transport, "hislip" or "socket" (raw SCPI on port 5025).
+                          Defaults to VXI-11 when None.
         """
         self.simulate = simulate
         self.rsinstrument = True
         self.retry: int = retry
-        super().__init__(gpib, ip_address, usb, wireless, simulate)
+        super().__init__(gpib, ip_address, usb, wireless, simulate, transport=transport)
+        if simulate:
+            self._install_sim_methods()
 
     def __str__(self) -> str:
         """String representation of this class."""
         return "Spectrum Analyzer: RS_FSx"
 
-    def retry_on_failure(function: Callable) -> Callable:  # type: ignore # noqa
-        """Docstring."""
+    def _install_sim_methods(self) -> None:
+        """Replaces the measurement getters with ones returning zeros, for simulated instruments.
 
-        def wrapper(self, *args: int, **kwargs: int) -> None:  # noqa
-            failures: int = 0
-            while failures <= self.retry:
-                try:
-                    return function(self, *args, **kwargs)
-                except Exception:
-                    failures += 1
-
-        return wrapper
+        Done once at construction so the real getters do not check self.simulate on every call.
+        """
+        self.get_peak = lambda: (0.0, 0.0)  # type: ignore
+        self.get_y = lambda: 0.0  # type: ignore
+        self.get_x = lambda: 0.0  # type: ignore
+        self.get_channel_power = lambda: 0.0  # type: ignore
+        self.get_evm = lambda: 0.0  # type: ignore
+        self.get_evm_power = lambda: 0.0  # type: ignore
 
     def display(self, select: SelectionState = DEFAULT_SELECTION_STATE) -> None:
         """Toggle Display on/off while remote.
@@ -88,7 +141,7 @@ class RS_FSx(SCPIInstrument):  # noqa
             freq: Frequency in Hertz (Hz). Defaults to 30e9.
         """
         logger.info(f"Setting center frequency to {freq} Hz")
-        self._write(f":FREQuency:CENT {freq} HZ")
+        self._write_setting("freq", freq, f":FREQuency:CENT {freq} HZ")
         self.freq = freq
 
     def get_freq(self) -> float:
@@ -105,7 +158,7 @@ class RS_FSx(SCPIInstrument):  # noqa
             span: Span range in Hertz. Defaults to 2e6.
         """
         logger.info(f"Setting frequency span to {span} Hz")
-        self._write(f":FREQ:SPAN {span} HZ")
+        self._write_setting("span", span, f":FREQ:SPAN {span} HZ")
 
     def get_span(self) -> float:
         """Gets freq in Hz."""
@@ -121,25 +174,33 @@ class RS_FSx(SCPIInstrument):  # noqa
             rbw: Resolution bandwidth in Hertz. Defaults to 100e3.
         """
         logger.info(f"Setting RBW to {rbw} Hz")
-        self._write(f":BAND {rbw} HZ")
+        self._write_setting("rbw", rbw, f":BAND {rbw} HZ")
 
     def set_ref(self, ref: float = 0) -> None:
         """Sets the reference power level."""
         logger.info(f"Setting reference power level to {ref} dBm")
-        self._write(f":DISP:WIND:TRAC:Y:RLEV {ref} DBM")
+        self._write_setting("ref", ref, f":DISP:WIND:TRAC:Y:RLEV {ref} DBM")
 
     def set_vbw(self, vbw: float = 50) -> None:
         """Sets the VBW."""
         logger.info(f"Setting VBW to {vbw}")
-        self._write(f"SENS:BAND:VID {vbw}")
+        self._write_setting("vbw", vbw, f"SENS:BAND:VID {vbw}")
 
     @retry_on_failure
     def get_peak(self) -> Tuple[float, float]:
         """Gets the peak information (frequency and amplitude)."""
         logger.info("Retrieving peak information.")
-        self._write(":CALC1:MARK1:MAX:PEAK")
-        amplitude = self.get_y()
-        frequency = self.get_x()
+        if self.supports_batching:
+            amplitude, frequency = (
+                float(value)
+                for value in self._query_compound(
+                    ":CALC1:MARK1:MAX:PEAK;:CALC:MARK1:Y?;:CALC:MARK1:X?"
+                )
+            )
+        else:
+            self._write(":CALC1:MARK1:MAX:PEAK")
+            amplitude = self.get_y()
+            frequency = self.get_x()
         logger.debug(f"Peak found at Frequency: {frequency} Hz, Amplitude: {amplitude} dBm")
         return amplitude, frequency
 
@@ -147,7 +208,7 @@ class RS_FSx(SCPIInstrument):  # noqa
     def get_y(self) -> float:
         """Gets the amplitude (y value) of the marker."""
         logger.debug("Fetching amplitude of the marker.")
-        amplitude = self._query(":CALC:MARK1:Y?") if not self.simulate else "0"
+        amplitude: str = self._query(":CALC:MARK1:Y?")
         logger.debug(f"Marker amplitude: {amplitude} dBm")
         return float(amplitude)
 
@@ -155,14 +216,14 @@ class RS_FSx(SCPIInstrument):  # noqa
     def get_x(self) -> float:
         """Gets the frequency (x value) of the marker."""
         logger.debug("Fetching frequency of the marker.")
-        frequency = self._query(":CALC:MARK1:X?") if not self.simulate else "0"
+        frequency: str = self._query(":CALC:MARK1:X?")
         logger.debug(f"Marker frequency: {frequency} Hz")
         return float(frequency)
 
     def set_input_type(self, input_selection: InputSelection = INPUT_2) -> None:
         """Sets input type."""
         logger.info(f"Setting input type to {input_selection}")
-        self._write(f":INP:TYPE {input_selection}")
+        self._write_setting("input_type", str(input_selection), f":INP:TYPE {input_selection}")
 
     def get_channel_power(self) -> float:
         """Gets the channel power."""
@@ -170,11 +231,7 @@ class RS_FSx(SCPIInstrument):  # noqa
         self._write("SYSTem:SEQuencer ON")
         self._write("INITiate:SEQuencer:MODE SINGle")
         self._write("INITiate:SEQuencer:IMMediate;*OPC?")
-        power = (
-            self._query("CALCulate:MARKer:FUNCtion:POWer:RESult? CPOWer")
-            if not self.simulate
-            else "0"
-        )
+        power: str = self._query("CALCulate:MARKer:FUNCtion:POWer:RESult? CPOWer")
         logger.debug(f"Channel power: {power} dBm")
         return float(power)
 
@@ -183,20 +240,21 @@ class RS_FSx(SCPIInstrument):  # noqa
         logger.info(
             f"Setting up spectrum with center frequency: {center_freq} Hz, span: {span} Hz, markers: {markers}"
         )
-        self._write("INST:SEL SAN")
-        self._write(":INIT:CONT OFF")
-        self._write(f":SENS:FREQ:CENT {center_freq}")
-        self._write(f":SENS:FREQ:SPAN {span}")
-        self._write(":SENS:BAND:RES 1000000")
-        self._write(":SENS:BAND:VID 50000")
-        self._write(":DISP:WIND1:SUBW:TRAC1:Y:RLEV -30")
-        self._write(":DISP:WIND1:SUBW:TRAC1:Y:SCAL:AUTO ONCE")
-
-        for marker, freq in enumerate(markers):
-            logger.debug(f"Setting marker {marker+1} at frequency {freq} Hz")
-            self._write(f":CALC1:MARK{marker+1}:STAT ON")
-            self._write(f":CALC1:MARK{marker+1}:X {freq}")
-        self._write(":INIT:CONT ON")
+        with self.batch():
+            self._write("INST:SEL SAN")
+            self._write(":INIT:CONT OFF")
+            self._write(f":SENS:FREQ:CENT {center_freq}")
+            self._write(f":SENS:FREQ:SPAN {span}")
+            self._write(":SENS:BAND:RES 1000000")
+            self._write(":SENS:BAND:VID 50000")
+            self._write(":DISP:WIND1:SUBW:TRAC1:Y:RLEV -30")
+            self._write(":DISP:WIND1:SUBW:TRAC1:Y:SCAL:AUTO ONCE")
+
+            for marker, freq in enumerate(markers):
+                logger.debug(f"Setting marker {marker+1} at frequency {freq} Hz")
+                self._write(f":CALC1:MARK{marker+1}:STAT ON")
+                self._write(f":CALC1:MARK{marker+1}:X {freq}")
+            self._write(":INIT:CONT ON")
 
     def setup_acp(
         self, num_channels: int, channel_bw: int, channel_spacing: int, tab_name: str = "ACP"
@@ -209,17 +267,18 @@ class RS_FSx(SCPIInstrument):  # noqa
             channel_spacing: Channel spacing
             tab_name: Display name. Defaults to "ACP".
         """
-        self._write(f"INST:CRE:NEW SANALYZER, '{tab_name}'")
-        self._write(":INIT:CONT OFF")
-        self._write(":CALC1:MARK:FUNC:POW:SEL ACP")
-        self._write(f":SENS:POW:ACH:TXCH:COUN {num_channels}")
-        self._write(f":SENS:POW:ACH:TXCH:BWID:CHAN1 {int(channel_bw)}")
-        self._write(f":SENS:POW:ACH:TXCH:SPAC:CHAN1 {int(channel_spacing)}")
-        self._write(":SENS:BAND:RES 20000")
-        self._write(":SENS:BAND:VID 50000")
-        self._write(":DISP:WIND:SUBW:TRAC:Y:SPAC LOG")
-        self._write(":DISP:WIND:SUBW:TRAC:Y:SCAL 60")
-        self._write(":DISP:WIND:TRAC:Y:SCAL:RLEV -30")
+        with self.batch():
+            self._write(f"INST:CRE:NEW SANALYZER, '{tab_name}'")
+            self._write(":INIT:CONT OFF")
+            self._write(":CALC1:MARK:FUNC:POW:SEL ACP")
+            self._write(f":SENS:POW:ACH:TXCH:COUN {num_channels}")
+            self._write(f":SENS:POW:ACH:TXCH:BWID:CHAN1 {int(channel_bw)}")
+            self._write(f":SENS:POW:ACH:TXCH:SPAC:CHAN1 {int(channel_spacing)}")
+            self._write(":SENS:BAND:RES 20000")
+            self._write(":SENS:BAND:VID 50000")
+            self._write(":DISP:WIND:SUBW:TRAC:Y:SPAC LOG")
+            self._write(":DISP:WIND:SUBW:TRAC:Y:SCAL 60")
+            self._write(":DISP:WIND:TRAC:Y:SCAL:RLEV -30")
 
     def evm_setup_5gnr(self, frequency: float, waveform: str, tab_name: str = "5G NR") -> None:
         """Setup 5G NR mode with specific waveform file.
@@ -234,16 +293,17 @@ class RS_FSx(SCPIInstrument):  # noqa
         except Exception as e:
             logger.warning(f"Could not find tab '{tab_name}' dut to {str(e)}. Creating new tab.")
             self._write(f":INST:CRE:NEW NR5G, '{tab_name}'")
-        self._write(":INIT:CONT ON")
-        self._write(f":MMEM:LOAD:TMOD:CC1 '{waveform}'")
-        self._write(":CONF:NR5G:DL:CC1:IDC ON")
-        self._write(":SENS:NR5G:DEM:EFLR ON")
-        self._write(":SYST:DISP:UPD ON")
-        self._write(f":SENS:FREQ:CENT {frequency}")
-        self._write(":CONF:NR5G:DL:CC1:RFUC:STAT ON")
-        self._write(":CONF:NR5G:DL:CC1:RFUC:FZER:MODE MAN")
-        self._write(f":CONF:NR5G:DL:CC1:RFUC:FZER:FREQ {frequency} HZ")
-        self._write(":SENS:ADJ:EVM;*WAI")
+        with self.batch():
+            self._write(":INIT:CONT ON")
+            self._write(f":MMEM:LOAD:TMOD:CC1 '{waveform}'")
+            self._write(":CONF:NR5G:DL:CC1:IDC ON")
+            self._write(":SENS:NR5G:DEM:EFLR ON")
+            self._write(":SYST:DISP:UPD ON")
+            self._write(f":SENS:FREQ:CENT {frequency}")
+            self._write(":CONF:NR5G:DL:CC1:RFUC:STAT ON")
+            self._write(":CONF:NR5G:DL:CC1:RFUC:FZER:MODE MAN")
+            self._write(f":CONF:NR5G:DL:CC1:RFUC:FZER:FREQ {frequency} HZ")
+            self._write(":SENS:ADJ:EVM;*WAI")
         sleep(0.5)
         self._write(":INIT:CONT ON")
 
@@ -254,8 +314,9 @@ class RS_FSx(SCPIInstrument):  # noqa
         """
         self._write(":CONF:NR5G:DL:CC1:RFUC:STAT ON")
         sleep(0.1)
-        self._write(":CONF:NR5G:DL:CC1:RFUC:FZER:MODE MAN")
-        self._write(f":CONF:NR5G:DL:CC1:RFUC:FZER:FREQ {phase_comp_frequency} HZ")
+        with self.batch():
+            self._write(":CONF:NR5G:DL:CC1:RFUC:FZER:MODE MAN")
+            self._write(f":CONF:NR5G:DL:CC1:RFUC:FZER:FREQ {phase_comp_frequency} HZ")
 
     def get_evm(self) -> float:
         """Gets EVM.
@@ -263,11 +324,7 @@ class RS_FSx(SCPIInstrument):  # noqa
         :return: EVM value.
         """
         self._write(":INIT:IMM;*WAI")
-        if not self.simulate:
-            evm: Union[str, Any] = self._query("FETCh:CC1:ISRC:FRAM:SUMMary:EVM:DSTS:AVER?")
-        else:
-            evm = 0
-
+        evm: str = self._query("FETCh:CC1:ISRC:FRAM:SUMMary:EVM:DSTS:AVER?")
         return float(evm)
 
     def get_evm_power(self) -> float:
@@ -275,11 +332,7 @@ class RS_FSx(SCPIInstrument):  # noqa
 
         :return: EVM Power Value.
         """
-        if not self.simulate:
-            evm_power: Union[str, Any] = self._query("FETCh:CC1:ISRC:FRAM:SUMMary:Power:AVER?")
-        else:
-            evm_power = 0
-
+        evm_power: str = self._query("FETCh:CC1:ISRC:FRAM:SUMMary:Power:AVER?")
         return float(evm_power)
 
     def get_jitter_fswp(self, num: int) -> float:
@@ -302,12 +355,40 @@ class RS_FSx(SCPIInstrument):  # noqa
         noise: str = self._query(f"FETC:RANG{num}:PNO:IPN?")
         return float(noise)
 
+    def get_all_noise_fswp(
+        self, num_ranges: int, num_spots: int
+    ) -> tuple[list[float], list[float], list[float]]:
+        """Gets the jitter and integrated noise of several ranges and several spot noises at once.
+
+        Equivalent to calling get_jitter_fswp and get_int_noise_fswp for ranges 1 to num_ranges
+        and get_spot_noise_fswp for markers 1 to num_spots, but with a single query.
+
+        :param num_ranges: Number of integration ranges to read.
+        :param num_spots: Number of spot noise markers to read.
+
+        :return: Residual jitters (s), integrated noises (dBc) and spot noises (dBc/Hz).
+        """
+        ranges = range(1, num_ranges + 1)
+        values: list[float] = [
+            float(value)
+            for value in self._query_compound(
+                ";:".join(
+                    [f"FETC:RANG{num}:PNO:RMS?" for num in ranges]
+                    + [f"FETC:RANG{num}:PNO:IPN?" for num in ranges]
+                    + [f"CALC:SNO{num}:Y?" for num in range(1, num_spots + 1)]
+                )
+            )
+        ]
+        return values[:num_ranges], values[num_ranges : 2 * num_ranges], values[2 * num_ranges :]
+
     def get_freq_fswp(self) -> float:
         """Gets the center frequency value from the fswp.
 
+        Replies are reused for POLL_CACHE_TTL seconds unless a write is made in between.
+
         :return: Center Frequency (Hz)
         """
-        signal_frequency: str = self._query("FREQ:CENT?")
+        signal_frequency: str = self._query_cached("FREQ:CENT?", POLL_CACHE_TTL)
         return float(signal_frequency)
 
     def get_spot_noise_fswp(self, num: int) -> float:
@@ -323,9 +404,11 @@ class RS_FSx(SCPIInstrument):  # noqa
     def get_power_fswp(self) -> float:
         """Gets the measured signal level from the fswp.
 
+        Replies are reused for POLL_CACHE_TTL seconds unless a write is made in between.
+
         :return: Signal level (dBm)
         """
-        signal_level: str = self._query("POW:RLEV?")
+        signal_level: str = self._query_cached("POW:RLEV?", POLL_CACHE_TTL)
         return float(signal_level)
 
     def run_single_fswp(self) -> None:
@@ -368,9 +451,10 @@ class RS_FSx(SCPIInstrument):  # noqa
 
     def set_default_signal_source_config_fswp(self) -> None:
         """Turns on the input signal source to 122.88MHz @ 0dBm."""
-        self.set_signal_source_freq_fswp(freq=122.88)
-        self.set_signal_source_power_fswp(power_level=0)
-        self.toggle_signal_source_output_fswp(select=SelectionState(True))
+        with self.batch():
+            self.set_signal_source_freq_fswp(freq=122.88)
+            self.set_signal_source_power_fswp(power_level=0)
+            self.toggle_signal_source_output_fswp(select=SelectionState(True))
 
     def set_lo_spectrum_analyzer_config_fswp(
         self, with_x4: bool = True, reset_fswp: bool = True
@@ -388,16 +472,17 @@ class RS_FSx(SCPIInstrument):  # noqa
             freq_start = 4500000000
             freq_stop = 6500000000
 
-        if reset_fswp:
-            self._write("*RST")
-            self._write("*CLS")
-            self._write(":SYST:DISP:UPD ON")
-            self._write(":INIT:CONT OFF")
-        self._write(":INST:CRE:NEW SAN, 'SAN LO Synth Test'")
-        self._write(f":SENS:FREQ:STAR {freq_start}")
-        self._write(f":SENS:FREQ:STOP {freq_stop}")
-        self._write(":INP:ATT:AUTO OFF")
-        self._write(":INP:ATT 0")
+        with self.batch():
+            if reset_fswp:
+                self._write("*RST")
+                self._write("*CLS")
+                self._write(":SYST:DISP:UPD ON")
+                self._write(":INIT:CONT OFF")
+            self._write(":INST:CRE:NEW SAN, 'SAN LO Synth Test'")
+            self._write(f":SENS:FREQ:STAR {freq_start}")
+            self._write(f":SENS:FREQ:STOP {freq_stop}")
+            self._write(":INP:ATT:AUTO OFF")
+            self._write(":INP:ATT 0")
 
     def set_lo_phase_noise_config_fswp(
         self, with_x4: bool = True, reset_fswp: bool = False
@@ -415,42 +500,34 @@ class RS_FSx(SCPIInstrument):  # noqa
             freq_start = 4500000000
             freq_stop = 6500000000
 
-        if reset_fswp:
-            self._write("*RST")
-            self._write("*CLS")
-            self._write(":SYST:DISP:UPD ON")
+        with self.batch():
+            if reset_fswp:
+                self._write("*RST")
+                self._write("*CLS")
+                self._write(":SYST:DISP:UPD ON")
+                self._write(":INIT:CONT OFF")
+            self._write(":INST:CRE:NEW PNO, 'PNO LO Synth Test'")
             self._write(":INIT:CONT OFF")
-        self._write(":INST:CRE:NEW PNO, 'PNO LO Synth Test'")
-        self._write(":INIT:CONT OFF")
-        self._write(":INP:ATT:AUTO OFF")
-        self._write(":INP:ATT 0")
-        # self._write(":INP:ATT:AUTO ON") # FIXME Decide if attenuation should be automatic or manual
-        self._write(f":SENS:ADJ:CONF:FREQ:LIM:LOW {freq_start}")
-        self._write(f":SENS:ADJ:CONF:FREQ:LIM:HIGH {freq_stop}")
-        self._write(":SENS:ADJ:CONF:LEV:THR -35")
-        self._write(":SENS:SWE:CAPT:RANG WIDE")
-        self._write(":SENS:FREQ:STOP 1000000000")
-        self._write(":SENS:LIST:BWID:RES:USM ON")
-        self._write(":SENS:SWE:XFAC 100")
-        self._write(":SENS:SWE:COUN 1")
-        self._write(":CALC1:RANG1:EVAL:STAT OFF")
-        self._write(":CALC1:RANG2:EVAL:STAT OFF")
-        self._write(":CALC1:RANG3:EVAL:STAT OFF")
-        self._write(":CALC1:RANG2:EVAL:TRAC TRACE1")
-        self._write(":CALC1:RANG3:EVAL:TRAC TRACE1")
-        self._write(":CALC1:RANG1:EVAL:STAR 12000")
-        self._write(":CALC1:RANG2:EVAL:STAR 12000")
-        self._write(":CALC1:RANG3:EVAL:STAR 12000")
-        self._write(":CALC1:RANG1:EVAL:STOP 20000000")
-        self._write(":CALC1:RANG2:EVAL:STOP 200000000")
-        self._write(":CALC1:RANG3:EVAL:STOP 400000000")
-        self._write(":CALC:SNO:TRAC:DEC:STAT OFF")
-        self._write(":CALC1:SNO1:X 12000")
-        self._write(":CALC1:SNO2:X 100000")
-        self._write(":CALC1:SNO3:X 1000000")
-        self._write(":CALC1:SNO4:X 10000000")
-        self._write(":CALC1:SNO5:X 100000000")
-        self._write(":CALC1:SNO6:X 200000000")
+            self._write(":INP:ATT:AUTO OFF")
+            self._write(":INP:ATT 0")
+            # self._write(":INP:ATT:AUTO ON") # FIXME Decide if attenuation should be automatic or manual
+            self._write(f":SENS:ADJ:CONF:FREQ:LIM:LOW {freq_start}")
+            self._write(f":SENS:ADJ:CONF:FREQ:LIM:HIGH {freq_stop}")
+            self._write(":SENS:ADJ:CONF:LEV:THR -35")
+            self._write(":SENS:SWE:CAPT:RANG WIDE")
+            self._write(":SENS:FREQ:STOP 1000000000")
+            self._write(":SENS:LIST:BWID:RES:USM ON")
+            self._write(":SENS:SWE:XFAC 100")
+            self._write(":SENS:SWE:COUN 1")
+            for number, trace, start, stop in LO_PNO_EVAL_RANGES:
+                self._write(f":CALC1:RANG{number}:EVAL:STAT OFF")
+                if trace is not None:
+                    self._write(f":CALC1:RANG{number}:EVAL:TRAC {trace}")
+                self._write(f":CALC1:RANG{number}:EVAL:STAR {start}")
+                self._write(f":CALC1:RANG{number}:EVAL:STOP {stop}")
+            self._write(":CALC:SNO:TRAC:DEC:STAT OFF")
+            for number, offset in enumerate(LO_PNO_SPOT_OFFSETS, start=1):
+                self._write(f":CALC1:SNO{number}:X {offset}")
 
     def run_lo_startup(self, with_x4: bool = True, input_signal: bool = True) -> None:
         """Sets the Phase Noise Tab for LO Synth testing.
@@ -472,28 +549,56 @@ class RS_FSx(SCPIInstrument):  # noqa
         temp: str = self._query("SOUR:TEMP:FRON?")
         return float(temp)
 
-    def get_exact_peak(self, freq: float) -> tuple[float, float]:
+    def get_exact_peak(self, freq: float, use_opc: bool = True) -> tuple[float, float]:
         """Get the exact frequency up to 9 decimals points in GHz, & the amplitude. Uses a span of 1kHz.
 
         Args:
             freq: Rough input frequency in GHz. Input can be up to 0.5GHz off, since starting span is 1GHz.
+            use_opc: Wait for each zoom step with a single sweep and *OPC? instead of a fixed sleep.
+                The I/O timeout is raised to at least EXACT_PEAK_SWEEP_TIMEOUT meanwhile, and it
+                and the continuous sweep setting are restored afterwards. Set to False for firmware
+                that does not synchronize single sweeps. Defaults to True.
 
         Returns:
             Tuple of amplitude and frequency(up to 9 decimal point accuracy).
         """
-        self.set_freq(freq * 1e9)
-        self.set_span(1000000000)
-        sleep(0.3)
-        self.set_freq(self.get_peak()[1])
-        self.set_span(10000000)
-        sleep(0.3)
-        self.set_freq(self.get_peak()[1])
-        self.set_span(1000000)
-        sleep(0.3)
-        self.set_freq(self.get_peak()[1])
-        self.set_span(10000)
-        sleep(0.4)
-        self.set_freq(self.get_peak()[1])
-        self.set_span(1000)
-        sleep(1)
-        return self.get_peak()
+        use_opc = use_opc and not self.simulate
+        if use_opc:
+            continuous: str = self._query(":INIT:CONT?").strip()
+            timeout: float = self.get_timeout()
+            self._write(":INIT:CONT OFF")
+            self.set_timeout(max(timeout, EXACT_PEAK_SWEEP_TIMEOUT))
+
+        try:
+            self.set_freq(freq * 1e9)
+            self.set_span(1000000000)
+            self._wait_for_sweep(0.3, use_opc)
+            self.set_freq(self.get_peak()[1])
+            self.set_span(10000000)
+            self._wait_for_sweep(0.3, use_opc)
+            self.set_freq(self.get_peak()[1])
+            self.set_span(1000000)
+            self._wait_for_sweep(0.3, use_opc)
+            self.set_freq(self.get_peak()[1])
+            self.set_span(10000)
+            self._wait_for_sweep(0.4, use_opc)
+            self.set_freq(self.get_peak()[1])
+            self.set_span(1000)
+            self._wait_for_sweep(1, use_opc)
+            return self.get_peak()
+        finally:
+            if use_opc:
+                self.set_timeout(timeout)
+                self._write(f":INIT:CONT {continuous}")
+
+    def _wait_for_sweep(self, settle_time: float, use_opc: bool) -> None:
+        """Waits until a sweep with the current settings is available.
+
+        Args:
+            settle_time: Fixed time to sleep in seconds when use_opc is False.
+            use_opc: Run a single sweep and block on *OPC? until it has finished.
+        """
+        if use_opc:
+            self._query(":INIT:IMM;*OPC?")
+        else:
+            sleep(settle_time)
@@ -17,9 +17,11 @@ class RS_OSP(SCPIInstrument):
     and DUT/Antennas in a physical test environment.
     """
 
-    ACCEPTED_MODELS = [
-        "OSP320",
-    ]
+    ACCEPTED_MODELS = frozenset(
+        {
+            "OSP320",
+        }
+    )
 
     def __init__(
         self,